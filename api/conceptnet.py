@@ -0,0 +1,121 @@
+import threading
+import time
+from collections import deque
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+BASE_URL = "https://api.conceptnet.io/c/pt/"
+
+
+class CircuitBreaker:
+    """Corta as chamadas à API depois de falhas seguidas.
+
+    closed    -> chamadas normais
+    open      -> tudo vai direto para a votação offline até o fim do cooldown
+    half_open -> uma única chamada de teste decide se volta a fechar
+    """
+
+    def __init__(self, failure_threshold, cooldown):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trial_in_flight = False
+        self.lock = threading.Lock()
+
+    def allow(self):
+        with self.lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open":
+                if time.monotonic() - self.opened_at < self.cooldown:
+                    return False
+                self.state = "half_open"
+                self.trial_in_flight = False
+            # half_open: só deixa passar uma chamada de teste por vez
+            if self.trial_in_flight:
+                return False
+            self.trial_in_flight = True
+            return True
+
+    def record_success(self):
+        with self.lock:
+            if self.state != "closed":
+                print("ConceptNet respondeu de novo, validação online reativada.")
+            self.state = "closed"
+            self.failures = 0
+            self.trial_in_flight = False
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            self.trial_in_flight = False
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                if self.state != "open":
+                    print(f"ConceptNet indisponível, usando votação offline por {self.cooldown:.0f}s.")
+                self.state = "open"
+                self.opened_at = time.monotonic()
+
+
+class ConceptNetClient:
+    """Consulta a ConceptNet com uma sessão keep-alive compartilhada."""
+
+    def __init__(self, timeout=5, retries=1, pool_size=4,
+                 failure_threshold=3, cooldown=30):
+        self.timeout = timeout
+        self.session = requests.Session()
+        retry = Retry(
+            total=retries,
+            backoff_factor=0.2,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=pool_size, max_retries=retry
+        )
+        self.session.mount("https://", adapter)
+
+        self.breaker = CircuitBreaker(failure_threshold, cooldown)
+        self.latencies = deque(maxlen=100)  # segundos, últimas requisições
+        self.requests_made = 0
+
+    def available(self):
+        return self.breaker.allow()
+
+    def fetch(self, word: str) -> bool | None:
+        """Mesmo contrato de validate_word: True, False (404) ou None."""
+        start = time.perf_counter()
+        try:
+            response = self.session.get(BASE_URL + word, timeout=self.timeout)
+            if response.status_code == 200:
+                result = bool(response.json())
+            elif response.status_code == 404:
+                result = False
+            else:
+                result = None
+        except Exception:
+            result = None
+        finally:
+            self.latencies.append(time.perf_counter() - start)
+            self.requests_made += 1
+
+        if result is None:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+        return result
+
+    def stats(self):
+        latencies = sorted(self.latencies)
+        return {
+            "breaker": self.breaker.state,
+            "failures": self.breaker.failures,
+            "requests": self.requests_made,
+            "last_latency_ms": self.latencies[-1] * 1000 if self.latencies else None,
+            "p50_latency_ms": latencies[len(latencies) // 2] * 1000 if latencies else None,
+            "p95_latency_ms": latencies[int(len(latencies) * 0.95)] * 1000 if latencies else None,
+        }
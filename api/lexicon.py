@@ -0,0 +1,154 @@
+"""Léxico offline de palavras em português.
+
+A lista de palavras é compilada uma única vez num arquivo binário compacto:
+
+    cabeçalho  "RDLX" | versão (u16) | reservado (u16) | quantidade N (u32)
+    índice     N + 1 offsets (u32), relativos ao início dos dados
+    dados      palavras em UTF-8 (NFC, minúsculas), ordenadas e concatenadas
+
+O arquivo é aberto com mmap e consultado por busca binária direto nos
+bytes mapeados, sem carregar a lista em objetos Python.
+
+Para compilar:
+
+    python -m api.lexicon palavras.txt assets/lexicon.bin
+"""
+import mmap
+import os
+import struct
+import sys
+import unicodedata
+
+MAGIC = b"RDLX"
+VERSION = 1
+HEADER = struct.Struct("<4sHHI")
+OFFSET = struct.Struct("<I")
+
+
+def normalize(word):
+    return unicodedata.normalize("NFC", word.strip().lower())
+
+
+class Lexicon:
+    def __init__(self, path, mm=None, base=0, size=None):
+        """Abre path, ou usa um mmap já aberto (ex.: o arquivo de assets) com o léxico em base.
+
+        size: bytes do léxico a partir de base (padrão: até o fim do mmap).
+        """
+        self.path = path
+        self.owns_mm = mm is None
+        if mm is None:
+            with open(path, "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.mm = mm
+        end = len(mm) if size is None else min(len(mm), base + size)
+
+        if end - base < HEADER.size:
+            self.close()
+            raise ValueError(f"Arquivo de léxico truncado: {path}")
+        magic, version, _, self.count = HEADER.unpack_from(self.mm, base)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Arquivo de léxico inválido: {path}")
+
+        self.index_start = base + HEADER.size
+        self.data_start = self.index_start + OFFSET.size * (self.count + 1)
+        # Quantidade ou último offset corrompidos apontariam para fora do arquivo na primeira busca
+        if self.data_start > end:
+            self.close()
+            raise ValueError(f"Arquivo de léxico truncado: {path}")
+        (data_size,) = OFFSET.unpack_from(self.mm, self.data_start - OFFSET.size)
+        if self.data_start + data_size > end:
+            self.close()
+            raise ValueError(f"Arquivo de léxico truncado: {path}")
+
+    @classmethod
+    def open(cls, path):
+        """Abre o léxico se o arquivo existir; senão retorna None."""
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            return cls(path)
+        except (OSError, ValueError, struct.error) as e:
+            print(f"Léxico offline indisponível: {e}")
+            return None
+
+    def _word_at(self, i):
+        start, end = struct.unpack_from("<II", self.mm, self.index_start + OFFSET.size * i)
+        return self.mm[self.data_start + start:self.data_start + end]
+
+    def __contains__(self, word):
+        key = normalize(word).encode("utf-8")
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            current = self._word_at(mid)
+            if current < key:
+                lo = mid + 1
+            elif current > key:
+                hi = mid
+            else:
+                return True
+        return False
+
+    def _bisect(self, key):
+        """Primeiro índice cuja palavra é >= key."""
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._word_at(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def prefix_range(self, prefix):
+        """Intervalo [início, fim) dos índices das palavras que começam com prefix."""
+        key = normalize(prefix).encode("utf-8")
+        # 0xFF nunca aparece em UTF-8: key + 0xFF vem depois de tudo que começa com key
+        return self._bisect(key), self._bisect(key + b"\xff")
+
+    def word(self, i):
+        return self._word_at(i).decode("utf-8")
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        if self.owns_mm:
+            self.mm.close()
+
+
+def compile_lexicon(words, path):
+    """Grava as palavras (iterável de str) no formato binário do léxico."""
+    encoded = sorted({normalize(w).encode("utf-8") for w in words if w.strip()})
+
+    offsets = [0]
+    for word in encoded:
+        offsets.append(offsets[-1] + len(word))
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, len(encoded)))
+        f.write(struct.pack(f"<{len(offsets)}I", *offsets))
+        for word in encoded:
+            f.write(word)
+    os.replace(tmp_path, path)
+    return len(encoded)
+
+
+def read_word_list(path):
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                yield line
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Uso: python -m api.lexicon <lista.txt> <saida.bin>")
+        sys.exit(1)
+
+    total = compile_lexicon(read_word_list(sys.argv[1]), sys.argv[2])
+    print(f"{total} palavras gravadas em {sys.argv[2]}")
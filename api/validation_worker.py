@@ -0,0 +1,47 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from api.word_validation import validate_word
+
+
+class ValidationWorker:
+    """Valida palavras em segundo plano, fora do loop de renderização.
+
+    Cada pedido devolve um Future. Pedidos repetidos para a mesma palavra
+    enquanto a primeira consulta ainda está em andamento recebem o mesmo
+    Future, então a API é chamada uma única vez.
+    """
+
+    def __init__(self, validate_fn=validate_word, max_workers=2):
+        self.validate_fn = validate_fn
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="validacao"
+        )
+        self.in_flight = {}  # palavra -> Future em andamento
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def normalize(word):
+        return word.strip().lower()
+
+    def submit(self, word):
+        key = self.normalize(word)
+        with self.lock:
+            future = self.in_flight.get(key)
+            if future is not None:
+                return future
+
+            future = self.executor.submit(self.validate_fn, key)
+            self.in_flight[key] = future
+
+        # Remove do mapa assim que terminar (ou for cancelado)
+        future.add_done_callback(lambda f, key=key: self._forget(key, f))
+        return future
+
+    def _forget(self, key, future):
+        with self.lock:
+            if self.in_flight.get(key) is future:
+                del self.in_flight[key]
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
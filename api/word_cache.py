@@ -0,0 +1,152 @@
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+# Marcadores gravados no disco para cada resultado possível de validate_word
+_ENCODE = {True: 1, False: 0, None: -1}
+_DECODE = {1: True, 0: False, -1: None}
+
+
+class WordCache:
+    """Cache em dois níveis para o resultado de validate_word.
+
+    Nível 1: LRU em memória, válido durante a sessão.
+    Nível 2: SQLite em disco, sobrevive a reinícios do jogo.
+
+    Cada tipo de resultado tem seu próprio TTL: palavra existente (True),
+    inexistente/404 (False) e desconhecido (None, falha de rede).
+
+    A limpeza do disco (expirados e excesso sobre disk_size) roda ao abrir
+    e a cada evict_every gravações, não em toda gravação: entre uma e outra
+    o banco pode passar de disk_size em até evict_every entradas.
+    """
+
+    def __init__(self, path, ttl_valid, ttl_invalid, ttl_unknown,
+                 memory_size=1024, disk_size=50000, evict_every=100):
+        self.path = path
+        self.ttls = {True: ttl_valid, False: ttl_invalid, None: ttl_unknown}
+        self.memory_size = memory_size
+        self.disk_size = disk_size
+        self.evict_every = evict_every
+        self.writes = 0  # gravações desde a última limpeza do disco
+
+        self.memory = OrderedDict()  # palavra -> (resultado, expira_em)
+        self.lock = threading.Lock()
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self.db = None
+        if path:
+            try:
+                os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                self.db = sqlite3.connect(path, check_same_thread=False)
+                self.db.execute(
+                    "CREATE TABLE IF NOT EXISTS words ("
+                    "word TEXT PRIMARY KEY, result INTEGER NOT NULL, "
+                    "expires_at REAL NOT NULL, checked_at REAL NOT NULL)"
+                )
+                self.db.execute(
+                    "CREATE INDEX IF NOT EXISTS words_checked_at ON words (checked_at)"
+                )
+                self.db.execute(
+                    "CREATE INDEX IF NOT EXISTS words_expires_at ON words (expires_at)"
+                )
+                self._evict_disk(time.time())
+                self.db.commit()
+            except sqlite3.Error as e:
+                print(f"Cache de palavras em disco indisponível: {e}")
+                self.db = None
+
+    def get(self, word):
+        """Retorna (encontrado, resultado)."""
+        now = time.time()
+        with self.lock:
+            entry = self.memory.get(word)
+            if entry is not None:
+                result, expires_at = entry
+                if expires_at > now:
+                    self.memory.move_to_end(word)
+                    self.memory_hits += 1
+                    return True, result
+                del self.memory[word]
+
+            if self.db is not None:
+                try:
+                    row = self.db.execute(
+                        "SELECT result, expires_at FROM words WHERE word = ?", (word,)
+                    ).fetchone()
+                except sqlite3.Error as e:
+                    # Banco travado por outro processo, erro de disco...: conta como miss
+                    print(f"Falha ao ler cache de palavras: {e}")
+                    row = None
+                if row is not None and row[1] > now:
+                    result = _DECODE[row[0]]
+                    self._remember(word, result, row[1])
+                    self.disk_hits += 1
+                    return True, result
+
+            self.misses += 1
+            return False, None
+
+    def put(self, word, result):
+        now = time.time()
+        ttl = self.ttls[result]
+        if ttl <= 0:
+            return
+        expires_at = now + ttl
+
+        with self.lock:
+            self._remember(word, result, expires_at)
+
+            if self.db is not None:
+                try:
+                    self.db.execute(
+                        "INSERT OR REPLACE INTO words (word, result, expires_at, checked_at) "
+                        "VALUES (?, ?, ?, ?)",
+                        (word, _ENCODE[result], expires_at, now),
+                    )
+                    self.writes += 1
+                    if self.writes >= self.evict_every:
+                        self._evict_disk(now)
+                    self.db.commit()
+                except sqlite3.Error as e:
+                    print(f"Falha ao gravar cache de palavras: {e}")
+
+    def _remember(self, word, result, expires_at):
+        self.memory[word] = (result, expires_at)
+        self.memory.move_to_end(word)
+        while len(self.memory) > self.memory_size:
+            self.memory.popitem(last=False)
+
+    def _evict_disk(self, now):
+        # Primeiro descarta o que já expirou, depois os mais antigos até caber
+        self.writes = 0
+        self.db.execute("DELETE FROM words WHERE expires_at <= ?", (now,))
+        (count,) = self.db.execute("SELECT COUNT(*) FROM words").fetchone()
+        excess = count - self.disk_size
+        if excess > 0:
+            self.db.execute(
+                "DELETE FROM words WHERE word IN "
+                "(SELECT word FROM words ORDER BY checked_at LIMIT ?)",
+                (excess,),
+            )
+
+    def stats(self):
+        hits = self.memory_hits + self.disk_hits
+        total = hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": hits / total if total else 0.0,
+        }
+
+    def close(self):
+        with self.lock:
+            if self.db is not None:
+                self.db.close()
+                self.db = None
@@ -1,16 +1,71 @@
+import struct
 import unicodedata
-import requests
 
-def validate_word(word: str) -> bool | None:
-    try:
-        url = f"https://api.conceptnet.io/c/pt/{word.lower()}"
-        response = requests.get(url, timeout=5)
-        if response.status_code == 200:
-            data = response.json()
-            return bool(data)
-        elif response.status_code == 404:
-            return False
-        else:
-            return None
-    except Exception:
+import config
+from api.conceptnet import ConceptNetClient
+from api.lexicon import Lexicon
+from api.word_cache import WordCache
+
+
+def open_lexicon():
+    lexicon = Lexicon.open(config.LEXICON_PATH)
+    if lexicon is None:
+        # No executável o léxico vai dentro do arquivo de assets, lido no mesmo mmap
+        from ui.archive import asset_archive
+        archive = asset_archive()
+        if archive is not None and config.LEXICON_RESOURCE in archive:
+            offset, size = archive.locate(config.LEXICON_RESOURCE)
+            try:
+                lexicon = Lexicon(archive.path, mm=archive.mm, base=offset, size=size)
+            except (ValueError, struct.error) as e:
+                print(f"Léxico offline indisponível: {e}")
+    return lexicon
+
+
+lexicon = open_lexicon()
+
+word_cache = WordCache(
+    config.WORD_CACHE_PATH,
+    ttl_valid=config.WORD_CACHE_TTL_VALID,
+    ttl_invalid=config.WORD_CACHE_TTL_INVALID,
+    ttl_unknown=config.WORD_CACHE_TTL_UNKNOWN,
+    memory_size=config.WORD_CACHE_MEMORY_SIZE,
+    disk_size=config.WORD_CACHE_DISK_SIZE,
+)
+
+conceptnet = ConceptNetClient(
+    timeout=config.CONCEPTNET_TIMEOUT,
+    retries=config.CONCEPTNET_RETRIES,
+    pool_size=config.CONCEPTNET_POOL_SIZE,
+    failure_threshold=config.CONCEPTNET_FAILURE_THRESHOLD,
+    cooldown=config.CONCEPTNET_COOLDOWN,
+)
+
+
+def validate_offline(word):
+    """Só léxico e cache. Retorna (encontrado, resultado)."""
+    word = word.lower()
+    if lexicon is not None and word in lexicon:
+        return True, True
+    return word_cache.get(word)
+
+
+def validate_online(word):
+    """Consulta a ConceptNet (e grava no cache); None se o circuito estiver aberto."""
+    word = word.lower()
+
+    # Circuito aberto: vai direto para a votação offline, sem gravar no cache
+    if not conceptnet.available():
         return None
+
+    result = conceptnet.fetch(word)
+    word_cache.put(word, result)
+    return result
+
+
+def validate_word(word: str) -> bool | None:
+    # Léxico offline e cache primeiro; a API só é consultada se não estiver em nenhum
+    found, result = validate_offline(word)
+    if found:
+        return result
+    return validate_online(word)
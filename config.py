@@ -1,18 +1,65 @@
 import os
-import os
 import sys
 
 def resource_path(relative_path):
-    """Usado para localizar arquivos corretamente, mesmo no PyInstaller."""
+    """Usado para localizar arquivos corretamente, mesmo no PyInstaller.
+
+    Para ler um asset use ui.archive.open_resource, que procura primeiro no
+    arquivo empacotado (ASSET_ARCHIVE_PATH) e só depois no disco.
+    """
     try:
         base_path = sys._MEIPASS
     except AttributeError:
         base_path = os.path.abspath(".")
     return os.path.join(base_path, relative_path)
 
+# Assets empacotados (python -m ui.archive assets assets.pak). No executável
+# fica ao lado do .exe, fora do pacote, e é lido com mmap sem extrair nada.
+if getattr(sys, "frozen", False):
+    ASSET_ARCHIVE_PATH = os.path.join(os.path.dirname(sys.executable), "assets.pak")
+else:
+    ASSET_ARCHIVE_PATH = resource_path("assets.pak")
+
+# Tamanho do canvas lógico: todas as coordenadas do jogo são nessa escala
 SCREEN_WIDTH = 1000
 SCREEN_HEIGHT = 700
-FPS = 60  # Frames por segundo
+# A janela pode ter qualquer tamanho; o canvas é escalado para caber nela
+WINDOW_SIZE = None  # tamanho inicial da janela; None = o do canvas (ex.: (1920, 1080) num projetor)
+WINDOW_RESIZABLE = True
+FULLSCREEN = False  # F11 alterna durante o jogo
+FPS = 60  # Frames por segundo (limite enquanto algo está animando; 0 = sem limite)
+IDLE_WAIT_MS = 500  # telas paradas esperam eventos por até esse tempo
+
+# Animações (em segundos, pelo relógio: iguais a 30, 60 ou 144 FPS)
+ERROR_FADE_SECONDS = 0.7  # mensagem de erro: ida (ou volta) do pisca
+ROULETTE_SPIN_SECONDS = 1.2  # roleta girando até a letra escolhida
+ROULETTE_SPIN_LAPS = 2  # voltas completas antes de parar
+LETTER_POP_SECONDS = 0.5  # letra sorteada crescendo no centro
+
+# Áudio: buffer menor = menos atraso até o som sair (e mais risco de estalos)
+AUDIO_FREQUENCY = 44100
+AUDIO_BUFFER = 512  # amostras (~12 ms a 44,1 kHz)
+AUDIO_CHANNELS = 8  # sons curtos tocando ao mesmo tempo
+
+# Tempos de carregamento de cada asset, uma linha JSON por partida (cold start)
+ASSET_TIMINGS_PATH = None  # ex.: "assets_timings.jsonl"
+
+# Profiler de frames (F3 liga/desliga o painel)
+PROFILE_OVERLAY = False  # painel visível ao iniciar
+PROFILE_LONG_FRAME_MS = 25  # frames acima disso são marcados como longos
+PROFILE_TRACE_PATH = None  # ex.: "frames.csv" ou "frames.jsonl"
+
+# Votação em paralelo: cada jogador vota no seu próprio dispositivo. S/N e os
+# botões na tela continuam valendo para o próximo jogador que ainda não votou.
+VOTE_KEYS = [("q", "a"), ("r", "f"), ("u", "j"), ("up", "down")]  # (sim, não) do jogador 1..4
+VOTE_JOYSTICK_YES = 0  # botão A do controle
+VOTE_JOYSTICK_NO = 1  # botão B do controle
+VOTE_BRIDGE_HOST = "0.0.0.0"
+VOTE_BRIDGE_PORT = None  # ex.: 8080 para votar pelo celular em http://<ip>:8080/j/<código na tela>
+
+# Gravação da sessão (eventos, leituras do relógio e validações) para replay
+# com "python -m engine.replay arquivo". None = não grava.
+RECORD_SESSION_PATH = None  # ex.: "sessao.rdr"
 
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -25,8 +72,38 @@ LIGHT_GRAY = (180, 180, 180)
 
 DEFAULT_FONT = "arial"
 FONT_SIZE = 32
+PRELOAD_FONTS = True  # carrega todas as fontes antes do primeiro frame
+TEXT_CACHE_SIZE = 512  # superfícies de texto guardadas no cache LRU
+
+# Léxico offline (gerado com: python -m api.lexicon palavras.txt assets/lexicon.bin)
+# Sem o arquivo, o léxico é procurado em ASSET_ARCHIVE_PATH como LEXICON_RESOURCE
+LEXICON_PATH = resource_path(os.path.join("assets", "lexicon.bin"))
+LEXICON_RESOURCE = "assets/lexicon.bin"
+
+# ConceptNet: sessão keep-alive e circuit breaker
+CONCEPTNET_TIMEOUT = 5  # segundos por requisição
+CONCEPTNET_RETRIES = 1  # novas tentativas em erro de conexão/5xx
+CONCEPTNET_POOL_SIZE = 4
+CONCEPTNET_FAILURE_THRESHOLD = 3  # falhas seguidas para abrir o circuito
+CONCEPTNET_COOLDOWN = 30  # segundos indo direto para a votação offline
+
+# Pré-validação especulativa enquanto o jogador digita (opcional)
+SPECULATIVE_VALIDATION = False
+SPECULATIVE_DEBOUNCE_MS = 400  # pausa na digitação antes de consultar
+
+# Cache das validações de palavras (memória + disco)
+WORD_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".roda_das_letras", "word_cache.sqlite3")
+WORD_CACHE_TTL_VALID = 60 * 60 * 24 * 90  # palavra existente: 90 dias
+WORD_CACHE_TTL_INVALID = 60 * 60 * 24 * 7  # 404: 7 dias
+WORD_CACHE_TTL_UNKNOWN = 60  # falha de rede: tenta de novo em 1 minuto
+WORD_CACHE_MEMORY_SIZE = 1024  # entradas no LRU da sessão
+WORD_CACHE_DISK_SIZE = 50000  # entradas no SQLite
+
+# Partida salva a cada mudança de estado; apagada ao fechar a janela. Se o jogo
+# cair, main.py retoma dela na próxima abertura (kiosk)
+AUTOSAVE_PATH = os.path.join(os.path.expanduser("~"), ".roda_das_letras", "autosave.rdsv")  # None = desliga
 
-TIMER_SECONDS = 40
+TIMER_SECONDS = 40  # tempo da vez (GameCore.turn_seconds; padrão do tools.simulate)
 TIMER_WARNING_THRESHOLD = 10  # segundos restantes para tocar alerta de tempo
 
 MAX_PLAYERS = 4
@@ -0,0 +1,380 @@
+"""Regras do jogo, sem pygame.
+
+GameCore guarda o estado da partida (jogadores, placar, letras usadas,
+vez, contagem regressiva e votação) e só muda por ações explícitas. O
+relógio é injetado, então a mesma partida pode rodar na janela, num
+servidor ou num simulador, milhares de vezes por segundo.
+
+Os prazos (fim da revelação, alerta e fim da vez) são timers agendados
+em self.timers; tick() dispara os que venceram. Quem tem o próprio event
+loop pode perguntar timers.next_deadline() e acordar só nesse instante.
+
+O que a interface precisa fazer em resposta (tocar um som, validar uma
+palavra, mostrar um erro) vai para a fila self.effects como (tipo, dado):
+
+    error            mensagem para o jogador
+    log              mensagem para o console
+    letter_selected  letra sorteada
+    warning          poucos segundos restantes
+    validate         palavra a validar; a resposta volta por validation_result
+    voting_started   palavra em votação
+    word_approved    palavra aprovada; o jogador continua
+    turn_ended       índice do próximo jogador
+
+Quem não usa os efeitos deve esvaziar a fila (drain_effects).
+
+Atributos em __slots__ e letras usadas num bitmask de 26 bits: um
+GameCore ocupa pouca memória (o servidor segura muitas salas) e vira um
+snapshot binário pequeno (engine.snapshot).
+"""
+import time
+from collections import deque
+
+from api.validation_string import validation_name
+from engine.timers import TimerScheduler
+
+ALPHABET = tuple("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+
+TURN_SECONDS = 40  # tempo para responder depois de escolher a letra
+WARNING_SECONDS = 5  # alerta de tempo
+REVEAL_SECONDS = 4  # letra sorteada na tela antes de liberar a resposta
+POINTS = 10  # ganho (ou perda) por palavra
+APPROVAL_RATIO = 0.5  # fração de votos "sim" que precisa ser superada
+MIN_PLAYERS = 2
+MAX_PLAYERS = 4
+CHARACTER_COUNT = 4
+
+
+def letter_bit(letter):
+    """Bit da letra no bitmask de letras usadas (A = bit 0 ... Z = bit 25)."""
+    return 1 << (ord(letter) - ord("A"))
+
+
+class Player:
+    __slots__ = ("name", "character")
+
+    def __init__(self, name, character=None):
+        self.name = name
+        self.character = character  # índice do personagem ou None
+
+    def __repr__(self):
+        return f"Player({self.name!r}, {self.character!r})"
+
+
+class GameCore:
+    __slots__ = (
+        "clock", "timers", "turn_seconds", "warning_seconds", "reveal_seconds", "points", "approval_ratio",
+        "effects", "state", "max_players", "players", "scores", "current_input", "current_theme",
+        "used_mask", "current_player_turn", "letter_chosen", "current_letter", "answer",
+        "reveal_start_time", "timer_start", "warning_played", "reveal_timer", "warning_timer", "turn_timer",
+        "voting_word", "votes", "ballots", "vote_required", "current_voter", "vote_start_time",
+    )
+
+    ACTIONS = (
+        "set_player_count", "add_player", "choose_character", "choose_theme",
+        "select_letter", "submit_answer", "validation_result", "vote", "tick",
+    )
+
+    def __init__(self, clock=time.monotonic, turn_seconds=TURN_SECONDS, warning_seconds=WARNING_SECONDS,
+                 reveal_seconds=REVEAL_SECONDS, points=POINTS, approval_ratio=APPROVAL_RATIO, timers=None):
+        self.clock = clock
+        # Pode ser compartilhado com a interface (um heap só para o jogo todo)
+        self.timers = timers if timers is not None else TimerScheduler(clock)
+        self.turn_seconds = turn_seconds
+        self.warning_seconds = warning_seconds
+        self.reveal_seconds = reveal_seconds
+        self.points = points
+        self.approval_ratio = approval_ratio
+        self.effects = deque()
+
+        self.state = "select_player_count"
+        self.max_players = MAX_PLAYERS
+        self.players = []  # Player
+        self.scores = [0] * self.max_players
+        self.current_input = 0  # jogador sendo cadastrado (nome/personagem)
+        self.current_theme = None
+
+        self.used_mask = 0  # bit i = ALPHABET[i] já sorteada
+        self.current_player_turn = 0
+        self.letter_chosen = None
+        self.current_letter = None
+        self.answer = None  # palavra enviada na vez atual
+        self.reveal_start_time = None
+        self.timer_start = None
+        self.warning_played = False
+        self.reveal_timer = None
+        self.warning_timer = None
+        self.turn_timer = None
+
+        self.voting_word = None
+        self.votes = []  # True=sim, False=não, na ordem em que chegaram
+        self.ballots = {}  # assento -> voto; cada jogador vota uma vez, em qualquer ordem
+        self.vote_required = 0
+        self.current_voter = 0
+        self.vote_start_time = None
+
+    def dispatch(self, action, *args):
+        """Executa uma ação pelo nome (para servidor, replay e simulador)."""
+        if action not in self.ACTIONS:
+            raise ValueError(f"Ação desconhecida: {action}")
+        return getattr(self, action)(*args)
+
+    def emit(self, kind, payload=None):
+        self.effects.append((kind, payload))
+
+    def drain_effects(self):
+        effects = list(self.effects)
+        self.effects.clear()
+        return effects
+
+    # --- Ações (retornam False quando não se aplicam ao estado atual) ---
+
+    def set_player_count(self, count):
+        if self.state != "select_player_count" or not MIN_PLAYERS <= count <= MAX_PLAYERS:
+            return False
+        self.max_players = count
+        self.scores = [0] * count
+        self.state = "get_names"
+        return True
+
+    def add_player(self, name):
+        if self.state != "get_names":
+            return False
+        name = name.strip()
+        if not validation_name(name):
+            self.emit("error", "Nome inválido! Use letras e acentos, sem símbolos proibidos.")
+            return False
+
+        self.players.append(Player(name))
+        self.current_input += 1
+        if self.current_input == self.max_players:
+            self.current_input = 0
+            self.state = "choose_character"
+        return True
+
+    def choose_character(self, index):
+        if self.state != "choose_character" or not 0 <= index < CHARACTER_COUNT:
+            return False
+        self.players[self.current_input].character = index
+        self.current_input += 1
+        if self.current_input == self.max_players:
+            self.current_player_turn = 0
+            self.reset_turn()
+            self.state = "select_theme"
+        return True
+
+    def choose_theme(self, theme):
+        if self.state != "select_theme":
+            return False
+        theme = theme.strip()
+        if not validation_name(theme):
+            self.emit("error", "Tema inválido! Use letras, acentos, espaços e hífen.")
+            return False
+        self.current_theme = theme
+        self.reset_turn()
+        self.state = "roulette"
+        return True
+
+    def select_letter(self, letter):
+        letter = letter.upper()
+        if self.state != "roulette" or self.letter_chosen or letter not in ALPHABET:
+            return False
+        if self.is_used(letter):
+            return False
+
+        self.letter_chosen = letter
+        self.used_mask |= letter_bit(letter)
+        self.current_letter = letter
+        self.answer = None
+        self.reveal_start_time = self.clock()
+        self.timer_start = self.reveal_start_time
+        self.warning_played = False
+        self.reveal_timer = self.timers.call_later(self.reveal_seconds, self.end_reveal)
+        self.state = "letter_reveal"
+        self.emit("letter_selected", letter)
+        return True
+
+    def submit_answer(self, word):
+        word = word.strip().lower()
+        if self.state != "answer_input" or not word:
+            return False
+        self.answer = word
+        self.state = "validating"
+        self.emit("validate", word)
+        return True
+
+    def validation_result(self, is_valid):
+        """Resposta da validação pedida pelo efeito "validate" (True, False ou None)."""
+        if self.state != "validating":
+            return False
+
+        if is_valid is False:
+            # Não existe no dicionário: o jogador tenta outra enquanto houver tempo
+            self.emit("log", "Palavra inválida!")
+            self.state = "answer_input"
+            return True
+
+        if is_valid is None:
+            self.emit("log", "Não foi possível validar. Iniciando votação offline...")
+        # Palavra existe (ou não deu para saber): os outros jogadores votam o tema
+        self.cancel_timers()
+        self.timer_start = None
+        self.start_voting(self.answer)
+        return True
+
+    def vote(self, approve, seat=None):
+        """Voto de um jogador. Sem seat, vale para o próximo que ainda não votou."""
+        if self.state != "voting":
+            return False
+        if seat is None:
+            seat = self.current_voter_index()
+        if seat not in self.pending_voters():
+            return False
+
+        self.ballots[seat] = bool(approve)
+        self.votes.append(bool(approve))
+        self.current_voter += 1
+
+        # Encerra assim que a maioria estiver garantida, sem esperar os outros votos
+        approved = self.vote_outcome()
+        if approved is not None:
+            self.finish_voting(approved)
+        return True
+
+    def tick(self):
+        """Dispara os timers vencidos (sem nenhum vencido, não faz nada)."""
+        self.timers.run_due()
+
+    def pause(self):
+        """Congela a revelação e a contagem regressiva."""
+        self.timers.pause()
+
+    def resume(self):
+        self.timers.resume()
+
+    def is_used(self, letter):
+        return bool(self.used_mask & letter_bit(letter))
+
+    @property
+    def used_letters(self):
+        """Letras já sorteadas, em ordem alfabética."""
+        return [letter for i, letter in enumerate(ALPHABET) if self.used_mask >> i & 1]
+
+    @property
+    def used_count(self):
+        return bin(self.used_mask).count("1")
+
+    @property
+    def remaining_time(self):
+        if self.turn_timer is None:
+            return self.turn_seconds
+        return self.timers.remaining(self.turn_timer)
+
+    # --- Regras internas ---
+
+    def end_reveal(self):
+        # A vez conta a partir do fim exato da revelação, não do frame que percebeu
+        self.timer_start = self.reveal_timer.deadline
+        self.reveal_timer = None
+        self.state = "answer_input"
+        self.schedule_turn(self.timer_start + self.turn_seconds)
+
+    def schedule_turn(self, deadline):
+        if not self.warning_played:
+            self.warning_timer = self.timers.call_at(deadline - self.warning_seconds, self.warn)
+        self.turn_timer = self.timers.call_at(deadline, self.time_up)
+
+    def restore_deadlines(self, reveal_remaining, turn_remaining):
+        """Reagenda, a partir de agora, os prazos de uma partida restaurada de um snapshot."""
+        self.cancel_timers()
+        now = self.timers.now()
+        if reveal_remaining is not None:
+            self.reveal_start_time = now + reveal_remaining - self.reveal_seconds
+            self.timer_start = self.reveal_start_time
+            self.reveal_timer = self.timers.call_later(reveal_remaining, self.end_reveal)
+        elif turn_remaining is not None:
+            self.timer_start = now + turn_remaining - self.turn_seconds
+            self.schedule_turn(now + turn_remaining)
+
+    def warn(self):
+        self.warning_timer = None
+        self.warning_played = True
+        self.emit("warning", self.remaining_time)
+
+    def time_up(self):
+        self.turn_timer = None
+        self.next_turn()
+
+    def cancel_timers(self):
+        for timer in (self.reveal_timer, self.warning_timer, self.turn_timer):
+            self.timers.cancel(timer)
+        self.reveal_timer = self.warning_timer = self.turn_timer = None
+
+    def start_voting(self, word):
+        self.voting_word = word
+        self.votes = []
+        self.ballots = {}
+        self.vote_required = self.max_players - 1  # os outros jogadores votam
+        self.current_voter = 0
+        self.vote_start_time = self.clock()
+        self.state = "voting"
+        self.emit("voting_started", word)
+
+    def voters(self):
+        """Assentos que votam: todos menos o jogador da vez, a partir do seguinte."""
+        return [(self.current_player_turn + i) % self.max_players for i in range(1, self.max_players)]
+
+    def pending_voters(self):
+        return [seat for seat in self.voters() if seat not in self.ballots]
+
+    def current_voter_index(self):
+        pending = self.pending_voters()
+        return pending[0] if pending else None
+
+    def vote_outcome(self):
+        """True/False quando o resultado já não pode mudar; None enquanto depende dos votos que faltam."""
+        threshold = self.vote_required * self.approval_ratio
+        yes = sum(self.votes)
+        remaining = self.vote_required - len(self.votes)
+        if yes > threshold:
+            return True
+        if yes + remaining <= threshold:
+            return False
+        return None
+
+    def finish_voting(self, approved):
+        player_name = self.players[self.current_player_turn].name
+        word = self.voting_word
+
+        self.voting_word = None
+        self.votes = []
+        self.ballots = {}
+        self.vote_required = 0
+        self.current_voter = 0
+        self.vote_start_time = None
+
+        if approved:
+            # Jogador pode escolher a próxima letra sem perder a vez
+            self.scores[self.current_player_turn] += self.points
+            self.emit("log", f"Palavra '{word}' aprovada pelos jogadores! +{self.points} pontos para {player_name}")
+            self.reset_turn()
+            self.state = "roulette"
+            self.emit("word_approved", word)
+        else:
+            self.scores[self.current_player_turn] -= self.points
+            self.emit("log", f"Palavra '{word}' rejeitada pelos jogadores! Vez passa para o próximo jogador.")
+            self.next_turn()
+
+    def next_turn(self):
+        self.current_player_turn = (self.current_player_turn + 1) % self.max_players
+        self.reset_turn()
+        self.state = "roulette"
+        self.emit("turn_ended", self.current_player_turn)
+
+    def reset_turn(self):
+        self.letter_chosen = None
+        self.current_letter = None
+        self.answer = None
+        self.timer_start = None
+        self.cancel_timers()
+        self.warning_played = False
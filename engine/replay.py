@@ -0,0 +1,370 @@
+"""Gravação e replay determinístico de sessões.
+
+Durante a gravação, tudo o que faz uma partida variar de uma execução para
+outra passa por aqui: os eventos do pygame de cada frame, cada leitura de
+Game.now e o resultado de cada validação (com o frame em que ficou pronto).
+No replay esses valores são devolvidos na mesma ordem, com um relógio
+virtual e sem esperar entre frames, então a sessão roda igual, só que na
+velocidade máxima.
+
+Formato do arquivo (.rdr): gzip de uma sequência de registros.
+
+    cabeçalho  b"RDRP" + <H versão
+    FRAME   1  <f segundos desde o início da gravação
+    EVENT   2  <I tipo, <B nº de atributos, (nome, valor com tag) ...
+    TIME    3  <d valor devolvido por Game.now
+    SUBMIT  4  <I nº do pedido, palavra
+    RESULT  5  <I nº do pedido, <b resultado (1 válida, 0 inválida, -1 None)
+
+    python -m engine.replay sessao.rdr
+"""
+import argparse
+import gzip
+import struct
+import sys
+import time
+import zlib
+from collections import deque
+from concurrent.futures import Future
+
+import pygame
+
+MAGIC = b"RDRP"
+VERSION = 1
+
+FRAME, EVENT, TIME, SUBMIT, RESULT = range(1, 6)
+
+RESULT_CODES = {True: 1, False: 0, None: -1}
+RESULT_VALUES = {code: value for value, code in RESULT_CODES.items()}
+
+FLUSH_EVERY = 60  # frames entre flushes (uma sessão interrompida perde no máximo isso)
+
+
+def pack_str(text):
+    data = text.encode("utf-8")
+    return struct.pack("<H", len(data)) + data
+
+
+def pack_value(value):
+    """Valor de atributo de evento com uma tag de tipo; None se não suportado."""
+    if value is None:
+        return b"n"
+    if isinstance(value, bool):
+        return b"?" + struct.pack("<B", value)
+    if isinstance(value, int):
+        return b"i" + struct.pack("<q", value)
+    if isinstance(value, float):
+        return b"f" + struct.pack("<d", value)
+    if isinstance(value, str):
+        return b"s" + pack_str(value)
+    if isinstance(value, (tuple, list)):
+        items = [pack_value(item) for item in value]
+        if None in items:
+            return None
+        return b"t" + struct.pack("<B", len(items)) + b"".join(items)
+    return None
+
+
+def pack_event(event):
+    attrs = []
+    for name, value in event.dict.items():
+        packed = pack_value(value)
+        if packed is not None:  # ex.: objetos de janela do SDL
+            attrs.append(struct.pack("<B", len(name)) + name.encode("ascii") + packed)
+    return struct.pack("<BIB", EVENT, event.type, len(attrs)) + b"".join(attrs)
+
+
+class Reader:
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+
+    def unpack(self, fmt):
+        values = struct.unpack_from(fmt, self.data, self.pos)
+        self.pos += struct.calcsize(fmt)
+        return values
+
+    def str(self):
+        (length,) = self.unpack("<H")
+        text = self.data[self.pos:self.pos + length].decode("utf-8")
+        self.pos += length
+        return text
+
+    def value(self):
+        tag = self.data[self.pos:self.pos + 1]
+        self.pos += 1
+        if tag == b"n":
+            return None
+        if tag == b"?":
+            return bool(self.unpack("<B")[0])
+        if tag == b"i":
+            return self.unpack("<q")[0]
+        if tag == b"f":
+            return self.unpack("<d")[0]
+        if tag == b"s":
+            return self.str()
+        if tag == b"t":
+            (count,) = self.unpack("<B")
+            return tuple(self.value() for _ in range(count))
+        raise ValueError(f"Tag desconhecida no replay: {tag!r}")
+
+    def event(self):
+        event_type, count = self.unpack("<IB")
+        attrs = {}
+        for _ in range(count):
+            (length,) = self.unpack("<B")
+            name = self.data[self.pos:self.pos + length].decode("ascii")
+            self.pos += length
+            attrs[name] = self.value()
+        return pygame.event.Event(event_type, attrs)
+
+
+class Frame:
+    __slots__ = ("time", "events", "times", "results")
+
+    def __init__(self, frame_time):
+        self.time = frame_time
+        self.events = []
+        self.times = []
+        self.results = []  # (nº do pedido, resultado)
+
+
+class Session:
+    """Sessão gravada, carregada inteira na memória."""
+
+    def __init__(self, frames, submits):
+        self.frames = frames
+        self.submits = submits  # palavras na ordem em que foram pedidas
+
+    @property
+    def duration(self):
+        return self.frames[-1].time if self.frames else 0.0
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            raw = f.read()
+        # decompressobj aceita um gzip sem o final (jogo fechado à força)
+        data = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS).decompress(raw)
+        if data[:4] != MAGIC:
+            raise ValueError(f"{path} não é uma sessão gravada")
+        version = struct.unpack_from("<H", data, 4)[0]
+        if version != VERSION:
+            raise ValueError(f"Versão de sessão não suportada: {version}")
+
+        reader = Reader(data)
+        reader.pos = 6
+        frames = []
+        submits = []
+        try:
+            while reader.pos < len(data):
+                (kind,) = reader.unpack("<B")
+                if kind == FRAME:
+                    frames.append(Frame(reader.unpack("<f")[0]))
+                elif kind == EVENT:
+                    frames[-1].events.append(reader.event())
+                elif kind == TIME:
+                    frames[-1].times.append(reader.unpack("<d")[0])
+                elif kind == SUBMIT:
+                    reader.unpack("<I")
+                    submits.append(reader.str())
+                elif kind == RESULT:
+                    index, code = reader.unpack("<Ib")
+                    frames[-1].results.append((index, RESULT_VALUES[code]))
+                else:
+                    raise ValueError(f"Registro desconhecido no replay: {kind}")
+        except struct.error:
+            pass  # último registro cortado no meio
+        return cls(frames, submits)
+
+
+class SessionRecorder:
+    """Grava a sessão de um Game em andamento (ver config.RECORD_SESSION_PATH)."""
+
+    def __init__(self, path):
+        self.file = gzip.open(path, "wb")
+        self.file.write(MAGIC + struct.pack("<H", VERSION))
+        self.start = time.perf_counter()
+        self.frame_count = 0
+        self.pending = []  # (nº do pedido, Future real, Future entregue ao jogo)
+        self.submit_count = 0
+
+    @classmethod
+    def attach(cls, game, path):
+        recorder = cls(path)
+        game.frames = RecordingScheduler(game.frames, recorder)
+        game.validation_worker = RecordingWorker(game.validation_worker, recorder)
+        clock = game.now
+        game.now = lambda: recorder.record_time(clock())
+        return recorder
+
+    def record_frame(self, events):
+        self.file.write(struct.pack("<Bf", FRAME, time.perf_counter() - self.start))
+        for event in events:
+            self.file.write(pack_event(event))
+
+        # Resultados só chegam ao jogo na virada do frame, como no replay
+        still_pending = []
+        for index, real, proxy in self.pending:
+            if proxy.cancelled():
+                real.cancel()
+            elif real.done():
+                result = None if real.cancelled() or real.exception() else real.result()
+                self.file.write(struct.pack("<BIb", RESULT, index, RESULT_CODES[result]))
+                proxy.set_result(result)
+            else:
+                still_pending.append((index, real, proxy))
+        self.pending = still_pending
+
+        self.frame_count += 1
+        if self.frame_count % FLUSH_EVERY == 0:
+            self.file.flush()
+
+    def record_time(self, value):
+        self.file.write(struct.pack("<Bd", TIME, value))
+        return value
+
+    def record_submit(self, word, real):
+        index = self.submit_count
+        self.submit_count += 1
+        self.file.write(struct.pack("<BI", SUBMIT, index) + pack_str(word))
+        proxy = Future()
+        self.pending.append((index, real, proxy))
+        return proxy
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+class RecordingScheduler:
+    def __init__(self, scheduler, recorder):
+        self.scheduler = scheduler
+        self.recorder = recorder
+        self.clock = scheduler.clock
+
+    def next_events(self, animating, until_next_timer=None):
+        events = self.scheduler.next_events(animating, until_next_timer)
+        self.recorder.record_frame(events)
+        return events
+
+
+class RecordingWorker:
+    def __init__(self, worker, recorder):
+        self.worker = worker
+        self.recorder = recorder
+
+    def submit(self, word):
+        word = self.worker.normalize(word)
+        return self.recorder.record_submit(word, self.worker.submit(word))
+
+    def shutdown(self):
+        self.worker.shutdown()
+
+
+class SessionReplayer:
+    """Alimenta um Game com uma sessão gravada, frame a frame.
+
+    Substitui o FrameScheduler, o relógio e o ValidationWorker do jogo. Se o
+    jogo pedir mais leituras de relógio ou validações diferentes das que
+    foram gravadas, a divergência é contada em self.desyncs.
+    """
+
+    def __init__(self, session):
+        self.session = session
+        self.frames = iter(session.frames)
+        self.frame_index = -1
+        self.times = deque()
+        self.last_time = session.frames[0].times[0] if session.frames and session.frames[0].times else 0.0
+        self.futures = []
+        self.desyncs = 0
+        self.finished = False
+        self.clock = pygame.time.Clock()
+
+    def attach(self, game):
+        game.validation_worker.shutdown()
+        game.validation_worker = self
+        game.frames = self
+        game.now = self.now
+        return self
+
+    def next_events(self, animating, until_next_timer=None):
+        self.clock.tick()
+        # Mantém a janela respondendo; fechar a janela interrompe o replay
+        if any(event.type == pygame.QUIT for event in pygame.event.get()):
+            self.finished = True
+
+        frame = None if self.finished else next(self.frames, None)
+        if frame is None:
+            self.finished = True
+            return [pygame.event.Event(pygame.QUIT)]
+
+        self.frame_index += 1
+        if self.times:
+            self.desyncs += 1  # o frame anterior leu o relógio menos vezes que o gravado
+        self.times = deque(frame.times)
+        for index, result in frame.results:
+            future = self.futures[index] if index < len(self.futures) else None
+            if future is None:
+                self.desyncs += 1
+            elif not future.cancelled():
+                future.set_result(result)
+        return list(frame.events)
+
+    def now(self):
+        if self.times:
+            self.last_time = self.times.popleft()
+        else:
+            self.desyncs += 1
+        return self.last_time
+
+    def submit(self, word):
+        index = len(self.futures)
+        expected = self.session.submits[index] if index < len(self.session.submits) else None
+        if expected != word.strip().lower():
+            self.desyncs += 1
+        future = Future()
+        self.futures.append(future)
+        return future
+
+    def shutdown(self):
+        for future in self.futures:
+            future.cancel()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Reexecuta uma sessão gravada na velocidade máxima")
+    parser.add_argument("path", help="arquivo .rdr gravado com config.RECORD_SESSION_PATH")
+    parser.add_argument("--trace", help="grava o tempo de cada frame (.csv ou .jsonl)")
+    args = parser.parse_args(argv)
+
+    import config
+    from game import Game
+    from ui.audio import configure_mixer
+
+    session = Session.load(args.path)
+    config.RECORD_SESSION_PATH = None
+    config.AUTOSAVE_PATH = None  # não sobrescreve a partida salva do jogador
+    config.PROFILE_TRACE_PATH = args.trace
+
+    configure_mixer()
+    pygame.init()
+    game = Game()
+    replayer = SessionReplayer(session).attach(game)
+    start = time.perf_counter()
+    game.run()
+    elapsed = time.perf_counter() - start
+    pygame.quit()
+
+    print(f"{replayer.frame_index + 1} frames ({session.duration:.1f}s gravados) reexecutados em {elapsed:.1f}s")
+    for state, s in game.profiler.report().items():
+        print(f"  {state:<22}{s['frames']:>7} frames  p50 {s['p50']:.2f}  p95 {s['p95']:.2f}  p99 {s['p99']:.2f} ms")
+    if replayer.desyncs:
+        print(f"Atenção: {replayer.desyncs} divergências em relação à gravação")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,266 @@
+"""Snapshot binário de uma partida (GameCore), para autosave e retomada.
+
+    cabeçalho  "RDSV" | versão (u16)
+    partida    estado (u8), jogadores esperados (u8), cadastro atual (u8),
+               vez (u8), letras usadas (u32, bitmask A..Z), flags (u8)
+    placar     quantidade (u8) e um i32 por jogador
+    jogadores  quantidade (u8); personagem (i8, -1 = nenhum) e nome de cada um
+    textos     tema, letra sorteada, letra atual, resposta, palavra em votação
+    votação    votos pedidos (u8), próximo eleitor (u8), quantidade de votos (u8),
+               votos na ordem (bits, u8), quem votou (bits, u8), votos sim (bits, u8)
+    prazos     revelação e vez restantes em segundos (f64; NaN = sem prazo)
+
+Textos: tamanho (u16) + UTF-8, com 0xFFFF para None. Os prazos vão como
+tempo restante, não como instante: o relógio de quem restaura (outro
+processo, outro monotonic) não tem relação com o de quem gravou.
+
+Mudou o formato: acrescente os campos no fim e suba VERSION; loads()
+recusa versões que não conhece. Também recusa (SnapshotError) um arquivo
+que decodifica mas não descreve uma partida possível (vez fora dos
+assentos, personagem inexistente, prazo no estado errado...): restaurado,
+ele derrubaria a interface e o autosave seguinte o traria de volta.
+"""
+import math
+import os
+import struct
+
+from api.validation_string import validation_name
+from engine.core import ALPHABET, CHARACTER_COUNT, MAX_PLAYERS, MIN_PLAYERS, Player
+
+MAGIC = b"RDSV"
+VERSION = 1
+HEADER = struct.Struct("<4sH")
+MATCH = struct.Struct("<BBBBIB")
+COUNT = struct.Struct("<B")
+SCORE = struct.Struct("<i")
+CHARACTER = struct.Struct("<b")
+TEXT_SIZE = struct.Struct("<H")
+VOTING = struct.Struct("<BBBBBB")
+DEADLINES = struct.Struct("<dd")
+NO_TEXT = 0xFFFF
+
+# A posição no tuplo é o que vai no arquivo: estados novos entram no fim
+STATES = (
+    "select_player_count", "get_names", "choose_character", "select_theme",
+    "roulette", "letter_reveal", "answer_input", "validating", "voting",
+)
+WARNING_PLAYED = 1
+ALL_LETTERS = (1 << len(ALPHABET)) - 1
+
+
+class SnapshotError(ValueError):
+    pass
+
+
+def _pack_text(parts, text):
+    if text is None:
+        parts.append(TEXT_SIZE.pack(NO_TEXT))
+        return
+    data = text.encode("utf-8")
+    parts.append(TEXT_SIZE.pack(len(data)))
+    parts.append(data)
+
+
+def _bits(values):
+    mask = 0
+    for i, value in enumerate(values):
+        if value:
+            mask |= 1 << i
+    return mask
+
+
+def _remaining(core, timer):
+    return math.nan if timer is None else core.timers.remaining(timer)
+
+
+def dumps(core):
+    """Estado da partida em bytes (algumas dezenas; rápido o bastante para cada jogada)."""
+    parts = [
+        HEADER.pack(MAGIC, VERSION),
+        MATCH.pack(
+            STATES.index(core.state), core.max_players, core.current_input, core.current_player_turn,
+            core.used_mask, WARNING_PLAYED if core.warning_played else 0,
+        ),
+        COUNT.pack(len(core.scores)),
+    ]
+    parts.extend(SCORE.pack(score) for score in core.scores)
+
+    parts.append(COUNT.pack(len(core.players)))
+    for player in core.players:
+        parts.append(CHARACTER.pack(-1 if player.character is None else player.character))
+        _pack_text(parts, player.name)
+
+    for text in (core.current_theme, core.letter_chosen, core.current_letter, core.answer, core.voting_word):
+        _pack_text(parts, text)
+
+    voted = _bits(seat in core.ballots for seat in range(core.max_players))
+    approved = _bits(core.ballots.get(seat, False) for seat in range(core.max_players))
+    parts.append(VOTING.pack(
+        core.vote_required, core.current_voter, len(core.votes), _bits(core.votes), voted, approved,
+    ))
+    parts.append(DEADLINES.pack(_remaining(core, core.reveal_timer), _remaining(core, core.turn_timer)))
+    return b"".join(parts)
+
+
+class _Reader:
+    def __init__(self, data):
+        self.data = memoryview(data)
+        self.position = 0
+
+    def read(self, layout):
+        values = layout.unpack_from(self.data, self.position)
+        self.position += layout.size
+        return values
+
+    def text(self):
+        (size,) = self.read(TEXT_SIZE)
+        if size == NO_TEXT:
+            return None
+        text = bytes(self.data[self.position:self.position + size]).decode("utf-8")
+        self.position += size
+        return text
+
+
+def _check(state, max_players, current_input, turn, used_mask, scores, players, texts, voting, deadlines):
+    """Confere o que foi lido: um arquivo que decodifica mas não faz sentido não pode chegar à tela."""
+    def require(condition, message):
+        if not condition:
+            raise SnapshotError(f"snapshot inconsistente: {message}")
+
+    require(MIN_PLAYERS <= max_players <= MAX_PLAYERS, f"{max_players} jogadores")
+    require(len(scores) == max_players, "placar não bate com os jogadores")
+    require(len(players) <= max_players, "jogadores demais")
+    require(current_input <= max_players, f"cadastro do jogador {current_input}")
+    require(turn < max_players, f"vez do jogador {turn}")
+    require(used_mask & ~ALL_LETTERS == 0, "letra usada fora do alfabeto")
+    theme, letter_chosen, current_letter, answer, voting_word = texts
+    for letter in (letter_chosen, current_letter):
+        require(letter is None or letter in ALPHABET, f"letra {letter!r}")
+    for player in players:
+        require(player.name is not None and validation_name(player.name), f"nome {player.name!r}")
+        require(player.character is None or player.character < CHARACTER_COUNT, f"personagem {player.character}")
+    vote_required, current_voter, vote_count, voted = voting
+    require(current_voter <= max_players and vote_count <= max_players, "votos demais")
+
+    # A partir do tema todos estão cadastrados e com personagem; depois da roleta há tema e letra
+    position = STATES.index(state)
+    registered = position >= STATES.index("select_theme")
+    require(not registered or len(players) == max_players, "jogadores faltando")
+    require(not registered or all(player.character is not None for player in players), "personagem faltando")
+    require(theme is None or validation_name(theme), f"tema {theme!r}")
+    require(position < STATES.index("roulette") or theme is not None, "partida sem tema")
+    for text in (answer, voting_word):
+        require(text is None or "\0" not in text, "caractere nulo na resposta")
+    if position > STATES.index("roulette"):
+        require(letter_chosen is not None and current_letter is not None, "vez sem letra")
+    require(state != "validating" or answer is not None, "validação sem resposta")
+    require(state != "get_names" or current_input == len(players) < max_players, "cadastro fora de ordem")
+    require(state != "choose_character" or current_input < len(players), "personagem de jogador sem nome")
+    # Cada prazo só existe no estado que ele encerra
+    reveal_remaining, turn_remaining = deadlines
+    require(not math.isinf(reveal_remaining) and not math.isinf(turn_remaining), "prazo infinito")
+    require(math.isnan(reveal_remaining) == (state != "letter_reveal"), "prazo da revelação")
+    require(math.isnan(turn_remaining) == (state not in ("answer_input", "validating")), "prazo da vez")
+    if state == "voting":
+        # Falta pelo menos um eleitor, e o jogador da vez não vota
+        require(voting_word is not None, "votação sem palavra")
+        require(vote_required == max_players - 1, f"{vote_required} votos pedidos")
+        require(vote_count == bin(voted).count("1") < vote_required, "votos não batem com os eleitores")
+        require(voted >> max_players == 0 and not voted >> turn & 1, "voto de assento inválido")
+
+
+def loads(data, core):
+    """Restaura o snapshot em core (que já tem relógio, timers e regras) e reagenda os prazos."""
+    try:
+        reader = _Reader(data)
+        magic, version = reader.read(HEADER)
+        if magic != MAGIC:
+            raise SnapshotError("não é um snapshot do jogo")
+        if version != VERSION:
+            raise SnapshotError(f"versão {version} desconhecida")
+
+        state, max_players, current_input, turn, used_mask, flags = reader.read(MATCH)
+        (score_count,) = reader.read(COUNT)
+        scores = [reader.read(SCORE)[0] for _ in range(score_count)]
+        (player_count,) = reader.read(COUNT)
+        players = []
+        for _ in range(player_count):
+            (character,) = reader.read(CHARACTER)
+            players.append(Player(reader.text(), None if character < 0 else character))
+        theme, letter_chosen, current_letter, answer, voting_word = (reader.text() for _ in range(5))
+        vote_required, current_voter, vote_count, votes, voted, approved = reader.read(VOTING)
+        reveal_remaining, turn_remaining = reader.read(DEADLINES)
+    except (struct.error, UnicodeDecodeError) as e:
+        raise SnapshotError(f"snapshot corrompido: {e}") from e
+    if state >= len(STATES):
+        raise SnapshotError(f"estado {state} desconhecido")
+    _check(
+        STATES[state], max_players, current_input, turn, used_mask, scores, players,
+        (theme, letter_chosen, current_letter, answer, voting_word),
+        (vote_required, current_voter, vote_count, voted), (reveal_remaining, turn_remaining),
+    )
+
+    core.state = STATES[state]
+    core.max_players = max_players
+    core.current_input = current_input
+    core.current_player_turn = turn
+    core.used_mask = used_mask
+    core.warning_played = bool(flags & WARNING_PLAYED)
+    core.scores = scores
+    core.players = players
+    core.current_theme = theme
+    core.letter_chosen = letter_chosen
+    core.current_letter = current_letter
+    core.answer = answer
+    core.voting_word = voting_word
+    core.vote_required = vote_required
+    core.current_voter = current_voter
+    core.votes = [bool(votes >> i & 1) for i in range(vote_count)]
+    core.ballots = {seat: bool(approved >> seat & 1) for seat in range(max_players) if voted >> seat & 1}
+    core.vote_start_time = core.clock() if voting_word is not None else None
+    core.restore_deadlines(
+        None if math.isnan(reveal_remaining) else reveal_remaining,
+        None if math.isnan(turn_remaining) else turn_remaining,
+    )
+
+    # A interface refaz o que estava em andamento: validar a palavra, abrir a votação
+    if core.state == "validating":
+        core.emit("validate", core.answer)
+    elif core.state == "voting":
+        core.emit("voting_started", core.voting_word)
+    return core
+
+
+def save(path, core):
+    """Grava o snapshot sem deixar arquivo pela metade (escreve ao lado e troca)."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as f:
+        f.write(dumps(core))
+    os.replace(temporary, path)
+
+
+def discard(path):
+    """Apaga o snapshot (e o temporário de um save interrompido), se existirem."""
+    for name in (path, path + ".tmp"):
+        try:
+            os.remove(name)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Não foi possível apagar {name}: {e}")
+
+
+def load(path, core):
+    """Restaura o snapshot de path em core. False se não houver ou não der para ler."""
+    if not path or not os.path.exists(path):
+        return False
+    try:
+        with open(path, "rb") as f:
+            loads(f.read(), core)
+    except (OSError, SnapshotError) as e:
+        print(f"Partida salva indisponível: {e}")
+        return False
+    return True
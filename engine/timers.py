@@ -0,0 +1,117 @@
+"""Timers com prazo, num heap, sem pygame.
+
+Em vez de cada frame comparar o relógio com vários instantes (fim da
+revelação, alerta, fim da vez, fim da mensagem de erro), quem precisa de
+um prazo agenda um callback. run_due() só olha o topo do heap: sem nada
+vencido, custa uma comparação. O relógio é injetado (monotônico por
+padrão), então os timers seguem o tempo real e não a taxa de frames.
+
+Para postar um evento customizado no prazo, agende o próprio post:
+
+    timers.call_later(2.0, pygame.event.post, pygame.event.Event(MEU_EVENTO))
+"""
+import heapq
+import itertools
+import time
+
+COMPACT_MIN = 64  # reconstrói o heap quando há muitos timers cancelados
+
+
+class Timer:
+    __slots__ = ("deadline", "callback", "args", "cancelled")
+
+    def __init__(self, deadline, callback, args):
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+
+class TimerScheduler:
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.heap = []  # (prazo, ordem, Timer); a ordem desempata prazos iguais
+        self.counter = itertools.count()
+        self.cancelled = 0
+        self.paused_at = None
+
+    @property
+    def paused(self):
+        return self.paused_at is not None
+
+    def now(self):
+        """Relógio dos timers: parado enquanto pausado."""
+        return self.paused_at if self.paused else self.clock()
+
+    def call_at(self, deadline, callback, *args):
+        timer = Timer(deadline, callback, args)
+        heapq.heappush(self.heap, (deadline, next(self.counter), timer))
+        return timer
+
+    def call_later(self, delay, callback, *args):
+        return self.call_at(self.now() + delay, callback, *args)
+
+    def cancel(self, timer):
+        if timer is None or timer.cancelled:
+            return
+        timer.cancelled = True
+        self.cancelled += 1
+        if self.cancelled > COMPACT_MIN and self.cancelled > len(self.heap) // 2:
+            self.heap = [entry for entry in self.heap if not entry[2].cancelled]
+            heapq.heapify(self.heap)
+            self.cancelled = 0
+
+    def remaining(self, timer):
+        """Segundos até o prazo do timer (congelado durante a pausa)."""
+        return max(0.0, timer.deadline - self.now())
+
+    def next_deadline(self):
+        """Prazo do próximo timer ativo, ou None (também durante a pausa)."""
+        self.drop_cancelled()
+        if self.paused or not self.heap:
+            return None
+        return self.heap[0][0]
+
+    def time_until_next(self):
+        deadline = self.next_deadline()
+        if deadline is None:
+            return None
+        return max(0.0, deadline - self.clock())
+
+    def run_due(self):
+        """Dispara os timers vencidos, em ordem de prazo. Retorna quantos."""
+        if self.paused:
+            return 0
+        now = self.clock()
+        fired = 0
+        while self.heap and self.heap[0][0] <= now:
+            _, _, timer = heapq.heappop(self.heap)
+            if timer.cancelled:
+                self.cancelled -= 1
+                continue
+            timer.cancelled = True  # já disparou: cancel() depois não faz nada
+            timer.callback(*timer.args)
+            fired += 1
+        return fired
+
+    def drop_cancelled(self):
+        while self.heap and self.heap[0][2].cancelled:
+            heapq.heappop(self.heap)
+            self.cancelled -= 1
+
+    def pause(self):
+        if not self.paused:
+            self.paused_at = self.clock()
+
+    def resume(self):
+        """Volta a contar; todos os prazos andam o tempo que ficou pausado."""
+        if not self.paused:
+            return
+        shift = self.clock() - self.paused_at
+        self.paused_at = None
+        if shift <= 0:
+            return
+        # Deslocar tudo pelo mesmo valor mantém a ordem do heap
+        self.heap = [(deadline + shift, order, timer) for deadline, order, timer in self.heap]
+        for _, _, timer in self.heap:
+            timer.deadline += shift
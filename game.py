@@ -1,154 +1,389 @@
 import pygame
 import time
 import config
-from api.word_validation import validate_word
-from api.validation_string import validation_name
-from config import resource_path
-import os
-import sys
-
-def resource_path(relative_path):
-    """Retorna o caminho absoluto, lidando com PyInstaller."""
-    try:
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
+from api.word_validation import validate_word, word_cache, conceptnet
+from api.validation_worker import ValidationWorker
+from engine.core import ALPHABET, GameCore
+from engine import snapshot
+from engine.replay import SessionRecorder
+from engine.timers import TimerScheduler
+from ui.assets import AssetManager
+from ui.audio import AudioManager
+from ui.fonts import FontRegistry
+from ui.frame_scheduler import FrameScheduler
+from ui.glyph_atlas import GlyphAtlasCache
+from ui.layers import DirtyRects, LayerCache
+from ui.layout import Grid, LayoutCache
+from ui.profiler import FrameProfiler, ProfilerOverlay
+from ui.text_cache import TextCache
+from ui.tween import Tweens
+from ui.viewport import Viewport
+from ui.vote_bridge import VOTE_EVENT, VoteBridge
 
-class Game:
-    def __init__(self):
-        self.screen = pygame.display.set_mode(
-            (config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
-        )
-        self.background = pygame.image.load(config.BACKGROUND_IMG)
-        self.background = pygame.transform.scale(
-            self.background, (config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
-        )
 
+class Game:
+    # Fontes usadas pelos draw_*; pré-carregadas se config.PRELOAD_FONTS
+    FONT_SPECS = [
+        ("arial", 16, False),
+        ("arial", 30, False),
+        ("comicsansms", 24, False),
+        ("comicsansms", 28, False),
+        ("comicsansms", 28, True),
+        ("comicsansms", 30, True),
+        ("comicsansms", 32, False),
+        ("comicsansms", 32, True),
+        ("comicsansms", 36, False),
+        ("comicsansms", 40, True),
+        ("comicsansms", 42, False),
+        ("comicsansms", 42, True),
+        ("comicsansms", 100, True),
+    ]
+
+    # (nome, arquivo, tamanho) carregados pelo AssetManager antes do primeiro frame
+    ASSET_SPECS = [
+        ("background", config.BACKGROUND_IMG, (config.SCREEN_WIDTH, config.SCREEN_HEIGHT)),
+        ("char1", "assets/char1.jpg", (64, 64)),
+        ("char2", "assets/char2.jpg", (64, 64)),
+        ("char3", "assets/char3.jpg", (64, 64)),
+        ("char4", "assets/char4.jpg", (64, 64)),
+        ("warning", "assets/warning.wav", None),
+        ("choice_letter", "assets/choice_letter.wav", None),
+    ]
+    # Sons longos: tocados em streaming, sem decodificar o arquivo inteiro
+    AUDIO_STREAMS = [
+        ("next_sound", "assets/next_sound.wav"),
+    ]
+
+    # Grade de letras da roleta: canto da primeira letra, distância entre letras, colunas
+    LETTER_ORIGIN = (50, 300)
+    LETTER_PITCH = 70
+    LETTER_COLUMNS = 13
 
-        self.warning_sound = pygame.mixer.Sound(resource_path("assets/warning.wav"))
-        self.next_sound = pygame.mixer.Sound(resource_path("assets/next_sound.wav"))
-        self.choice_letter = pygame.mixer.Sound(resource_path("assets/choice_letter.wav"))
-
-        self.play_next_after_warning = False
-
-        self.channel = pygame.mixer.Channel(0)
-        self.channel.set_endevent(pygame.USEREVENT + 1)
-        self.player_count = 0
-        self.state = "select_player_count"  # já tem
+    def __init__(self):
+        self.windowed_size = config.WINDOW_SIZE or (config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
+        self.fullscreen = config.FULLSCREEN
+        self.window = self.open_window()
+        # Tudo é desenhado no canvas lógico; o viewport escala para a janela
+        self.screen = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT)).convert()
+        self.viewport = Viewport((config.SCREEN_WIDTH, config.SCREEN_HEIGHT), self.window)
+        # Imagens e sons carregam numa thread enquanto o resto do jogo se prepara
+        self.assets = AssetManager()
+        self.assets.load(self.ASSET_SPECS)
 
-        # Para votação:
-        self.voting_word = None  # palavra a ser votada
-        self.votes = []  # lista dos votos (True=sim, False=não)
-        self.vote_required = 0  # quantos votos precisam
-        self.current_voter = 0  # índice do jogador votando
-        self.vote_result = None  # resultado final (True/False)
-        self.vote_time_limit = 30  # segundos para votar (opcional)
-        self.vote_start_time = None  # hora que começou votação
 
         self.error_message = ""
-        self.error_message_time = 0
+        self.error_timer = None
         self.error_message_duration = 3000  # 3 segundos
-        self.error_alpha = 255  # opacidade inicial (0 transparente, 255 opaco)
-        self.error_alpha_direction = -5  # direção do fade (diminuindo)
 
-        self.letter_rects = []
+        # Camadas estáticas por estado e regiões sujas (display.update parcial)
+        self.layers = LayerCache((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+        self.dirty = DirtyRects()
+        # Geometria dos widgets clicáveis, calculada fora do desenho
+        self.layouts = LayoutCache()
 
         self.themes = ["Lugar", "Objeto", "Animal", "Comida", "Profissão", "+ Criar nova categoria para a próxima rodada"]
         self.selected_theme_index = 0
-        self.current_theme = None
-        self.theme_rects = []
         self.custom_theme_input = ""
         self.typing_custom_theme = False
 
         pygame.display.set_caption("Jogo da Roda de Letras")
 
-        self.clock = pygame.time.Clock()
+        self.now = time.monotonic  # relógio do jogo (substituível em benchmarks/replays)
+        # Prazos do jogo todo (regras e interface) num heap só
+        self.timers = TimerScheduler(clock=lambda: self.now())
+        # Animações por tempo (pisca do erro, giro da roleta, letra sorteada)
+        self.tweens = Tweens(clock=lambda: self.now())
+        # Regras da partida; o Game só traduz eventos em ações e desenha o estado
+        self.core = GameCore(clock=lambda: self.now(), turn_seconds=config.TIMER_SECONDS, timers=self.timers)
+        self.frames = FrameScheduler(config.FPS, config.IDLE_WAIT_MS)
+        self.was_animating = True
         self.running = True
-        self.font = pygame.font.SysFont("arial", 30)
-
-        self.max_players = 4
-        self.players = []
-        self.input_boxes = ["" for _ in range(self.max_players)]
-        self.current_input = 0
-
-        self.character_images = [
-            pygame.transform.scale(
-                pygame.image.load(resource_path(f"assets/char{i}.jpg")).convert_alpha(),
-                (64, 64)
-            )
-            for i in range(1, 5)
-        ]
+        self.quit_requested = False  # janela fechada pelo jogador (não caiu)
+        self.fonts = FontRegistry()
+        if config.PRELOAD_FONTS:
+            self.fonts.warm(self.FONT_SPECS)
+        self.font = self.fonts.get("arial", 30)
+        self.text_cache = TextCache(config.TEXT_CACHE_SIZE)
+
+        self.profiler = FrameProfiler(
+            long_frame_ms=config.PROFILE_LONG_FRAME_MS, trace_path=config.PROFILE_TRACE_PATH
+        )
+        self.profiler_overlay = ProfilerOverlay(self.profiler, self.fonts.get("arial", 16))
+        self.profiler_overlay.visible = config.PROFILE_OVERLAY
+        self.glyph_atlases = GlyphAtlasCache()
+
+        self.input_boxes = ["" for _ in range(self.core.max_players)]
+
+        self.wait_assets()
+        self.background = self.assets.image("background")
+        self.audio = AudioManager(self.timers, config.AUDIO_CHANNELS)
+        for name in self.assets.sounds:
+            self.audio.add_cue(name, self.assets.sound(name))
+        for name, path in self.AUDIO_STREAMS:
+            self.audio.add_stream(name, path)
+        self.character_images = [self.assets.image(f"char{i}") for i in range(1, 5)]
         self.selected_character_index = 0
 
-        self.scores = [0] * self.max_players
-        self.used_letters = set()
-        self.alphabet = list("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
         self.current_letter_index = 0
-        self.current_player_turn = 0
-        self.letter_chosen = None
-        self.current_letter = None
         self.current_answer = ""
-        self.timer_start = None
-        self.remaining_time = 40
-        self.warning_played = False
 
-    def run(self):
-        while self.running:
-            self.screen.blit(self.background, (0, 0))
-            self.handle_events()
-
-            if self.state == "select_player_count":
-                self.draw_select_player_count()
-            if self.state == "get_names":
-                self.draw_name_input()
-            elif self.state == "choose_character":
-                self.draw_character_selection()
-            elif self.state == "select_theme":
-                self.draw_theme_selection()
-            elif self.state == "roulette":
-                self.draw_roulette()
-                self.update_timer()
-            elif self.state == "letter_reveal":
-                self.draw_roulette()  # mostra a letra sorteada
-                if time.time() - self.reveal_start_time > 4:  # pode ser 2.5s ou o tempo que quiser
-                    self.timer_start = time.time()
-                    self.state = "answer_input"
-            elif self.state == "answer_input":
-                self.draw_answer_input()
-                self.update_timer()
-            elif self.state == "gameplay":
-                self.process_answer()
-            elif self.state == "voting":
-                self.draw_voting()
+        # Validação em segundo plano (não trava a janela)
+        self.validation_worker = ValidationWorker()
+        self.pending_validation = None  # Future da palavra sendo validada
+
+        # Pré-validação especulativa (config.SPECULATIVE_VALIDATION)
+        self.speculative_future = None
+        self.speculative_word = None
+        self.last_keystroke_time = 0
+
+        # Votação em paralelo: teclas por jogador, controles e celular
+        self.vote_keys = {}
+        for seat, (yes_key, no_key) in enumerate(config.VOTE_KEYS):
+            self.vote_keys[pygame.key.key_code(yes_key)] = (seat, True)
+            self.vote_keys[pygame.key.key_code(no_key)] = (seat, False)
+        self.joysticks = {}  # instance_id -> Joystick; o n-ésimo controle é do jogador n
+        self.vote_bridge = None
+        if config.VOTE_BRIDGE_PORT:
+            self.vote_bridge = VoteBridge(config.VOTE_BRIDGE_HOST, config.VOTE_BRIDGE_PORT)
+            self.vote_bridge.start()
+
+        # Gravação da sessão para replay (config.RECORD_SESSION_PATH)
+        self.recorder = None
+        if config.RECORD_SESSION_PATH:
+            self.recorder = SessionRecorder.attach(self, config.RECORD_SESSION_PATH)
+
+        # Autosave da partida (config.AUTOSAVE_PATH) a cada mudança de estado
+        self.saved_state = None
+
+    def wait_assets(self):
+        """Tela de carregamento até a thread de assets terminar."""
+        clock = pygame.time.Clock()
+        font = self.fonts.get("comicsansms", 28, bold=True)
+        while not self.assets.ready():
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.running = False
+                    self.quit_requested = True
+            self.draw_loading(font)
+            clock.tick(30)
+
+        self.assets.finish()
+        print(self.assets.summary())
+        if config.ASSET_TIMINGS_PATH:
+            self.assets.append_timings(config.ASSET_TIMINGS_PATH)
+
+    def draw_loading(self, font):
+        self.screen.fill((10, 10, 20))
+        center_x, center_y = config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2
+        text = font.render("Carregando...", True, (255, 255, 255))
+        self.screen.blit(text, text.get_rect(center=(center_x, center_y - 40)))
+
+        bar = pygame.Rect(0, 0, 400, 20)
+        bar.center = (center_x, center_y + 10)
+        pygame.draw.rect(self.screen, (255, 255, 0), bar, 2, border_radius=6)
+        filled = bar.inflate(-6, -6)
+        filled.width = int(filled.width * self.assets.progress())
+        if filled.width > 0:
+            pygame.draw.rect(self.screen, (255, 255, 0), filled, border_radius=4)
+        self.viewport.present_all(self.screen)
+
+    def open_window(self):
+        if self.fullscreen:
+            return pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        return pygame.display.set_mode(self.windowed_size, pygame.RESIZABLE if config.WINDOW_RESIZABLE else 0)
+
+    def toggle_fullscreen(self):
+        self.fullscreen = not self.fullscreen
+        self.open_window()
+        self.resize_window()
+
+    def resize_window(self):
+        """Janela mudou de tamanho: refaz a escala e redesenha tudo na próxima vez."""
+        self.window = pygame.display.get_surface()
+        if not self.fullscreen:
+            self.windowed_size = self.window.get_size()
+        self.viewport.resize(self.window)
+        self.dirty.invalidate()
 
-            pygame.display.flip()
-            self.clock.tick(60)
-
-    def handle_events(self):
-        for event in pygame.event.get():
-            if event.type == pygame.USEREVENT + 1:
-                if self.play_next_after_warning:
-                    self.play_next_after_warning = False
-                    self.channel.play(self.next_sound)
+    def run(self):
+        try:
+            while self.running:
+                self.step()
+        finally:
+            # Fecha a gravação mesmo se o jogo cair no meio do frame
+            self.shutdown()
+
+    def step(self):
+        """Executa um frame: eventos, lógica do estado e desenho."""
+        self.profiler.begin_frame()
+        animating = self.is_animating()
+        # Parado, dorme até o próximo evento ou o próximo timer
+        events = self.frames.next_events(animating, None if animating else self.timers.time_until_next())
+        self.profiler.mark("wait")
+        self.handle_events(events)
+        self.apply_effects()
+        self.profiler.mark("events")
+
+        # Revelação da letra, alerta, fim da vez e fim da mensagem de erro
+        self.timers.run_due()
+        if self.state == "answer_input":
+            self.update_speculative_validation()
+        elif self.state == "validating":
+            # Continua desenhando e contando o tempo enquanto a API responde
+            self.check_validation()
+        self.apply_effects()
+        self.autosave()
+
+        self.profiler.mark("update")
+
+        # Tela parada e nenhum evento: não há o que redesenhar
+        if events or animating or self.was_animating or self.is_animating():
+            self.draw()
+        self.was_animating = animating
+        self.profiler.end_frame(self.state)
+
+    def shutdown(self):
+        # Saída normal: a próxima abertura começa uma partida nova. Se o jogo
+        # caiu, o autosave fica para resume_autosave() retomar.
+        if self.quit_requested and config.AUTOSAVE_PATH:
+            snapshot.discard(config.AUTOSAVE_PATH)
+        self.validation_worker.shutdown()
+        self.audio.shutdown()
+        if self.vote_bridge is not None:
+            self.vote_bridge.stop()
+        print(f"Cache de palavras: {word_cache.stats()}")
+        print(f"ConceptNet: {conceptnet.stats()}")
+        print(f"Cache de textos: {self.text_cache.stats()}")
+        print(f"Áudio: {self.audio.stats()}")
+        print(f"Frames longos: {self.profiler.long_frames} de {self.profiler.frame_count}")
+        self.profiler.close()
+        if self.recorder is not None:
+            self.recorder.close()
+
+    def autosave(self):
+        """Grava a partida quando o estado muda (várias vezes por vez, nunca por frame)."""
+        if not config.AUTOSAVE_PATH or self.state == self.saved_state:
+            return
+        self.saved_state = self.state
+        try:
+            snapshot.save(config.AUTOSAVE_PATH, self.core)
+        except OSError as e:
+            print(f"Autosave falhou: {e}")
+
+    def resume_autosave(self):
+        """Retoma a partida do autosave, que só sobra se o jogo caiu no meio da partida."""
+        if not snapshot.load(config.AUTOSAVE_PATH, self.core):
+            # Arquivo ilegível ou inconsistente: apaga para não tentar de novo a cada abertura
+            if config.AUTOSAVE_PATH:
+                snapshot.discard(config.AUTOSAVE_PATH)
+            return False
+        self.input_boxes = ["" for _ in range(self.core.max_players)]
+        self.saved_state = self.state
+        self.apply_effects()
+        print(f"Partida retomada ({self.state})")
+        return True
+
+    @property
+    def state(self):
+        return self.core.state
+
+    def apply_effects(self):
+        """Reage ao que o GameCore pediu: sons, validação e mensagens."""
+        for kind, payload in self.core.drain_effects():
+            if kind == "error":
+                self.show_error(payload)
+            elif kind == "log":
+                print(payload)
+            elif kind == "letter_selected":
+                self.current_answer = ""
+                self.play_choice_sound()
+                self.start_roulette_spin(payload)
+            elif kind == "warning":
+                self.play_warning_sound()
+            elif kind == "validate":
+                self.start_validation(payload)
+            elif kind == "voting_started":
+                if self.vote_bridge is not None:
+                    self.vote_bridge.set_players([player.name for player in self.core.players])
+                    self.vote_bridge.voting_word = payload
+            elif kind == "word_approved":
+                self.current_answer = ""
+                if self.vote_bridge is not None:
+                    self.vote_bridge.voting_word = None
+            elif kind == "turn_ended":
+                if self.vote_bridge is not None:
+                    self.vote_bridge.voting_word = None
+                # Descarta validação pendente da vez que acabou
+                self.pending_validation = None
+                self.cancel_speculative_validation()
+                self.current_answer = ""
+
+    def show_error(self, message):
+        self.error_message = message
+        self.timers.cancel(self.error_timer)
+        self.error_timer = self.timers.call_later(self.error_message_duration / 1000, self.clear_error)
+        # Opacidade vai de 255 a 50 e volta, até o timer apagar a mensagem
+        self.tweens.start(
+            "error_fade", 255, 50, config.ERROR_FADE_SECONDS, easing="in_out_sine", repeat=-1, yoyo=True
+        )
 
-            elif event.type == pygame.QUIT:
+    def clear_error(self):
+        self.error_message = ""
+        self.timers.cancel(self.error_timer)
+        self.error_timer = None
+        self.tweens.stop("error_fade")
+
+    def start_roulette_spin(self, letter):
+        """Gira o destaque da roleta algumas voltas até a letra e depois revela a letra grande."""
+        target = ALPHABET.index(letter)
+        self.tweens.start(
+            "roulette_spin", self.current_letter_index, target + len(ALPHABET) * config.ROULETTE_SPIN_LAPS,
+            config.ROULETTE_SPIN_SECONDS, easing="out_cubic",
+        )
+        self.tweens.start(
+            "letter_pop", 0.0, 1.0, config.LETTER_POP_SECONDS, easing="out_back", delay=config.ROULETTE_SPIN_SECONDS
+        )
+        self.current_letter_index = target
+
+    def is_animating(self):
+        if self.timers.paused:
+            return False
+        # Estados com contagem regressiva ou cursor piscando
+        if self.state in ("answer_input", "validating"):
+            return True
+        # Pisca do erro, giro da roleta, letra sorteada: só enquanto durarem
+        return self.tweens.active()
+
+    def handle_events(self, events):
+        for event in events:
+            if event.type == pygame.QUIT:
                 self.running = False
-            elif hasattr(self, 'typing_custom_theme') and self.typing_custom_theme:
+                self.quit_requested = True
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.profiler_overlay.toggle()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F11:
+                self.toggle_fullscreen()
+            elif event.type == pygame.VIDEORESIZE:
+                self.resize_window()
+            elif event.type == pygame.JOYDEVICEADDED:
+                joystick = pygame.joystick.Joystick(event.device_index)
+                self.joysticks[joystick.get_instance_id()] = joystick
+            elif event.type == pygame.JOYDEVICEREMOVED:
+                self.joysticks.pop(event.instance_id, None)
+            elif event.type == pygame.WINDOWMINIMIZED:
+                # Janela minimizada: a letra e a contagem regressiva esperam
+                self.core.pause()
+            elif event.type == pygame.WINDOWRESTORED:
+                self.core.resume()
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                self.click(self.viewport.to_logical(event.pos))
+            elif self.typing_custom_theme:
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_RETURN:
-                        theme = self.custom_theme_input.strip()
-                        if validation_name(theme):
+                        if self.core.choose_theme(self.custom_theme_input):
                             self.typing_custom_theme = False
-                            self.current_theme = theme
-                            self.error_message = ""
-                            # opcional: mudar estado, ex:
-                            self.state = "roulette"
-                        else:
-                            self.error_message = "Tema inválido! Use letras, acentos, espaços e hífen."
-                            self.error_message_time = pygame.time.get_ticks() + self.error_message_duration
-                            self.error_alpha = 255
-                            self.error_alpha_direction = -5
+                            self.custom_theme_input = ""
+                            self.clear_error()
 
                     elif event.key == pygame.K_BACKSPACE:
                         self.custom_theme_input = self.custom_theme_input[:-1]
@@ -159,35 +394,18 @@ class Game:
             elif self.state == "select_player_count":
                 if event.type == pygame.KEYDOWN:
                     if event.key in [pygame.K_2, pygame.K_3, pygame.K_4]:
-                        self.max_players = int(event.unicode)
-                        self.input_boxes = ["" for _ in range(self.max_players)]
-                        self.scores = [0] * self.max_players
-                        self.player_count = self.max_players
-                        self.state = "get_names"
+                        self.core.set_player_count(int(event.unicode))
+                        self.input_boxes = ["" for _ in range(self.core.max_players)]
 
             elif self.state == "get_names":
                 if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_RETURN and self.input_boxes[self.current_input] != "":
-                        name = self.input_boxes[self.current_input].strip()
-                        if validation_name(name):
-                            self.players.append({
-                                "name": name,
-                                "character": None,
-                            })
-                            self.current_input += 1
-
-                            if self.current_input == self.max_players:
-                                self.current_input = 0
-                                self.state = "choose_character"
-                        else:
-                            self.error_message = "Nome inválido! Use letras e acentos, sem símbolos proibidos."
-                            self.error_message_time = pygame.time.get_ticks() + self.error_message_duration
-                            self.error_alpha = 255
-                            self.error_alpha_direction = -5
+                    current = self.core.current_input
+                    if event.key == pygame.K_RETURN and self.input_boxes[current] != "":
+                        self.core.add_player(self.input_boxes[current])
                     elif event.key == pygame.K_BACKSPACE:
-                        self.input_boxes[self.current_input] = self.input_boxes[self.current_input][:-1]
-                    elif len(self.input_boxes[self.current_input]) < 6 and event.unicode.isprintable():
-                        self.input_boxes[self.current_input] += event.unicode
+                        self.input_boxes[current] = self.input_boxes[current][:-1]
+                    elif len(self.input_boxes[current]) < 6 and event.unicode.isprintable():
+                        self.input_boxes[current] += event.unicode
 
             elif self.state == "choose_character":
                 if event.type == pygame.KEYDOWN:
@@ -196,398 +414,407 @@ class Game:
                     elif event.key == pygame.K_RIGHT:
                         self.selected_character_index = (self.selected_character_index + 1) % len(self.character_images)
                     elif event.key == pygame.K_RETURN:
-                        self.players[self.current_input]["character"] = self.character_images[self.selected_character_index]
-                        self.current_input += 1
-                        if self.current_input == self.max_players:
-                            self.state = "select_theme"
-                            self.current_player_turn = 0
-                            self.letter_chosen = None
-                            self.timer_start = None
-                            self.remaining_time = 40
-                            self.warning_played = False
-                        else:
+                        self.core.choose_character(self.selected_character_index)
+                        if self.state == "choose_character":
                             self.selected_character_index = 0
 
-
-
             elif self.state == "select_theme":
-                if self.typing_custom_theme:
-                    if event.type == pygame.KEYDOWN:
-                        if event.key == pygame.K_RETURN:
-                            tema = self.custom_theme_input.strip()
-                            if validation_name(tema):  # ou validation_text
-                                self.current_theme = tema
-                                self.typing_custom_theme = False
-                                self.custom_theme_input = ""
-                                self.state = "roulette"
-                                self.letter_chosen = None
-                                self.timer_start = None
-                                self.remaining_time = 40
-                                self.warning_played = False
-                                self.error_message = ""
-                            else:
-                                self.error_message = "Tema inválido! Use letras, acentos, espaços e hífen."
-                                self.error_message_time = pygame.time.get_ticks() + self.error_message_duration
-                                self.error_alpha = 255
-                                self.error_alpha_direction = -5
-
-
-                        elif event.key == pygame.K_BACKSPACE:
-                            self.custom_theme_input = self.custom_theme_input[:-1]
-
-                        elif hasattr(event, "unicode") and event.unicode.isprintable():
-                            self.custom_theme_input += event.unicode
-
-                else:
-                    if event.type == pygame.KEYDOWN:
-                        if event.key == pygame.K_UP:
-                            self.selected_theme_index = (self.selected_theme_index - 1) % len(self.themes)
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_UP:
+                        self.selected_theme_index = (self.selected_theme_index - 1) % len(self.themes)
 
-                        elif event.key == pygame.K_DOWN:
-                            self.selected_theme_index = (self.selected_theme_index + 1) % len(self.themes)
+                    elif event.key == pygame.K_DOWN:
+                        self.selected_theme_index = (self.selected_theme_index + 1) % len(self.themes)
 
-                        elif event.key == pygame.K_RETURN:
-                            if self.themes[self.selected_theme_index] == "+ Criar nova categoria para a próxima rodada":
-                                self.typing_custom_theme = True
-                                self.custom_theme_input = ""
-                            else:
-                                self.choose_theme(self.selected_theme_index)
-
-                    elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                        mouse_pos = event.pos
-                        for i, rect in enumerate(self.theme_rects):
-                            if rect.collidepoint(mouse_pos):
-                                if self.themes[i] == "+ Criar nova categoria para a próxima rodada":
-                                    self.typing_custom_theme = True
-                                    self.custom_theme_input = ""
-                                else:
-                                    self.choose_theme(i)
-                                break
+                    elif event.key == pygame.K_RETURN:
+                        self.choose_theme(self.selected_theme_index)
 
             elif self.state == "roulette":
-                if not self.letter_chosen:
+                if not self.core.letter_chosen:
                     if event.type == pygame.KEYDOWN:
                         if event.key == pygame.K_LEFT:
                             self.move_letter_index(-1)
                         elif event.key == pygame.K_RIGHT:
                             self.move_letter_index(1)
                         elif event.key == pygame.K_RETURN:
-                            self.select_letter(self.alphabet[self.current_letter_index])
-                        elif event.unicode.upper() in self.alphabet:
-                            self.select_letter(event.unicode.upper())
-
-                    elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                        mouse_pos = event.pos
-                        for i, (letter, rect) in enumerate(self.letter_rects):
-                            if rect.collidepoint(mouse_pos):
-                                self.current_letter_index = self.alphabet.index(letter)
-                                self.select_letter(letter)
-                                break
-            elif self.state == "letter_reveal":
-                self.draw_roulette()  #
-                if time.time() - self.reveal_start_time > 5:
-                    self.timer_start = time.time()
-                    self.state = "answer_input"
-
+                            self.core.select_letter(ALPHABET[self.current_letter_index])
+                        elif event.unicode.upper() in ALPHABET:
+                            self.core.select_letter(event.unicode.upper())
 
             elif self.state == "answer_input":
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_BACKSPACE:
                         self.current_answer = self.current_answer[:-1]
+                        self.answer_changed()
                     elif event.key == pygame.K_RETURN:
-                        is_valid = validate_word(self.current_answer.strip())
-                        if is_valid is True:
-                            self.timer_start = None
-                            self.state = "gameplay"
-                        elif is_valid is False:
-                            print("Palavra inválida!")
-                        else:
-                            print("Não foi possível validar. Iniciando votação offline...")
+                        self.core.submit_answer(self.current_answer)
                     elif hasattr(event, 'unicode') and event.unicode.isalpha():
                         self.current_answer += event.unicode.upper()
+                        self.answer_changed()
 
             elif self.state == "voting":
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_s:
-                        self.votes.append(True)
-                        self.current_voter += 1
+                        self.core.vote(True)
                     elif event.key == pygame.K_n:
-                        self.votes.append(False)
-                        self.current_voter += 1
-
-                    if self.current_voter >= self.vote_required:
-                        self.finish_voting()
-
-                elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    mouse_pos = event.pos
-                    if self.sim_button_rect.collidepoint(mouse_pos):
-                        self.votes.append(True)
-                        self.current_voter += 1
-                        if self.current_voter >= self.vote_required:
-                            self.finish_voting()
-
-                    elif self.nao_button_rect.collidepoint(mouse_pos):
-                        self.votes.append(False)
-                        self.current_voter += 1
-                        if self.current_voter >= self.vote_required:
-                            self.finish_voting()
-
-                    elif hasattr(event, "unicode") and event.unicode.isalpha():
-                        self.current_answer += event.unicode.upper()
-
-                    if self.current_voter >= self.vote_required:
-                        self.finish_voting()
+                        self.core.vote(False)
+                    elif event.key in self.vote_keys:
+                        self.core.vote(self.vote_keys[event.key][1], self.vote_keys[event.key][0])
+
+                elif event.type == pygame.JOYBUTTONDOWN:
+                    seat = self.joystick_seat(event.instance_id)
+                    if seat is not None and event.button == config.VOTE_JOYSTICK_YES:
+                        self.core.vote(True, seat)
+                    elif seat is not None and event.button == config.VOTE_JOYSTICK_NO:
+                        self.core.vote(False, seat)
+
+                elif event.type == VOTE_EVENT:
+                    self.core.vote(event.approve, event.seat)
+
+    def click(self, pos):
+        """Clique do mouse: o layout do estado diz qual widget está no ponto."""
+        widget = self.layout().hit(pos)
+        if widget is None:
+            return
+        kind, value = widget
+        if kind == "theme":
+            self.choose_theme(value)
+        elif kind == "letter" and not self.core.letter_chosen:
+            self.current_letter_index = value
+            self.core.select_letter(ALPHABET[value])
+        elif kind == "vote":
+            self.core.vote(value)
+
+    def layout(self):
+        """Layout do estado atual, calculado uma vez por (estado, tamanho da tela, conteúdo)."""
+        size = self.screen.get_size()
+        if self.state == "select_theme" and not self.typing_custom_theme:
+            return self.layouts.get(("select_theme", size, tuple(self.themes)), self.build_theme_layout)
+        if self.state in ("roulette", "letter_reveal"):
+            return self.layouts.get(("roulette", size), self.build_roulette_layout)
+        if self.state == "voting":
+            return self.layouts.get(("voting", size), self.build_voting_layout)
+        return self.layouts.get(("empty", size), lambda layout: None)
+
+    def build_theme_layout(self, layout):
+        # Um retângulo por tema, do tamanho do texto, centralizado na linha dele
+        font_comics = self.fonts.get("comicsansms", 42)
+        center_x = self.screen.get_width() // 2
+        for i, theme in enumerate(self.themes):
+            rect = pygame.Rect((0, 0), font_comics.size(theme))
+            rect.center = (center_x, 150 + i * 50)
+            layout.add(("theme", i), rect)
+
+    def build_roulette_layout(self, layout):
+        atlas = self.glyph_atlases.get(self.font, (200, 200, 200))
+        rects = [pygame.Rect(self.letter_position(i), atlas.size(letter)) for i, letter in enumerate(ALPHABET)]
+        pitch = (self.LETTER_PITCH, self.LETTER_PITCH)
+        layout.add_grid("letter", Grid(self.LETTER_ORIGIN, pitch, self.LETTER_COLUMNS, rects))
+
+    def build_voting_layout(self, layout):
+        button_width, button_height = 120, 50
+        screen_center_x = self.screen.get_width() // 2
+        button_y = 450
+        layout.add(("vote", True), (screen_center_x - button_width - 20, button_y, button_width, button_height))
+        layout.add(("vote", False), (screen_center_x + 20, button_y, button_width, button_height))
 
+    def joystick_seat(self, instance_id):
+        if instance_id not in self.joysticks:
+            return None
+        seat = sorted(self.joysticks).index(instance_id)
+        return seat if seat < self.core.max_players else None
 
     def move_letter_index(self, direction):
-        self.current_letter_index = (self.current_letter_index + direction) % len(self.alphabet)
-
-    def update_timer(self):
-        if self.letter_chosen and self.timer_start:
-            elapsed = time.time() - self.timer_start
-            self.remaining_time = max(0, 40 - elapsed)
-
-            if self.remaining_time <= 5 and not self.warning_played:
-                self.play_warning_sound()
-                self.warning_played = True
-
-            if self.remaining_time <= 0:
-                self.next_turn()
+        self.current_letter_index = (self.current_letter_index + direction) % len(ALPHABET)
 
     def play_warning_sound(self):
-        self.channel.play(self.warning_sound)
-        self.play_next_after_warning = True
+        self.audio.play("warning", then="next_sound")
 
     def play_choice_sound(self):
-        self.channel.play(self.choice_letter)
-
-    def select_letter(self, letter):
-        if letter not in self.used_letters:
-            self.letter_chosen = letter
-            self.used_letters.add(letter)
-            self.current_letter = letter
-            self.current_answer = ""
-            self.reveal_start_time = time.time()
-            self.timer_start = time.time()
-            self.state = "letter_reveal"
-            self.warning_played = False
-            self.play_choice_sound()
-
-    def process_answer(self):
-        if self.current_answer.strip():
-            word = self.current_answer.strip().lower()
-
-            # Valida palavra no dicionário
-            is_valid = validate_word(word)
-            if is_valid is None:
-                print("Não foi possível validar. Iniciando votação offline...")
-                self.start_voting(word)
-                return
+        self.audio.play("choice_letter")
 
-            if not is_valid:
-                # Palavra inválida no dicionário, perde pontos e passa a vez
-                self.scores[self.current_player_turn] -= 10
-                print(
-                    f"Palavra '{word}' inválida! Jogador {self.players[self.current_player_turn]['name']} perde 10 pontos.")
-                self.next_turn()
-                return
-
-            # Palavra válida, inicia votação para validar tema
-            self.start_voting(word)
-
-    def finish_voting(self):
-        # Se a maioria aprovou
-        approved = sum(self.votes) > (self.vote_required / 2)
-        player_name = self.players[self.current_player_turn]['name']
-        word = self.voting_word
-
-        if approved:
-            self.scores[self.current_player_turn] += 10
-            print(f"Palavra '{word}' aprovada pelos jogadores! +10 pontos para {player_name}")
-
-            # Jogador pode escolher próxima letra sem perder a vez
-            self.letter_chosen = None
-            self.current_letter = None
-            self.current_answer = ""
-            self.timer_start = None
-            self.remaining_time = 40
-            self.warning_played = False
-            self.state = "roulette"
+    def start_validation(self, word):
+        if self.speculative_word == word and not self.speculative_future.cancelled():
+            # Já foi pedida enquanto o jogador digitava
+            self.pending_validation = self.speculative_future
         else:
-            print(f"Palavra '{word}' rejeitada pelos jogadores! Vez passa para o próximo jogador.")
-            self.scores[self.current_player_turn] -= 10
-            self.next_turn()
-
-        self.voting_word = None
-        self.votes = []
-        self.vote_required = 0
-        self.current_voter = 0
-        self.vote_result = None
-        self.vote_start_time = None
-
-    def next_turn(self):
-        self.current_player_turn = (self.current_player_turn + 1) % self.max_players
-        self.letter_chosen = None
-        self.current_letter = None
-        self.current_answer = ""
-        self.timer_start = None
-        self.remaining_time = 40
-        self.warning_played = False
-        self.state = "roulette"
-
-    def draw_select_player_count(self):
-        title_font = pygame.font.SysFont("comicsansms", 42, bold=True)
-        title = title_font.render("Quantos players no squad?", True, (255, 255, 255))
+            self.pending_validation = self.validation_worker.submit(word)
+        self.speculative_future = None
+        self.speculative_word = None
+
+    def answer_changed(self):
+        self.last_keystroke_time = self.now()
+        self.cancel_speculative_validation()
+
+    def cancel_speculative_validation(self):
+        if self.speculative_future is not None:
+            # Só cancela se ainda estiver na fila; se já rodou, o resultado fica no cache
+            self.speculative_future.cancel()
+        self.speculative_future = None
+        self.speculative_word = None
+
+    def update_speculative_validation(self):
+        if not config.SPECULATIVE_VALIDATION:
+            return
+
+        word = ValidationWorker.normalize(self.current_answer)
+        if len(word) < 2 or word == self.speculative_word:
+            return
+        if not self.core.current_letter or not word.startswith(self.core.current_letter.lower()):
+            return
+        if (self.now() - self.last_keystroke_time) * 1000 < config.SPECULATIVE_DEBOUNCE_MS:
+            return
+
+        self.speculative_word = word
+        self.speculative_future = self.validation_worker.submit(word)
+
+    def check_validation(self):
+        future = self.pending_validation
+        if future is None or not future.done():
+            return
+
+        self.pending_validation = None
+        # Falha na validação (ex.: erro no cache em disco) vira "não deu para saber": votação offline
+        self.core.validation_result(None if future.cancelled() or future.exception() else future.result())
+
+    def static_layer(self):
+        """Retorna (chave, compose) da camada estática do estado atual."""
+        if self.state == "select_player_count":
+            return ("select_player_count",), self.compose_select_player_count
+        if self.state == "get_names":
+            names = tuple(player.name for player in self.core.players)
+            return ("get_names", self.core.current_input, names), self.compose_name_input
+        if self.state == "choose_character":
+            return ("choose_character", self.core.current_input, self.core.max_players), self.compose_character_selection
+        if self.state == "select_theme":
+            return (
+                ("select_theme", self.core.current_player_turn, self.typing_custom_theme),
+                self.compose_theme_selection,
+            )
+        if self.state in ("roulette", "letter_reveal"):
+            return (
+                ("roulette", self.core.current_player_turn, tuple(self.core.scores), self.core.letter_chosen, self.core.current_theme),
+                self.compose_roulette,
+            )
+        if self.state in ("answer_input", "validating"):
+            return (
+                ("answer_input", self.core.current_player_turn, self.core.current_letter, self.core.current_theme),
+                self.compose_answer_input,
+            )
+        if self.state == "voting":
+            return (
+                ("voting", self.core.voting_word, tuple(sorted(self.core.ballots)), len(self.joysticks)),
+                self.compose_voting,
+            )
+        return ("background",), self.compose_background
+
+    def draw(self):
+        # Camada estática do estado (composta uma vez) + partes dinâmicas por cima
+        layer = self.layers.get(*self.static_layer())
+        self.dirty.begin(self.screen, layer)
+
+        if self.state == "get_names":
+            self.draw_name_input()
+        elif self.state == "choose_character":
+            self.draw_character_selection()
+        elif self.state == "select_theme":
+            self.draw_theme_selection()
+        elif self.state in ("roulette", "letter_reveal"):
+            self.draw_roulette()
+        elif self.state in ("answer_input", "validating"):
+            self.draw_answer_input()
+        elif self.state == "voting":
+            self.draw_voting()
+
+        self.dirty.add(self.profiler_overlay.draw(self.screen, self.state, self.frames.clock.get_fps()))
+        self.profiler.mark("draw")
+
+        # Só as regiões alteradas vão para a tela (ou tudo, se a camada mudou)
+        self.dirty.present(self.viewport, self.screen)
+        self.profiler.mark("present")
+
+    def compose_background(self, surface):
+        surface.blit(self.background, (0, 0))
+
+    def draw_error_message(self, center):
+        if self.error_message:
+            font = self.fonts.get("comicsansms", 28, bold=True)
+            text_surface = font.render(self.error_message, True, (255, 50, 50))
+            text_surface.set_alpha(int(self.tweens.value("error_fade", 255)))
+
+            text_rect = text_surface.get_rect(center=center)
+            self.dirty.add(self.screen.blit(text_surface, text_rect))
+
+    def compose_select_player_count(self, surface):
+        surface.blit(self.background, (0, 0))
+
+        title_font = self.fonts.get("comicsansms", 42, bold=True)
+        title = self.text_cache.render(title_font, "Quantos players no squad?", True, (255, 255, 255))
         title_rect = title.get_rect(center=(config.SCREEN_WIDTH // 2, 150))
-        self.screen.blit(title, title_rect)
+        surface.blit(title, title_rect)
 
-        instruction_font = pygame.font.SysFont("comicsansms", 28, bold=True)
-        instruction = instruction_font.render("Pressione [2], [3] ou [4] para definir os participantes.",
-                                              True, (200, 200, 0))
+        instruction_font = self.fonts.get("comicsansms", 28, bold=True)
+        instruction = self.text_cache.render(
+            instruction_font, "Pressione [2], [3] ou [4] para definir os participantes.", True, (200, 200, 0)
+        )
         instruction_rect = instruction.get_rect(center=(config.SCREEN_WIDTH // 2, 250))
-        self.screen.blit(instruction, instruction_rect)
+        surface.blit(instruction, instruction_rect)
 
-    def draw_name_input(self):
-        title_font = pygame.font.SysFont("comicsansms", 40, bold=True)
-        game_title = title_font.render("Roda das Letras", True, (255, 255, 255))
+    def name_input_box_rect(self):
+        box_width, box_height = 400, 50
+        return pygame.Rect((config.SCREEN_WIDTH - box_width) // 2, 230, box_width, box_height)
+
+    def compose_name_input(self, surface):
+        surface.blit(self.background, (0, 0))
+
+        title_font = self.fonts.get("comicsansms", 40, bold=True)
+        game_title = self.text_cache.render(title_font, "Roda das Letras", True, (255, 255, 255))
         game_title_rect = game_title.get_rect(center=(config.SCREEN_WIDTH // 2, 80))
-        self.screen.blit(game_title, game_title_rect)
+        surface.blit(game_title, game_title_rect)
 
-        prompt_font = pygame.font.SysFont("comicsansms", 28, bold=True)
-        prompt_text = prompt_font.render(
-            f"{self.current_input + 1}º Jogador, digite seu apelido:", True, (255, 255, 255)
+        prompt_font = self.fonts.get("comicsansms", 28, bold=True)
+        prompt_text = self.text_cache.render(
+            prompt_font, f"{self.core.current_input + 1}º Jogador, digite seu apelido:", True, (255, 255, 255)
         )
         prompt_rect = prompt_text.get_rect(center=(config.SCREEN_WIDTH // 2, 180))
-        self.screen.blit(prompt_text, prompt_rect)
-
-        box_width, box_height = 400, 50
-        input_box_rect = pygame.Rect(
-            (config.SCREEN_WIDTH - box_width) // 2, 230, box_width, box_height
-        )
-
-        pygame.draw.rect(self.screen, (50, 50, 50), input_box_rect, border_radius=8)
-        pygame.draw.rect(self.screen, (255, 255, 0), input_box_rect, 3, border_radius=8)
+        surface.blit(prompt_text, prompt_rect)
 
-        input_text = self.font.render(self.input_boxes[self.current_input], True, (255, 255, 0))
-        input_text_rect = input_text.get_rect(center=input_box_rect.center)
-        self.screen.blit(input_text, input_text_rect)
+        input_box_rect = self.name_input_box_rect()
+        pygame.draw.rect(surface, (50, 50, 50), input_box_rect, border_radius=8)
+        pygame.draw.rect(surface, (255, 255, 0), input_box_rect, 3, border_radius=8)
 
-        list_title = self.font.render("Jogadores cadastrados:", True, (200, 200, 200))
-        self.screen.blit(list_title, (50, 330))
+        list_title = self.text_cache.render(self.font, "Jogadores cadastrados:", True, (200, 200, 200))
+        surface.blit(list_title, (50, 330))
 
         y = 370
-        for idx, player in enumerate(self.players):
-            player_text = self.font.render(f"{idx + 1}. {player['name']}", True, (180, 180, 180))
-            self.screen.blit(player_text, (70, y))
+        for idx, player in enumerate(self.core.players):
+            player_text = self.text_cache.render(self.font, f"{idx + 1}. {player.name}", True, (180, 180, 180))
+            surface.blit(player_text, (70, y))
             y += 30
 
-        current_time = pygame.time.get_ticks()
-        if self.error_message and current_time < self.error_message_time:
-            self.error_alpha += self.error_alpha_direction
-            if self.error_alpha <= 50 or self.error_alpha >= 255:
-                self.error_alpha_direction *= -1
-                self.error_alpha = max(50, min(255, self.error_alpha))
+    def draw_name_input(self):
+        input_text = self.text_cache.render(self.font, self.input_boxes[self.core.current_input], True, (255, 255, 0))
+        input_text_rect = input_text.get_rect(center=self.name_input_box_rect().center)
+        self.dirty.add(self.screen.blit(input_text, input_text_rect))
 
-            font = pygame.font.SysFont("comicsansms", 28, bold=True)
-            text_surface = font.render(self.error_message, True, (255, 50, 50))
-            text_surface.set_alpha(self.error_alpha)
+        self.draw_error_message((config.SCREEN_WIDTH // 2, 300))
 
-            text_rect = text_surface.get_rect(center=(config.SCREEN_WIDTH // 2, 300))
-            self.screen.blit(text_surface, text_rect)
+    def character_positions(self):
+        spacing_x = 150
+        total_width = self.core.max_players * spacing_x
+        start_x = (config.SCREEN_WIDTH - total_width) // 2
+        y_img = 150
+        return [(start_x + i * spacing_x, y_img) for i in range(self.core.max_players)]
+
+    def character_image(self, player_index):
+        character = self.core.players[player_index].character
+        return None if character is None else self.character_images[character]
+
+    def compose_character_selection(self, surface):
+        surface.blit(self.background, (0, 0))
 
-    def draw_character_selection(self):
         rect_x, rect_y, rect_w, rect_h = 80, 40, 800, 60
-        pygame.draw.rect(self.screen, (20, 20, 60), (rect_x, rect_y, rect_w, rect_h), border_radius=10)
+        pygame.draw.rect(surface, (20, 20, 60), (rect_x, rect_y, rect_w, rect_h), border_radius=10)
 
-        title_font = pygame.font.SysFont("comicsansms", 42, bold=True)
-        player_name = self.players[self.current_input]["name"]
+        title_font = self.fonts.get("comicsansms", 42, bold=True)
+        player_name = self.core.players[self.core.current_input].name
         title_text = f"{player_name}, Quem é o mestre das palavras?"
-        title_surface = title_font.render(title_text, True, (255, 255, 255))
+        title_surface = self.text_cache.render(title_font, title_text, True, (255, 255, 255))
 
         title_rect = title_surface.get_rect()
         title_rect.centery = rect_y + rect_h // 2
         title_rect.x = rect_x + 20
 
-        self.screen.blit(title_surface, title_rect)
-
-        font_comics = pygame.font.SysFont("comicsansms", 28)
-
-        spacing_x = 150
-        total_width = self.max_players * spacing_x
-        start_x = (config.SCREEN_WIDTH - total_width) // 2
+        surface.blit(title_surface, title_rect)
 
-        y_img = 150
+        font_comics = self.fonts.get("comicsansms", 28)
 
         # 1. Desenha as imagens centralizadas horizontalmente
-        for i, img in enumerate(self.character_images[:self.max_players]):
-            x = start_x + i * spacing_x
-
-            # retângulo amarelo para seleção
-            if i == self.selected_character_index:
-                pygame.draw.rect(self.screen, (255, 255, 0), (x - 5, y_img - 5, 74, 74), 3)
-
-            self.screen.blit(img, (x, y_img))
+        positions = self.character_positions()
+        for img, (x, y_img) in zip(self.character_images, positions):
+            surface.blit(img, (x, y_img))
 
         # 2. Define posição do texto como coluna vertical abaixo das imagens, centralizada na tela
-        y_text_start = y_img + 100  # distância vertical para começar a lista de nomes
+        y_text_start = positions[0][1] + 100  # distância vertical para começar a lista de nomes
         text_x_center = config.SCREEN_WIDTH // 2  # centro horizontal da tela
 
-        for i in range(len(self.players)):
-            player_name = self.players[i]["name"]
+        for i in range(len(self.core.players)):
+            player_name = self.core.players[i].name
             text_str = f"Jogador {i + 1}: {player_name}"
-            if self.players[i]["character"] is not None:
+            if self.core.players[i].character is not None:
                 text_str += " ✔"
 
-            text_surface = font_comics.render(text_str, True, (180, 180, 180))
+            text_surface = self.text_cache.render(font_comics, text_str, True, (180, 180, 180))
 
             # Posição Y para cada texto (espacamento 35px)
             y_text = y_text_start + i * 35
 
             # Centraliza o texto na tela
             text_rect = text_surface.get_rect(center=(text_x_center, y_text))
-            self.screen.blit(text_surface, text_rect)
+            surface.blit(text_surface, text_rect)
+
+    def draw_character_selection(self):
+        # retângulo amarelo para seleção
+        x, y_img = self.character_positions()[self.selected_character_index]
+        self.dirty.add(pygame.draw.rect(self.screen, (255, 255, 0), (x - 5, y_img - 5, 74, 74), 3))
+
+    def compose_theme_selection(self, surface):
+        surface.blit(self.background, (0, 0))
 
-    def draw_theme_selection(self):
         # Fonte padrão
-        font_comics = pygame.font.SysFont("comicsansms", 42)
+        font_comics = self.fonts.get("comicsansms", 42)
 
         # --- Fundo da pergunta centralizado no topo ---
         question_rect_x, question_rect_y = 80, 40
         question_rect_w, question_rect_h = 800, 60
-        pygame.draw.rect(self.screen, (20, 20, 60),
+        pygame.draw.rect(surface, (20, 20, 60),
                          (question_rect_x, question_rect_y, question_rect_w, question_rect_h), border_radius=10)
 
         # --- Imagem do personagem no canto superior direito ---
-        player = self.players[self.current_player_turn]
-        player_img = player["character"]
+        player = self.core.players[self.core.current_player_turn]
+        # Os retratos já vêm em 64x64 do AssetManager
+        player_img = self.character_image(self.core.current_player_turn)
         img_size = 64
-        img_scaled = pygame.transform.scale(player_img, (img_size, img_size))
 
-        img_x = self.screen.get_width() - img_size - 20  # 20 de margem da direita
+        img_x = surface.get_width() - img_size - 20  # 20 de margem da direita
         img_y = 20  # margem superior
-        self.screen.blit(img_scaled, (img_x, img_y))
+        surface.blit(player_img, (img_x, img_y))
 
         # Nome do jogador abaixo da imagem, centralizado abaixo da imagem
-        name_text = font_comics.render(player["name"], True, (255, 255, 255))
+        name_text = self.text_cache.render(font_comics, player.name, True, (255, 255, 255))
         name_rect = name_text.get_rect(center=(img_x + img_size // 2, img_y + img_size + 20))
-        self.screen.blit(name_text, name_rect)
+        surface.blit(name_text, name_rect)
 
         # --- Texto "Escolha ou digite um tema" centralizado na tela ---
-        choose_text = font_comics.render("Qual categoria vamos detonar agora?", True, (255, 255, 255))
-        choose_rect = choose_text.get_rect(center=(self.screen.get_width() // 2, question_rect_y + 15))
-        self.screen.blit(choose_text, choose_rect)
+        choose_text = self.text_cache.render(font_comics, "Qual categoria vamos detonar agora?", True, (255, 255, 255))
+        choose_rect = choose_text.get_rect(center=(surface.get_width() // 2, question_rect_y + 15))
+        surface.blit(choose_text, choose_rect)
 
         # --- Área principal (meio da tela) ---
-        center_x = self.screen.get_width() // 2
+        center_x = surface.get_width() // 2
         base_y = 150  # começa a partir dessa altura
 
         if self.typing_custom_theme:
-            # Mostra prompt e input centralizados
-            input_prompt = font_comics.render("Qual o desafio de hoje? Defina o tema!", True, (255, 255, 0))
+            # Mostra o prompt centralizado (a caixa de texto é dinâmica)
+            input_prompt = self.text_cache.render(
+                font_comics, "Qual o desafio de hoje? Defina o tema!", True, (255, 255, 0)
+            )
             prompt_rect = input_prompt.get_rect(center=(center_x, base_y))
-            self.screen.blit(input_prompt, prompt_rect)
+            surface.blit(input_prompt, prompt_rect)
+        else:
+            # Lista de temas centralizada (o destaque amarelo é desenhado por cima)
+            layout = self.layout()
+            for i, theme in enumerate(self.themes):
+                theme_text = self.text_cache.render(font_comics, theme, True, (200, 200, 200))
+                surface.blit(theme_text, layout.rect(("theme", i)))
 
-            input_text = font_comics.render(self.custom_theme_input or " ", True, (255, 255, 255))
+    def draw_theme_selection(self):
+        font_comics = self.fonts.get("comicsansms", 42)
+        center_x = self.screen.get_width() // 2
+        base_y = 150
+
+        if self.typing_custom_theme:
+            input_text = self.text_cache.render(font_comics, self.custom_theme_input or " ", True, (255, 255, 255))
 
             # Define padding e altura fixa
             padding_x = 20
@@ -602,113 +829,130 @@ class Game:
             input_box_rect = pygame.Rect(0, 0, box_width, box_height)
             input_box_rect.center = (center_x, base_y + 60)
 
-            pygame.draw.rect(self.screen, (50, 50, 50), input_box_rect)
+            self.dirty.add(pygame.draw.rect(self.screen, (50, 50, 50), input_box_rect))
             pygame.draw.rect(self.screen, (255, 255, 0), input_box_rect, 2)
-            self.screen.blit(input_text, (input_box_rect.x + 10, input_box_rect.y + 5))
+            self.dirty.add(self.screen.blit(input_text, (input_box_rect.x + 10, input_box_rect.y + 5)))
         else:
-            # Lista de temas centralizada
-            self.theme_rects = []
-            for i, theme in enumerate(self.themes):
-                color = (255, 255, 0) if i == self.selected_theme_index else (200, 200, 200)
-                theme_text = font_comics.render(theme, True, color)
-                theme_rect = theme_text.get_rect(center=(center_x, base_y + i * 50))
-                self.screen.blit(theme_text, theme_rect)
-                self.theme_rects.append(theme_rect)
-
-        current_time = pygame.time.get_ticks()
-        if self.error_message and current_time < self.error_message_time:
-            self.error_alpha += self.error_alpha_direction
-            if self.error_alpha <= 50 or self.error_alpha >= 255:
-                self.error_alpha_direction *= -1
-                self.error_alpha = max(50, min(255, self.error_alpha))
-
-            font = pygame.font.SysFont("comicsansms", 28, bold=True)
-            text_surface = font.render(self.error_message, True, (255, 50, 50))
-            text_surface.set_alpha(self.error_alpha)
+            # Tema selecionado em amarelo, sobre o fundo limpo
+            theme = self.themes[self.selected_theme_index]
+            theme_rect = self.layout().rect(("theme", self.selected_theme_index))
+            theme_text = self.text_cache.render(font_comics, theme, True, (255, 255, 0))
+            self.screen.blit(self.background, theme_rect, theme_rect)
+            self.dirty.add(self.screen.blit(theme_text, theme_rect))
 
-            text_rect = text_surface.get_rect(center=(center_x, base_y + 130))
-            self.screen.blit(text_surface, text_rect)
+        self.draw_error_message((center_x, base_y + 130))
 
     def choose_theme(self, index):
-        self.current_theme = self.themes[index]
-        self.state = "roulette"
-        self.letter_chosen = None
-        self.timer_start = None
-        self.remaining_time = 40
-        self.warning_played = False
+        if self.themes[index] == "+ Criar nova categoria para a próxima rodada":
+            self.typing_custom_theme = True
+            self.custom_theme_input = ""
+        else:
+            self.core.choose_theme(self.themes[index])
 
-    def draw_roulette(self):
-        self.letter_rects = []
+    def letter_position(self, i):
+        row, col = divmod(i, self.LETTER_COLUMNS)
+        return self.LETTER_ORIGIN[0] + col * self.LETTER_PITCH, self.LETTER_ORIGIN[1] + row * self.LETTER_PITCH
+
+    def compose_roulette(self, surface):
+        surface.blit(self.background, (0, 0))
 
         # Exibe pontuação de todos os jogadores no topo esquerdo
-        font_scores = pygame.font.SysFont("comicsansms", 24)
+        font_scores = self.fonts.get("comicsansms", 24)
         x_start = 30
         y_start = 130
         spacing_y = 30
 
-        for i, player in enumerate(self.players):
-            score_text = f"{player['name']}: {self.scores[i]} pts"
-            color = (255, 255, 0) if i == self.current_player_turn else (200, 200, 200)
-            score_surface = font_scores.render(score_text, True, color)
-            self.screen.blit(score_surface, (x_start, y_start + i * spacing_y))
+        for i, player in enumerate(self.core.players):
+            score_text = f"{player.name}: {self.core.scores[i]} pts"
+            color = (255, 255, 0) if i == self.core.current_player_turn else (200, 200, 200)
+            score_surface = self.text_cache.render(font_scores, score_text, True, color)
+            surface.blit(score_surface, (x_start, y_start + i * spacing_y))
 
         # Fundo de título
-        pygame.draw.rect(self.screen, (20, 20, 60), (80, 40, 800, 60), border_radius=10)
-        title_font = pygame.font.SysFont("comicsansms", 42, bold=True)
+        pygame.draw.rect(surface, (20, 20, 60), (80, 40, 800, 60), border_radius=10)
+        title_font = self.fonts.get("comicsansms", 42, bold=True)
         title_text = "Role a sorte: escolha sua letra"
-        title_surface = title_font.render(title_text, True, (255, 255, 255))
+        title_surface = self.text_cache.render(title_font, title_text, True, (255, 255, 255))
         title_rect = title_surface.get_rect(center=(config.SCREEN_WIDTH // 2, 70))
-        self.screen.blit(title_surface, title_rect)
+        surface.blit(title_surface, title_rect)
 
         # Imagem do personagem no canto superior direito
-        character_img = self.players[self.current_player_turn]["character"]
+        character_img = self.character_image(self.core.current_player_turn)
         if character_img:
             img_rect = character_img.get_rect(topright=(config.SCREEN_WIDTH - 30, 30))
-            self.screen.blit(character_img, img_rect)
+            surface.blit(character_img, img_rect)
 
             # Nome do jogador abaixo da imagem
-            name_surface = self.font.render(self.players[self.current_player_turn]["name"], True, (255, 255, 0))
+            name_surface = self.text_cache.render(
+                self.font, self.core.players[self.core.current_player_turn].name, True, (255, 255, 0)
+            )
             name_rect = name_surface.get_rect(topright=(config.SCREEN_WIDTH - 40, img_rect.bottom + 10))
-            self.screen.blit(name_surface, name_rect)
+            surface.blit(name_surface, name_rect)
 
-        # Letras da roleta
-        for i, letter in enumerate(self.alphabet):
-            color = (255, 255, 0) if i == self.current_letter_index else (200, 200, 200)
-            letter_surface = self.font.render(letter, True, color)
-            rect = letter_surface.get_rect(topleft=(50 + (i % 13) * 70, 300 + (i // 13) * 70))
-            self.screen.blit(letter_surface, rect)
-            self.letter_rects.append((letter, rect))
+        # Letras da roleta, todas em cinza (o destaque é desenhado por cima)
+        atlas = self.glyph_atlases.get(self.font, (200, 200, 200))
+        for i, letter in enumerate(ALPHABET):
+            atlas.draw(surface, letter, self.letter_position(i))
 
-        if self.letter_chosen:
+        if self.core.letter_chosen:
             screen_center_x = config.SCREEN_WIDTH // 2
             screen_height = config.SCREEN_HEIGHT
 
             # Mensagem de destaque (mais abaixo)
-            msg_font = pygame.font.SysFont("comicsansms", 36)
-            msg_text = msg_font.render("Letra sorteada!", True, (255, 255, 255))
+            msg_font = self.fonts.get("comicsansms", 36)
+            msg_text = self.text_cache.render(msg_font, "Letra sorteada!", True, (255, 255, 255))
             msg_rect = msg_text.get_rect(center=(screen_center_x, screen_height - 260))
-            self.screen.blit(msg_text, msg_rect)
-
-            # Letra escolhida grande no centro inferior
-            big_font = pygame.font.SysFont("comicsansms", 100, bold=True)
-            letter_text = big_font.render(self.letter_chosen, True, (255, 255, 0))
-            letter_rect = letter_text.get_rect(center=(screen_center_x, screen_height - 170))
-            self.screen.blit(letter_text, letter_rect)
+            surface.blit(msg_text, msg_rect)
 
             # Tema atual abaixo da letra
-            theme_font = pygame.font.SysFont("comicsansms", 30, bold=True)
-            theme_text = theme_font.render(f"Tópico da Rodada: {self.current_theme}", True, (255, 255, 255))
+            theme_font = self.fonts.get("comicsansms", 30, bold=True)
+            theme_text = self.text_cache.render(
+                theme_font, f"Tópico da Rodada: {self.core.current_theme}", True, (255, 255, 255)
+            )
             theme_rect = theme_text.get_rect(center=(screen_center_x, screen_height - 70))
-            self.screen.blit(theme_text, theme_rect)
+            surface.blit(theme_text, theme_rect)
+
+    def draw_roulette(self):
+        # Letra destacada em amarelo, sobre o fundo limpo (girando logo após a escolha)
+        index = int(self.tweens.value("roulette_spin", self.current_letter_index)) % len(ALPHABET)
+        letter = ALPHABET[index]
+        atlas = self.glyph_atlases.get(self.font, (255, 255, 0))
+        rect = self.layout().grids["letter"].item_rects[index]
+        self.screen.blit(self.background, rect, rect)
+        self.dirty.add(atlas.draw(self.screen, letter, rect.topleft))
+
+        if self.core.letter_chosen:
+            # Letra escolhida grande no centro inferior, crescendo quando a roleta para
+            scale = self.tweens.value("letter_pop", 1.0)
+            if scale <= 0.01:
+                return
+            big_font = self.fonts.get("comicsansms", 100, bold=True)
+            letter_text = self.text_cache.render(big_font, self.core.letter_chosen, True, (255, 255, 0))
+            if scale != 1.0:
+                letter_text = pygame.transform.rotozoom(letter_text, 0, scale)
+            letter_rect = letter_text.get_rect(center=(config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT - 170))
+            self.dirty.add(self.screen.blit(letter_text, letter_rect))
+
+    def answer_input_box_rect(self):
+        # Mesma conta de compose_answer_input: a caixa fica abaixo do tema, do título e da letra
+        theme_font = self.fonts.get("comicsansms", 30, bold=True)
+        box_height = theme_font.size(f"Tópico da Rodada: {self.core.current_theme}")[1] + 10 * 2
+        y_offset = 30 + box_height + 60
+        input_box_width = 600
+        input_box_height = 50
+        input_box_x = (config.SCREEN_WIDTH - input_box_width) // 2
+        return pygame.Rect(input_box_x, y_offset + 180, input_box_width, input_box_height)
+
+    def compose_answer_input(self, surface):
+        surface.blit(self.background, (0, 0))
 
-    def draw_answer_input(self):
         screen_center_x = config.SCREEN_WIDTH // 2
-        screen_height = config.SCREEN_HEIGHT
-        font_comics = pygame.font.SysFont("comicsansms", 32)
 
         # Tema atual com fundo amarelo destacado
-        theme_font = pygame.font.SysFont("comicsansms", 30, bold=True)
-        theme_text = theme_font.render(f"Tópico da Rodada: {self.current_theme}", True, (255, 255, 255))  # branco
+        theme_font = self.fonts.get("comicsansms", 30, bold=True)
+        theme_text = self.text_cache.render(
+            theme_font, f"Tópico da Rodada: {self.core.current_theme}", True, (255, 255, 255)
+        )  # branco
 
         padding_x, padding_y = 20, 10
         box_width = theme_text.get_width() + padding_x * 2
@@ -717,116 +961,140 @@ class Game:
         box_y = 30
         theme_box_rect = pygame.Rect(box_x, box_y, box_width, box_height)
 
-        pygame.draw.rect(self.screen, (20, 20, 60), theme_box_rect, border_radius=12)
-        self.screen.blit(theme_text, (box_x + padding_x, box_y + padding_y))
+        pygame.draw.rect(surface, (20, 20, 60), theme_box_rect, border_radius=12)
+        surface.blit(theme_text, (box_x + padding_x, box_y + padding_y))
 
         # Espaçamento após o tema
         y_offset = box_y + box_height + 60
 
         # Frase principal estilizada (nome + letra) — maior, amarela, centralizada mais para baixo
-        title_font = pygame.font.SysFont("comicsansms", 40, bold=True)
-        title_text = f"{self.players[self.current_player_turn]['name']}, a palavra da vez é com"
-        title_surface = title_font.render(title_text, True, (255, 255, 0))  # amarelo
+        title_font = self.fonts.get("comicsansms", 40, bold=True)
+        title_text = f"{self.core.players[self.core.current_player_turn].name}, a palavra da vez é com"
+        title_surface = self.text_cache.render(title_font, title_text, True, (255, 255, 0))  # amarelo
         title_rect = title_surface.get_rect(center=(screen_center_x, y_offset))
-        self.screen.blit(title_surface, title_rect)
+        surface.blit(title_surface, title_rect)
 
         # Letra destacada logo abaixo, grande e amarela (igual a parte da letra sorteada)
-        big_font = pygame.font.SysFont("comicsansms", 100, bold=True)
-        letter_surface = big_font.render(self.current_letter, True, (255, 255, 0))
+        big_font = self.fonts.get("comicsansms", 100, bold=True)
+        letter_surface = self.text_cache.render(big_font, self.core.current_letter, True, (255, 255, 0))
         letter_rect = letter_surface.get_rect(center=(screen_center_x, y_offset + 80))
-        self.screen.blit(letter_surface, letter_rect)
+        surface.blit(letter_surface, letter_rect)
 
         # Caixa para input (com borda e fundo escuro)
-        input_box_width = 600
-        input_box_height = 50
-        input_box_x = (config.SCREEN_WIDTH - input_box_width) // 2
-        input_box_y = y_offset + 180
+        input_box_rect = self.answer_input_box_rect()
+        pygame.draw.rect(surface, (30, 30, 30), input_box_rect, border_radius=8)  # fundo escuro
+        pygame.draw.rect(surface, (255, 255, 0), input_box_rect, 3, border_radius=8)  # borda amarela
 
-        input_box_rect = pygame.Rect(input_box_x, input_box_y, input_box_width, input_box_height)
-        pygame.draw.rect(self.screen, (30, 30, 30), input_box_rect, border_radius=8)  # fundo escuro
-        pygame.draw.rect(self.screen, (255, 255, 0), input_box_rect, 3, border_radius=8)  # borda amarela
+    def draw_answer_input(self):
+        screen_center_x = config.SCREEN_WIDTH // 2
+        input_box_rect = self.answer_input_box_rect()
 
         # Texto dentro da caixa (resposta atual)
-        answer_surface = self.font.render(self.current_answer, True, (255, 255, 0))
-        answer_pos = (input_box_x + 10, input_box_y + (input_box_height - answer_surface.get_height()) // 2)
-        self.screen.blit(answer_surface, answer_pos)
+        answer_atlas = self.glyph_atlases.get(self.font, (255, 255, 0))
+        answer_width, answer_height = answer_atlas.size(self.current_answer)
+        answer_pos = (input_box_rect.x + 10, input_box_rect.y + (input_box_rect.height - answer_height) // 2)
+        self.dirty.add(answer_atlas.draw(self.screen, self.current_answer, answer_pos))
 
         # Cursor piscante (barra vertical)
         # Calcula a posição do cursor após o texto
-        cursor_x = answer_pos[0] + answer_surface.get_width() + 2
+        cursor_x = answer_pos[0] + answer_width + 2
         cursor_y_top = answer_pos[1]
-        cursor_y_bottom = answer_pos[1] + answer_surface.get_height()
+        cursor_y_bottom = answer_pos[1] + answer_height
 
         # Pisca a cada meio segundo
-        if (time.time() * 2) % 2 > 1:
-            pygame.draw.line(self.screen, (255, 255, 0), (cursor_x, cursor_y_top), (cursor_x, cursor_y_bottom), 3)
+        if (self.now() * 2) % 2 > 1:
+            self.dirty.add(pygame.draw.line(
+                self.screen, (255, 255, 0), (cursor_x, cursor_y_top), (cursor_x, cursor_y_bottom), 3
+            ))
+
+        if self.state == "validating":
+            validating_surface = self.text_cache.render(self.font, "Validando...", True, (200, 200, 200))
+            validating_rect = validating_surface.get_rect(center=(screen_center_x, input_box_rect.bottom + 40))
+            self.dirty.add(self.screen.blit(validating_surface, validating_rect))
 
         # Espaçamento para o timer
-        timer_y = input_box_y + input_box_height + 200
-        timer_surface = self.font.render(f"Contagem Regressiva: {int(self.remaining_time)}s", True, (255, 100, 100))
+        timer_y = input_box_rect.bottom + 200
+        timer_surface = self.text_cache.render(
+            self.font, f"Contagem Regressiva: {int(self.core.remaining_time)}s", True, (255, 100, 100)
+        )
         timer_rect = timer_surface.get_rect(center=(screen_center_x, timer_y))
-        self.screen.blit(timer_surface, timer_rect)
+        self.dirty.add(self.screen.blit(timer_surface, timer_rect))
 
-    def start_voting(self, word):
-        self.voting_word = word
-        self.votes = []
-        self.vote_required = self.max_players - 1  # os outros jogadores votam
-        self.current_voter = 0
-        self.vote_result = None
-        self.vote_start_time = time.time()
-        self.state = "voting"
-
-    def draw_voting(self):
-        self.screen.fill((0, 0, 0))  # fundo escuro
+    def compose_voting(self, surface):
+        surface.fill((0, 0, 0))  # fundo escuro
 
-        font = pygame.font.SysFont("comicsansms", 36)
-        word_text = font.render(f"A palavra foi: {self.voting_word}", True, (255, 255, 255))
+        font = self.fonts.get("comicsansms", 36)
+        word_text = self.text_cache.render(font, f"A palavra foi: {self.core.voting_word}", True, (255, 255, 255))
         word_rect = word_text.get_rect(center=(config.SCREEN_WIDTH // 2, 200))
-        self.screen.blit(word_text, word_rect)
+        surface.blit(word_text, word_rect)
 
-        prompt_font = pygame.font.SysFont("comicsansms", 28)
-        voter_idx = (self.current_player_turn + self.current_voter + 1) % self.max_players
-        voter_name = self.players[voter_idx]["name"]
-        prompt_text = prompt_font.render(f"{voter_name}, essa palavra é válida? [S/N]", True, (255, 255, 0))
+        prompt_font = self.fonts.get("comicsansms", 28)
+        voter_idx = self.core.current_voter_index()
+        voter_name = self.core.players[voter_idx].name
+        prompt_text = self.text_cache.render(
+            prompt_font, f"{voter_name}, essa palavra é válida? [S/N]", True, (255, 255, 0)
+        )
         prompt_rect = prompt_text.get_rect(center=(config.SCREEN_WIDTH // 2, 300))
-        self.screen.blit(prompt_text, prompt_rect)
+        surface.blit(prompt_text, prompt_rect)
 
-        votes_text = prompt_font.render(f"Votos: {len(self.votes)} / {self.vote_required}", True, (200, 200, 200))
+        votes_text = self.text_cache.render(
+            prompt_font, f"Votos: {len(self.core.votes)} / {self.core.vote_required}", True, (200, 200, 200)
+        )
         votes_rect = votes_text.get_rect(center=(config.SCREEN_WIDTH // 2, 380))
-        self.screen.blit(votes_text, votes_rect)
+        surface.blit(votes_text, votes_rect)
+
+        # Todos podem votar ao mesmo tempo, cada um no seu dispositivo
+        status_font = self.fonts.get("comicsansms", 24)
+        for row, seat in enumerate(self.core.voters()):
+            status = "votou" if seat in self.core.ballots else "aguardando"
+            line = f"{self.core.players[seat].name}: {status}  [{self.vote_hint(seat)}]"
+            color = (120, 120, 120) if seat in self.core.ballots else (200, 200, 200)
+            status_text = self.text_cache.render(status_font, line, True, color)
+            surface.blit(status_text, status_text.get_rect(center=(config.SCREEN_WIDTH // 2, 545 + row * 32)))
+
+    def vote_hint(self, seat):
+        """Como o jogador vota: teclas próprias e, se houver, o controle e a página do celular dele."""
+        hints = []
+        if seat < len(config.VOTE_KEYS):
+            yes_key, no_key = config.VOTE_KEYS[seat]
+            hints.append(f"{yes_key.upper()}=sim {no_key.upper()}=não")
+        if seat < len(self.joysticks):
+            hints.append(f"controle {seat + 1}")
+        token = self.vote_bridge.token(seat) if self.vote_bridge is not None else None
+        if token is not None:
+            hints.append(f"celular /j/{token}")
+        return ", ".join(hints)
 
+    def draw_voting(self):
         # --- Botões Sim e Não ---
-        button_font = pygame.font.SysFont("comicsansms", 32, bold=True)
-
-        # Define posições e tamanhos
-        button_width, button_height = 120, 50
-        screen_center_x = config.SCREEN_WIDTH // 2
-        button_y = 450
+        button_font = self.fonts.get("comicsansms", 32, bold=True)
 
-        self.sim_button_rect = pygame.Rect(screen_center_x - button_width - 20, button_y, button_width, button_height)
-        self.nao_button_rect = pygame.Rect(screen_center_x + 20, button_y, button_width, button_height)
+        # Posições e tamanhos vêm do layout (os mesmos usados nos cliques)
+        layout = self.layout()
+        sim_button_rect = layout.rect(("vote", True))
+        nao_button_rect = layout.rect(("vote", False))
 
         # Cor padrão dos botões
         sim_color = (0, 200, 0)
         nao_color = (200, 0, 0)
 
         # Se quiser, pode fazer efeito de hover (mouse passando por cima)
-        mouse_pos = pygame.mouse.get_pos()
-        if self.sim_button_rect.collidepoint(mouse_pos):
+        mouse_pos = self.viewport.to_logical(pygame.mouse.get_pos())
+        if sim_button_rect.collidepoint(mouse_pos):
             sim_color = (0, 255, 0)
-        if self.nao_button_rect.collidepoint(mouse_pos):
+        if nao_button_rect.collidepoint(mouse_pos):
             nao_color = (255, 0, 0)
 
         # Desenha botões
-        pygame.draw.rect(self.screen, sim_color, self.sim_button_rect, border_radius=8)
-        pygame.draw.rect(self.screen, nao_color, self.nao_button_rect, border_radius=8)
+        self.dirty.add(pygame.draw.rect(self.screen, sim_color, sim_button_rect, border_radius=8))
+        self.dirty.add(pygame.draw.rect(self.screen, nao_color, nao_button_rect, border_radius=8))
 
         # Texto dos botões
-        sim_text = button_font.render("SIM", True, (255, 255, 255))
-        nao_text = button_font.render("NÃO", True, (255, 255, 255))
+        sim_text = self.text_cache.render(button_font, "SIM", True, (255, 255, 255))
+        nao_text = self.text_cache.render(button_font, "NÃO", True, (255, 255, 255))
 
-        sim_text_rect = sim_text.get_rect(center=self.sim_button_rect.center)
-        nao_text_rect = nao_text.get_rect(center=self.nao_button_rect.center)
+        sim_text_rect = sim_text.get_rect(center=sim_button_rect.center)
+        nao_text_rect = nao_text.get_rect(center=nao_button_rect.center)
 
         self.screen.blit(sim_text, sim_text_rect)
         self.screen.blit(nao_text, nao_text_rect)
@@ -1,9 +1,14 @@
 import pygame
 import config
 from game import Game
+from ui.audio import configure_mixer
 
 if __name__ == "__main__":
+    configure_mixer()
     pygame.init()
     game = Game()
+    # Uma gravação de sessão começa do zero: retomar a partida quebraria o replay
+    if game.recorder is None:
+        game.resume_autosave()
     game.run()
     pygame.quit()
\ No newline at end of file
@@ -0,0 +1,180 @@
+"""Servidor de salas (asyncio, TCP, uma mensagem JSON por linha).
+
+Um único event loop hospeda todas as salas. Cada conexão é um jogador:
+
+    -> {"op": "join", "room": "sala1", "name": "Ana", "players": 3, "id": 1}
+    <- {"id": 1, "ok": true, "seat": 0}
+    -> {"op": "act", "action": "select_letter", "args": ["B"], "id": 2}
+    <- {"id": 2, "ok": true}
+    -> {"op": "stats", "id": 3}
+
+e recebe os eventos da sala: {"event": "state", ...}, "letter_selected",
+"warning", "voting_started", "word_approved", "turn_ended", "error",
+"finished" e "closed". Na votação todos os assentos em "pending_voters"
+podem votar ao mesmo tempo.
+"players" só vale para quem cria a sala.
+
+    python -m server.app --port 8765
+    python -m server.app --offline --reveal-seconds 0.2   # para testes de carga
+"""
+import argparse
+import asyncio
+import json
+import sys
+
+from server.rooms import Room, ValidationBatcher
+
+MAX_LINE = 64 * 1024
+
+
+class Connection:
+    def __init__(self, writer):
+        self.writer = writer
+        self.room = None
+        self.seat = None
+
+    @staticmethod
+    def encode(message):
+        return json.dumps(message, separators=(",", ":"), ensure_ascii=False).encode("utf-8") + b"\n"
+
+    def send(self, message):
+        self.send_raw(self.encode(message))
+
+    def send_raw(self, data):
+        if not self.writer.is_closing():
+            self.writer.write(data)
+
+
+class RoomServer:
+    def __init__(self, batcher, core_options=None):
+        self.batcher = batcher
+        self.core_options = core_options or {}
+        self.rooms = {}
+        self.connections = 0
+
+    async def handle(self, reader, writer):
+        connection = Connection(writer)
+        self.connections += 1
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    connection.send({"ok": False, "error": "JSON inválido"})
+                    continue
+                if not isinstance(message, dict):
+                    connection.send({"ok": False, "error": "A mensagem deve ser um objeto JSON"})
+                    continue
+                reply = self.handle_message(connection, message)
+                if "id" in message:
+                    reply["id"] = message["id"]
+                connection.send(reply)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass  # cliente caiu (ou mandou uma linha grande demais)
+        finally:
+            self.connections -= 1
+            self.leave(connection)
+            writer.close()
+
+    def handle_message(self, connection, message):
+        op = message.get("op")
+        if op == "join":
+            return self.join(connection, message)
+        if op == "act":
+            if connection.room is None:
+                return {"ok": False, "error": "Entre numa sala primeiro"}
+            args = message.get("args") or []
+            if not isinstance(args, list):
+                return {"ok": False, "error": "args deve ser uma lista"}
+            ok, error = connection.room.act(connection.seat, message.get("action"), args)
+            return {"ok": ok, "error": error} if error else {"ok": ok}
+        if op == "stats":
+            return {"ok": True, "stats": self.stats()}
+        return {"ok": False, "error": f"Operação desconhecida: {op}"}
+
+    def join(self, connection, message):
+        if connection.room is not None:
+            if not connection.room.finished:
+                return {"ok": False, "error": "Já está numa sala"}
+            self.leave(connection)
+        name = str(message.get("room", ""))
+        room = self.rooms.get(name)
+        if room is None or room.finished:
+            try:
+                players = int(message.get("players", 2))
+                room = Room(name, players, self.batcher, self.core_options)
+            except (TypeError, ValueError):
+                return {"ok": False, "error": "Número de jogadores inválido"}
+            if room.core.state != "get_names":
+                return {"ok": False, "error": "Número de jogadores inválido"}
+            self.rooms[name] = room
+
+        seat, error = room.join(connection, str(message.get("name", "")))
+        if error:
+            return {"ok": False, "error": error}
+        connection.room = room
+        connection.seat = seat
+        return {"ok": True, "seat": seat}
+
+    def leave(self, connection):
+        room = connection.room
+        if room is None:
+            return
+        connection.room = None
+        room.members = [member for member in room.members if member is not connection]
+        if not room.finished:
+            # Sem o jogador a partida não tem como continuar
+            room.close("Um jogador saiu")
+        if self.rooms.get(room.name) is room:
+            del self.rooms[room.name]
+
+    def stats(self):
+        return {
+            "rooms": len(self.rooms),
+            "connections": self.connections,
+            "validation": self.batcher.stats(),
+        }
+
+
+async def serve(args):
+    if args.offline:
+        from api.word_validation import validate_offline
+        batcher = ValidationBatcher(validate_offline, window=args.batch_window)
+    else:
+        from api.word_validation import validate_offline, validate_online
+        batcher = ValidationBatcher(validate_offline, validate_online, window=args.batch_window)
+
+    core_options = {"reveal_seconds": args.reveal_seconds, "turn_seconds": args.turn_seconds}
+    room_server = RoomServer(batcher, core_options)
+    server = await asyncio.start_server(room_server.handle, args.host, args.port, limit=MAX_LINE)
+    print(f"Servidor de salas em {args.host}:{args.port}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        batcher.shutdown()
+        print(f"Validação: {batcher.stats()}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Servidor de salas do Jogo da Roda de Letras")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--offline", action="store_true", help="valida só no léxico/cache, sem ConceptNet")
+    parser.add_argument("--batch-window", type=float, default=0.01, help="segundos para juntar validações")
+    parser.add_argument("--reveal-seconds", type=float, default=4)
+    parser.add_argument("--turn-seconds", type=float, default=40)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
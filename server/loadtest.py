@@ -0,0 +1,188 @@
+"""Teste de carga do servidor de salas.
+
+Abre uma conexão por jogador simulado (rooms x players), joga partidas
+completas e mede a latência de cada ação: do envio até a resposta do
+servidor, e para a validação, do envio da palavra até a sala sair de
+"validating". Use o servidor em modo offline e com revelação curta, para
+não depender da ConceptNet nem esperar 4s por letra:
+
+    python -m server.app --offline --reveal-seconds 0.2 --turn-seconds 10
+    python -m server.loadtest --rooms 500 --players 4 --think-ms 50
+
+Muitas conexões podem exigir aumentar o limite de arquivos (ulimit -n).
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections import defaultdict
+
+from engine.core import ALPHABET
+from util import percentile
+
+ENDINGS = ("ato", "ola", "ema", "ivo", "ura")  # palavras repetidas entre salas (o servidor junta em lotes)
+
+
+class Player:
+    def __init__(self, room, seat_hint, players, think, rng, latencies):
+        self.room = room
+        self.name = "Jog" + ALPHABET[seat_hint]
+        self.players = players
+        self.think = think
+        self.rng = rng
+        self.latencies = latencies  # ação -> lista de ms (compartilhada)
+        self.seat = None
+        self.state = None
+        self.busy = False
+        self.next_id = 0
+        self.pending = {}  # id -> (ação, instante do envio)
+        self.validation_start = None
+        self.writer = None
+        self.finished = False
+        self.actions = 0
+
+    def send(self, message, label):
+        self.next_id += 1
+        message["id"] = self.next_id
+        self.pending[self.next_id] = (label, time.perf_counter())
+        self.writer.write(json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n")
+
+    async def run(self, host, port, deadline):
+        reader, self.writer = await asyncio.open_connection(host, port)
+        self.send({"op": "join", "room": self.room, "name": self.name, "players": self.players}, "join")
+        try:
+            while not self.finished and time.perf_counter() < deadline:
+                try:
+                    line = await asyncio.wait_for(reader.readline(), deadline - time.perf_counter())
+                except asyncio.TimeoutError:
+                    break
+                if not line:
+                    break
+                self.handle(json.loads(line))
+        finally:
+            self.writer.close()
+
+    def handle(self, message):
+        if "id" in message and message["id"] in self.pending:
+            label, sent = self.pending.pop(message["id"])
+            self.latencies[label].append((time.perf_counter() - sent) * 1000)
+            if label == "join":
+                self.seat = message.get("seat")
+                if self.seat is None:
+                    self.finished = True
+                    return
+            self.busy = False
+            self.maybe_act()
+        elif message.get("event") == "state":
+            self.state = message["state"]
+            if self.validation_start is not None and self.state["state"] != "validating":
+                self.latencies["validation"].append((time.perf_counter() - self.validation_start) * 1000)
+                self.validation_start = None
+            self.maybe_act()
+        elif message.get("event") in ("finished", "closed"):
+            self.finished = True
+
+    def next_action(self):
+        s = self.state
+        state = s["state"]
+        if state == "choose_character" and s["choosing"] == self.seat:
+            return "choose_character", [self.rng.randrange(4)]
+        if state == "select_theme" and self.seat == 0:
+            return "choose_theme", ["Animal"]
+        if state == "roulette" and s["turn"] == self.seat:
+            free = [letter for letter in ALPHABET if letter not in s["used"]]
+            if free:
+                return "select_letter", [self.rng.choice(free)]
+        if state == "answer_input" and s["turn"] == self.seat:
+            return "submit_answer", [s["letter"].lower() + self.rng.choice(ENDINGS)]
+        if state == "voting" and self.seat in s["pending_voters"]:
+            return "vote", [self.rng.random() < 0.7]
+        return None
+
+    def maybe_act(self):
+        if self.busy or self.seat is None or self.state is None or self.finished:
+            return
+        if self.next_action() is None:
+            return
+        self.busy = True
+        asyncio.get_running_loop().call_later(self.think, self.act)
+
+    def act(self):
+        if self.finished or self.writer.is_closing():
+            return
+        # Decide só agora: a jogada pode ter ficado velha durante o "pensar" (ex.: tempo esgotado)
+        action = self.next_action()
+        if action is None:
+            self.busy = False
+            return
+        name, args = action
+        if name == "submit_answer":
+            self.validation_start = time.perf_counter()
+        self.actions += 1
+        self.send({"op": "act", "action": name, "args": args}, name)
+
+
+async def fetch_stats(host, port):
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(b'{"op":"stats","id":1}\n')
+    line = await reader.readline()
+    writer.close()
+    return json.loads(line).get("stats")
+
+
+async def run(args):
+    rng = random.Random(args.seed)
+    latencies = defaultdict(list)
+    deadline = time.perf_counter() + args.duration
+    players = []
+    for r in range(args.rooms):
+        for seat in range(args.players):
+            players.append(Player(f"carga{r}", seat, args.players, args.think_ms / 1000,
+                                  random.Random(rng.random()), latencies))
+
+    start = time.perf_counter()
+    tasks = []
+    for i, player in enumerate(players):
+        tasks.append(asyncio.create_task(player.run(args.host, args.port, deadline)))
+        if args.ramp and i % 100 == 99:
+            await asyncio.sleep(args.ramp)  # não abre milhares de conexões no mesmo instante
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    elapsed = time.perf_counter() - start
+
+    errors = [r for r in results if isinstance(r, BaseException)]
+    finished_rooms = len({p.room for p in players if p.finished})
+    total_actions = sum(p.actions for p in players)
+    print(f"{len(players)} jogadores em {args.rooms} salas, {elapsed:.1f}s, "
+          f"{total_actions} ações ({total_actions / elapsed:.0f}/s), {finished_rooms} salas encerradas")
+    if errors:
+        print(f"{len(errors)} conexões com erro (ex.: {errors[0]!r})")
+    print(f"{'ação':<18}{'n':>8}{'p50':>9}{'p95':>9}{'p99':>9}{'máx':>9}  (ms)")
+    for label, values in sorted(latencies.items()):
+        values = sorted(values)
+        print(f"{label:<18}{len(values):>8}{percentile(values, 50):>9.2f}{percentile(values, 95):>9.2f}"
+              f"{percentile(values, 99):>9.2f}{max(values):>9.2f}")
+    try:
+        print(f"Servidor: {await fetch_stats(args.host, args.port)}")
+    except OSError:
+        pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Teste de carga do servidor de salas")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--rooms", type=int, default=250)
+    parser.add_argument("--players", type=int, default=4, help="jogadores por sala")
+    parser.add_argument("--think-ms", type=float, default=50, help="tempo de 'pensar' antes de cada jogada")
+    parser.add_argument("--duration", type=float, default=120, help="limite de tempo do teste (s)")
+    parser.add_argument("--ramp", type=float, default=0.05, help="pausa a cada 100 conexões (s)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+    asyncio.run(run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
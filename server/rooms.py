@@ -0,0 +1,254 @@
+"""Salas do servidor: um GameCore por sala, timers no event loop.
+
+Nenhuma sala faz polling. Depois de cada ação a sala pergunta aos timers
+do GameCore o próximo instante em que algo muda sozinho (fim da revelação
+da letra, alerta de tempo, fim da vez) e agenda um único loop.call_at
+para ele.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from engine.core import ALPHABET, GameCore
+
+TIMER_SLACK = 0.001  # dispara um pouco depois do prazo (call_at pode acordar um pouco antes)
+
+# Quem pode executar cada ação: assento esperado em função do estado da partida.
+# None: qualquer assento; o GameCore confere (votos chegam em paralelo).
+SEAT_RULES = {
+    "choose_character": lambda core: core.current_input,
+    "choose_theme": lambda core: 0,
+    "select_letter": lambda core: core.current_player_turn,
+    "submit_answer": lambda core: core.current_player_turn,
+    "vote": None,
+}
+
+# Efeitos repassados para todos da sala (error vai só para quem agiu)
+BROADCAST_EFFECTS = ("letter_selected", "warning", "voting_started", "word_approved", "turn_ended")
+
+
+class ValidationBatcher:
+    """Junta as validações de todas as salas em lotes.
+
+    Pedidos que chegam dentro de `window` segundos formam um lote: palavras
+    repetidas (na mesma sala ou em salas diferentes, inclusive já em
+    andamento) viram um só pedido, e o léxico/cache do lote inteiro é
+    consultado numa única tarefa do executor. Só as palavras que faltarem
+    vão para a API, em paralelo, limitadas por `workers`.
+    """
+
+    def __init__(self, offline_fn, online_fn=None, window=0.01, max_batch=256, workers=4):
+        self.offline_fn = offline_fn
+        self.online_fn = online_fn  # None = sem rede: o que não estiver no léxico/cache é None
+        self.window = window
+        self.max_batch = max_batch
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="lote")
+        self.pending = {}  # palavra -> Future, esperando o lote fechar
+        self.in_flight = {}  # palavra -> Future, lote já enviado
+        self.flush_handle = None
+
+        self.requests = 0
+        self.batches = 0
+        self.words = 0
+        self.online = 0
+
+    def submit(self, word):
+        loop = asyncio.get_running_loop()
+        self.requests += 1
+        future = self.pending.get(word) or self.in_flight.get(word)
+        if future is not None:
+            return future
+
+        future = loop.create_future()
+        self.pending[word] = future
+        if len(self.pending) >= self.max_batch:
+            self.flush()
+        elif self.flush_handle is None:
+            self.flush_handle = loop.call_later(self.window, self.flush)
+        return future
+
+    def flush(self):
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        batch, self.pending = self.pending, {}
+        if not batch:
+            return
+        self.in_flight.update(batch)
+        self.batches += 1
+        self.words += len(batch)
+        asyncio.get_running_loop().create_task(self.run_batch(batch))
+
+    def validate_offline_batch(self, words):
+        return [self.offline_fn(word) for word in words]
+
+    async def run_batch(self, batch):
+        loop = asyncio.get_running_loop()
+        words = list(batch)
+        try:
+            offline = await loop.run_in_executor(self.executor, self.validate_offline_batch, words)
+        except Exception as e:
+            print(f"Falha ao validar lote: {e}")
+            offline = [(False, None)] * len(words)
+
+        missing = []
+        for word, (found, result) in zip(words, offline):
+            if found or self.online_fn is None:
+                self.resolve(word, result if found else None)
+            else:
+                missing.append(word)
+
+        if missing:
+            self.online += len(missing)
+            results = await asyncio.gather(
+                *(loop.run_in_executor(self.executor, self.online_fn, word) for word in missing),
+                return_exceptions=True,
+            )
+            for word, result in zip(missing, results):
+                self.resolve(word, None if isinstance(result, BaseException) else result)
+
+    def resolve(self, word, result):
+        future = self.in_flight.pop(word, None)
+        if future is not None and not future.done():
+            future.set_result(result)
+
+    def stats(self):
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "words": self.words,
+            "online": self.online,
+            "words_per_batch": self.words / self.batches if self.batches else 0.0,
+        }
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class Room:
+    def __init__(self, name, player_count, batcher, core_options=None):
+        self.name = name
+        self.loop = asyncio.get_running_loop()
+        self.batcher = batcher
+        self.core = GameCore(clock=self.loop.time, **(core_options or {}))
+        self.core.set_player_count(player_count)
+        self.members = []  # conexões, na ordem dos assentos
+        self.timer = None
+        self.turn = 0  # muda a cada vez; descarta validações de vezes passadas
+        self.finished = False
+
+    @property
+    def full(self):
+        return len(self.members) == self.core.max_players
+
+    def join(self, connection, name):
+        """Retorna (assento, erro)."""
+        if self.full or self.finished:
+            return None, "Sala cheia"
+        if not self.core.add_player(name):
+            self.core.drain_effects()
+            return None, "Nome inválido! Use letras e acentos, sem símbolos proibidos."
+        self.members.append(connection)
+        self.after_change(actor=connection)
+        return len(self.members) - 1, None
+
+    def act(self, seat, action, args):
+        """Executa a ação de um jogador. Retorna (ok, erro)."""
+        if not isinstance(action, str) or action not in SEAT_RULES:
+            return False, f"Ação não permitida: {action}"
+        if not isinstance(args, list):
+            return False, "Argumentos inválidos: args deve ser uma lista"
+        if self.finished:
+            return False, "Partida encerrada"
+        rule = SEAT_RULES[action]
+        if rule is not None and rule(self.core) != seat:
+            return False, "Não é a sua vez"
+        try:
+            if action == "vote":
+                args = [args[0] if args else False, seat]  # o voto é sempre do próprio assento
+            ok = self.core.dispatch(action, *args)
+        except (TypeError, ValueError, AttributeError) as e:
+            return False, f"Argumentos inválidos: {e}"
+        self.after_change(actor=self.members[seat])
+        return ok, None if ok else "Ação recusada neste momento"
+
+    def after_change(self, actor=None):
+        for kind, payload in self.core.drain_effects():
+            if kind == "validate":
+                self.start_validation(payload)
+            elif kind == "error":
+                if actor is not None:
+                    actor.send({"event": "error", "message": payload})
+            elif kind in BROADCAST_EFFECTS:
+                if kind == "turn_ended":
+                    self.turn += 1
+                self.broadcast({"event": kind, "data": payload})
+
+        core = self.core
+        if core.state == "roulette" and not core.letter_chosen and core.used_count == len(ALPHABET):
+            self.finish()
+            return
+
+        self.schedule()
+        self.broadcast({"event": "state", "room": self.name, "state": self.snapshot()})
+
+    def start_validation(self, word):
+        turn = self.turn
+        future = self.batcher.submit(word)
+        future.add_done_callback(lambda f: self.on_validated(turn, f))
+
+    def on_validated(self, turn, future):
+        # Resposta atrasada de uma vez que já acabou (tempo esgotado)
+        if turn != self.turn or self.finished or self.core.state != "validating":
+            return
+        self.core.validation_result(None if future.cancelled() or future.exception() else future.result())
+        self.after_change()
+
+    def schedule(self):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        deadline = self.core.timers.next_deadline()
+        if deadline is not None:
+            self.timer = self.loop.call_at(deadline + TIMER_SLACK, self.on_timer)
+
+    def on_timer(self):
+        self.timer = None
+        self.core.tick()
+        self.after_change()
+
+    def snapshot(self):
+        core = self.core
+        remaining = core.remaining_time if core.turn_timer is not None else None
+        return {
+            "state": core.state,
+            "players": [player.name for player in core.players],
+            "scores": core.scores,
+            "turn": core.current_player_turn,
+            "choosing": core.current_input if core.state == "choose_character" else None,
+            "theme": core.current_theme,
+            "letter": core.current_letter,
+            "used": "".join(core.used_letters),
+            "remaining": None if remaining is None else round(remaining, 2),
+            "voting_word": core.voting_word,
+            "votes": len(core.votes),
+            "voter": core.current_voter_index() if core.state == "voting" else None,
+            "pending_voters": core.pending_voters() if core.state == "voting" else [],
+        }
+
+    def finish(self):
+        self.finished = True
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        self.broadcast({"event": "finished", "room": self.name, "scores": self.core.scores})
+
+    def close(self, reason):
+        self.finish()
+        self.broadcast({"event": "closed", "room": self.name, "reason": reason})
+
+    def broadcast(self, message):
+        if not self.members:
+            return
+        data = self.members[0].encode(message)  # serializa uma vez para a sala toda
+        for connection in self.members:
+            connection.send_raw(data)
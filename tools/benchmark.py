@@ -0,0 +1,306 @@
+"""Benchmark headless do jogo, dirigido por uma sequência de eventos.
+
+Roda Game com os drivers dummy do SDL (sem janela e sem som), injeta os
+eventos de uma partida completa e mede, por estado: frames/s, distribuição
+do tempo de frame e pico de memória. A linha "startup" é o tempo de criar
+o Game (fontes e assets), para acompanhar o cold start; como é uma amostra
+só por rodada, ela não é comparada ao baseline, e sim a um teto absoluto
+(--startup-max-ms). validate_word é substituído por um stub, então nenhuma
+chamada de rede é feita.
+
+    python -m tools.benchmark                    # compara com o baseline
+    python -m tools.benchmark --save-baseline    # grava um novo baseline
+
+O baseline padrão (tools/benchmark_baseline.json) fica no repositório e foi
+gerado com os drivers dummy; sem baseline o comando falha (código 2). Uma
+piora só conta se passar de --tolerance e de --min-delta-ms, e a rodada de
+tempo é repetida (--repeat) para descartar picos da máquina.
+    python -m tools.benchmark --replay sessao.rdr --baseline sessao.json
+    python -m tools.benchmark --window 1920x1080 --baseline 1080p.json  # janela escalada
+
+Com --replay, em vez do roteiro abaixo é reexecutada uma sessão gravada
+(config.RECORD_SESSION_PATH), com as validações e o relógio da gravação.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+import config
+from util import percentile
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")
+FRAME_DT = 1 / 60  # avanço do relógio virtual por frame
+MIN_FRAMES = 10  # com menos amostras o p95 é só ruído: mostra, mas não acusa regressão
+STARTUP_MAX_MS = 500  # teto da linha "startup" (aqui: ~250 ms na primeira rodada, a fria; ~50 ms nas outras)
+
+# Respostas do stub de validação
+STUB_WORDS = {"abacaxi": True, "bola": None, "xyz": False, "cavalo": True}
+
+
+def stub_validate_word(word):
+    return STUB_WORDS.get(word.lower())
+
+
+def key(k, text=""):
+    return pygame.event.Event(pygame.KEYDOWN, key=k, unicode=text, mod=0, scancode=0)
+
+
+def typed(text):
+    return [key(ord(ch.lower()), ch) for ch in text]
+
+
+def click(pos):
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1)
+
+
+# Cada passo: (eventos, frames extras a rodar depois, estado esperado ao fim)
+# Os frames extras deixam cada tela "parada" por um tempo para medir o custo dela.
+SCRIPT = [
+    ([], 60, "select_player_count"),
+    ([key(pygame.K_3, "3")], 30, "get_names"),
+    (typed("ana") + [key(pygame.K_RETURN, "\r")], 30, "get_names"),
+    (typed("b@") + [key(pygame.K_RETURN, "\r")], 30, "get_names"),  # nome inválido
+    ([key(pygame.K_BACKSPACE), key(pygame.K_BACKSPACE)] + typed("bia") + [key(pygame.K_RETURN, "\r")], 30, "get_names"),
+    (typed("caio") + [key(pygame.K_RETURN, "\r")], 30, "choose_character"),
+    ([key(pygame.K_RIGHT), key(pygame.K_RETURN, "\r")], 30, "choose_character"),
+    ([key(pygame.K_RIGHT), key(pygame.K_RIGHT), key(pygame.K_RETURN, "\r")], 30, "choose_character"),
+    ([key(pygame.K_RETURN, "\r")], 60, "select_theme"),
+    ([key(pygame.K_DOWN), key(pygame.K_DOWN), key(pygame.K_UP)], 30, "select_theme"),
+    ([key(pygame.K_RETURN, "\r")], 60, "roulette"),
+    ([key(pygame.K_RIGHT)] * 5 + [key(pygame.K_LEFT)] * 5, 30, "roulette"),
+    ([key(pygame.K_a, "a")], 300, "answer_input"),  # revelação da letra (4s virtuais)
+    (typed("abacaxi"), 60, "answer_input"),
+    ([key(pygame.K_RETURN, "\r")], 60, "voting"),
+    ([key(pygame.K_s, "s")], 30, "voting"),
+    ([click((420, 475))], 60, "roulette"),  # botão SIM
+    ([key(pygame.K_b, "b")], 300, "answer_input"),
+    (typed("bola") + [key(pygame.K_RETURN, "\r")], 60, "voting"),  # validação offline
+    ([key(pygame.K_n, "n")], 60, "roulette"),  # um "não" já decide com 3 jogadores
+    ([key(pygame.K_c, "c")], 300, "answer_input"),
+    (typed("xyz") + [key(pygame.K_RETURN, "\r")], 30, "answer_input"),  # palavra inexistente
+    ([key(pygame.K_BACKSPACE)] * 3 + typed("cavalo") + [key(pygame.K_RETURN, "\r")], 60, "voting"),
+    ([key(pygame.K_s, "s"), key(pygame.K_s, "s")], 60, "roulette"),
+    ([key(pygame.K_d, "d")], 300, "answer_input"),
+    ([], 60 * 41, "roulette"),  # deixa o tempo acabar
+]
+
+
+def make_replay_game(session):
+    from engine.replay import SessionReplayer
+    from game import Game
+
+    game = Game()
+    SessionReplayer(session).attach(game)
+    return game
+
+
+def make_game():
+    from api.validation_worker import ValidationWorker
+    from game import Game
+
+    game = Game()
+    game.validation_worker.shutdown()
+    game.validation_worker = ValidationWorker(stub_validate_word)
+
+    virtual_time = [1_000_000.0]
+    game.now = lambda: virtual_time[0]
+    return game, virtual_time
+
+
+def wait_validation(game):
+    # O stub responde na hora, mas num thread: espera o Future para o roteiro ser determinístico
+    future = game.pending_validation or game.speculative_future
+    if future is not None:
+        try:
+            future.result(timeout=5)
+        except Exception:
+            pass
+
+
+def play(track_memory, session=None):
+    """Roda o roteiro (ou a sessão gravada) uma vez e devolve as amostras por estado."""
+    frame_times = defaultdict(list)
+    peak_memory = defaultdict(int)
+
+    # "startup": criação do Game, incluindo fontes e assets (cold start)
+    if track_memory:
+        tracemalloc.reset_peak()
+    start = time.perf_counter()
+    if session is not None:
+        game, virtual_time = make_replay_game(session), [0.0]
+    else:
+        game, virtual_time = make_game()
+    frame_times["startup"].append((time.perf_counter() - start) * 1000)
+    if track_memory:
+        peak_memory["startup"] = tracemalloc.get_traced_memory()[1]
+
+    def frame():
+        state = game.state
+        if track_memory:
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        game.step()
+        # Desconta o tempo dormindo em pygame.event.wait nas telas paradas
+        elapsed = (time.perf_counter() - start) * 1000 - game.profiler.current["wait"]
+        frame_times[state].append(elapsed)
+        if track_memory:
+            peak_memory[state] = max(peak_memory[state], tracemalloc.get_traced_memory()[1])
+        virtual_time[0] += FRAME_DT
+        if session is None:
+            wait_validation(game)
+
+    if session is not None:
+        while game.running:
+            frame()
+    else:
+        for events, frames, expected in SCRIPT:
+            for event in events:
+                if event.type == pygame.MOUSEBUTTONDOWN:
+                    # O roteiro clica em coordenadas do canvas; a janela pode estar escalada
+                    pixel = game.viewport.to_window(pygame.Rect(event.pos, (1, 1)))
+                    event = pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pixel.center, button=event.button)
+                pygame.event.post(event)
+            frame()
+            for _ in range(frames):
+                frame()
+            if game.state != expected:
+                raise RuntimeError(f"Roteiro saiu do trilho: esperado '{expected}', estado '{game.state}'")
+
+    game.validation_worker.shutdown()
+    game.profiler.close()
+    return frame_times, peak_memory
+
+
+def best_runs(runs):
+    """Por estado, a rodada com o menor p95: descarta picos da máquina (outros processos, GC)."""
+    best = {}
+    for frame_times in runs:
+        for state, times in frame_times.items():
+            times = sorted(times)
+            if state not in best or percentile(times, 95) < percentile(best[state], 95):
+                best[state] = times
+    return best
+
+
+def run_benchmark(session=None, window_size=None, repeat=3):
+    from ui.audio import configure_mixer
+
+    configure_mixer()
+    pygame.init()
+    config.WINDOW_SIZE = window_size
+    config.FPS = 0  # sem limite de frames
+    config.IDLE_WAIT_MS = 1  # telas paradas não dormem durante a medição
+    config.RECORD_SESSION_PATH = None
+    config.AUTOSAVE_PATH = None  # não sobrescreve a partida salva do jogador
+
+    # Rodadas de tempo (sem tracemalloc, que distorce as medidas) e rodada de memória
+    frame_times = best_runs([play(track_memory=False, session=session)[0] for _ in range(repeat)])
+    tracemalloc.start()
+    _, peak_memory = play(track_memory=True, session=session)
+    tracemalloc.stop()
+    pygame.quit()
+
+    results = {}
+    for state, times in frame_times.items():
+        total = sum(times) / 1000
+        results[state] = {
+            "frames": len(times),
+            "fps": len(times) / total if total else 0.0,
+            "p50_ms": percentile(times, 50),
+            "p95_ms": percentile(times, 95),
+            "p99_ms": percentile(times, 99),
+            "max_ms": max(times),
+            "peak_kib": peak_memory.get(state, 0) / 1024,
+        }
+    return results
+
+
+def print_results(results, baseline, tolerance, min_delta_ms=0.5, startup_max_ms=STARTUP_MAX_MS):
+    """Imprime a tabela e retorna a lista de regressões em relação ao baseline."""
+    regressions = []
+    header = f"{'estado':<22}{'frames':>8}{'fps':>10}{'p50':>8}{'p95':>8}{'p99':>8}{'max':>8}{'pico KiB':>10}"
+    print(header)
+    print("-" * len(header))
+    for state, r in results.items():
+        line = (f"{state:<22}{r['frames']:>8}{r['fps']:>10.0f}{r['p50_ms']:>8.2f}{r['p95_ms']:>8.2f}"
+                f"{r['p99_ms']:>8.2f}{r['max_ms']:>8.2f}{r['peak_kib']:>10.0f}")
+        base = baseline.get(state) if baseline else None
+        if base:
+            p95_delta = (r["p95_ms"] - base["p95_ms"]) / base["p95_ms"] if base["p95_ms"] else 0.0
+            mem_delta = (r["peak_kib"] - base["peak_kib"]) / base["peak_kib"] if base["peak_kib"] else 0.0
+            line += f"   p95 {p95_delta:+.0%}  mem {mem_delta:+.0%}"
+            # Frames de décimos de ms variam muito entre execuções: exige também uma piora absoluta
+            if state == "startup":
+                line += f"  (teto {startup_max_ms:.0f}ms)"
+            elif r["frames"] < MIN_FRAMES:
+                line += "  (poucas amostras)"
+            elif p95_delta > tolerance and r["p95_ms"] - base["p95_ms"] > min_delta_ms:
+                regressions.append(f"{state}: p95 {base['p95_ms']:.2f}ms -> {r['p95_ms']:.2f}ms")
+            if mem_delta > tolerance:
+                regressions.append(f"{state}: pico {base['peak_kib']:.0f}KiB -> {r['peak_kib']:.0f}KiB")
+        if state == "startup" and r["p95_ms"] > startup_max_ms:
+            regressions.append(f"startup: {r['p95_ms']:.0f}ms, acima do teto de {startup_max_ms:.0f}ms")
+        print(line)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark headless do jogo")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="arquivo JSON do baseline")
+    parser.add_argument("--save-baseline", action="store_true", help="grava o resultado como novo baseline")
+    parser.add_argument("--replay", help="sessão gravada (.rdr) no lugar do roteiro embutido")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="piora aceitável (0.2 = 20%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=0.5,
+                        help="piora mínima do p95, em ms, para contar como regressão")
+    parser.add_argument("--startup-max-ms", type=float, default=STARTUP_MAX_MS,
+                        help="tempo máximo de criação do Game (linha startup)")
+    parser.add_argument("--repeat", type=int, default=3, help="rodadas de tempo (vale a melhor por estado)")
+    parser.add_argument("--window", help="tamanho da janela, ex.: 1920x1080 (padrão: o do canvas)")
+    args = parser.parse_args(argv)
+
+    window_size = None
+    if args.window:
+        window_size = tuple(int(n) for n in args.window.lower().split("x"))
+
+    session = None
+    if args.replay:
+        from engine.replay import Session
+        session = Session.load(args.replay)
+
+    results = run_benchmark(session, window_size, args.repeat)
+
+    baseline = None
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    regressions = print_results(results, baseline, args.tolerance, args.min_delta_ms, args.startup_max_ms)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline gravado em {args.baseline}")
+    elif baseline is None:
+        # Sem baseline não há comparação: falha, para não passar em branco na CI
+        print(f"ERRO: baseline {args.baseline} não encontrado; rode com --save-baseline para criar um.")
+        return 2
+
+    if regressions:
+        print("Regressões:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
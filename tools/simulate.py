@@ -0,0 +1,336 @@
+"""Simulador Monte Carlo de partidas completas com jogadores-robô.
+
+Cada partida roda no GameCore com relógio virtual: os robôs escolhem a
+letra, demoram um tempo aleatório para responder, às vezes inventam uma
+palavra que não existe e votam com um viés configurável. A validação é
+feita só no léxico offline (config.LEXICON_PATH), sem rede.
+
+As partidas são divididas em lotes e espalhadas num pool de processos;
+cada lote devolve apenas contadores agregados (nada por partida), então a
+memória não cresce com o número de partidas.
+
+    python -m tools.simulate --matches 100000 --players 4
+    python -m tools.simulate --bot 5,0.9,0.7 --bot 12,0.6,0.7 --turn-seconds 30
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import config
+from api.lexicon import Lexicon
+from engine.core import ALPHABET, CHARACTER_COUNT, MAX_PLAYERS, MIN_PLAYERS, GameCore
+
+DEFAULT_BOT = (8.0, 0.8, 0.7)  # latência média (s), acerto, chance de votar "sim"
+SECONDS_BIN = 30  # largura das faixas do histograma de duração
+EPSILON = 0.001  # empurra o relógio virtual para depois dos limites
+
+lexicon = None  # aberto uma vez por processo (init_worker)
+letter_ranges = {}
+
+
+def init_worker(lexicon_path):
+    global lexicon
+    lexicon = Lexicon(lexicon_path)
+    letter_ranges.clear()
+    for letter in ALPHABET:
+        letter_ranges[letter] = lexicon.prefix_range(letter)
+
+
+class Bot:
+    def __init__(self, rng, latency, accuracy, vote_bias, strategy):
+        self.rng = rng
+        self.latency = latency
+        self.accuracy = accuracy
+        self.vote_bias = vote_bias
+        self.strategy = strategy
+
+    def choose_letter(self, free_letters):
+        if self.strategy == "easy":
+            # Prefere as letras com mais palavras no léxico
+            return max(free_letters, key=lambda letter: letter_ranges[letter][1] - letter_ranges[letter][0])
+        return self.rng.choice(free_letters)
+
+    def answer_delay(self):
+        return self.rng.expovariate(1 / self.latency)
+
+    def answer(self, letter):
+        start, end = letter_ranges[letter]
+        if end > start and self.rng.random() < self.accuracy:
+            return lexicon.word(self.rng.randrange(start, end))
+        # Palavra inventada (quase sempre inválida)
+        return letter.lower() + "".join(self.rng.choice("xzqwk") for _ in range(4))
+
+    def vote(self):
+        return self.rng.random() < self.vote_bias
+
+
+class Stats:
+    """Contadores agregados; lotes de processos diferentes são somados com merge."""
+
+    def __init__(self, players):
+        self.players = players
+        self.matches = 0
+        self.wins = [0.0] * players  # empates dividem a vitória
+        self.score_sum = [0] * players
+        self.rounds = {}  # nº de rodadas -> partidas
+        self.seconds = {}  # faixa de SECONDS_BIN segundos -> partidas
+        self.seconds_sum = 0.0
+        self.ended_by = {"target": 0, "exhausted": 0, "max_rounds": 0}
+        self.used_letters = [0] * (len(ALPHABET) + 1)  # letras usadas ao fim -> partidas
+        self.letter_picks = dict.fromkeys(ALPHABET, 0)
+        self.letter_approved = dict.fromkeys(ALPHABET, 0)
+        self.letter_position_sum = dict.fromkeys(ALPHABET, 0)
+        self.outcomes = {"approved": 0, "rejected": 0, "timeout": 0, "invalid_attempts": 0}
+
+    def add_match(self, core, rounds, seconds, ended_by):
+        self.matches += 1
+        best = max(core.scores)
+        winners = [seat for seat, score in enumerate(core.scores) if score == best]
+        for seat in winners:
+            self.wins[seat] += 1 / len(winners)
+        for seat, score in enumerate(core.scores):
+            self.score_sum[seat] += score
+        self.rounds[rounds] = self.rounds.get(rounds, 0) + 1
+        bucket = int(seconds // SECONDS_BIN)
+        self.seconds[bucket] = self.seconds.get(bucket, 0) + 1
+        self.seconds_sum += seconds
+        self.ended_by[ended_by] += 1
+        self.used_letters[core.used_count] += 1
+
+    def merge(self, other):
+        self.matches += other.matches
+        for seat in range(self.players):
+            self.wins[seat] += other.wins[seat]
+            self.score_sum[seat] += other.score_sum[seat]
+        for mine, theirs in ((self.rounds, other.rounds), (self.seconds, other.seconds),
+                             (self.ended_by, other.ended_by), (self.letter_picks, other.letter_picks),
+                             (self.letter_approved, other.letter_approved),
+                             (self.letter_position_sum, other.letter_position_sum),
+                             (self.outcomes, other.outcomes)):
+            for key, value in theirs.items():
+                mine[key] = mine.get(key, 0) + value
+        self.seconds_sum += other.seconds_sum
+        for i, value in enumerate(other.used_letters):
+            self.used_letters[i] += value
+
+    def to_dict(self):
+        n = self.matches or 1
+        letters = {
+            letter: {
+                "picks": self.letter_picks[letter],
+                "approval_rate": self.letter_approved[letter] / self.letter_picks[letter]
+                if self.letter_picks[letter] else None,
+                "mean_position": self.letter_position_sum[letter] / self.letter_picks[letter]
+                if self.letter_picks[letter] else None,
+            }
+            for letter in ALPHABET
+        }
+        return {
+            "matches": self.matches,
+            "win_rate_by_seat": [w / n for w in self.wins],
+            "mean_score_by_seat": [s / n for s in self.score_sum],
+            "rounds": histogram_summary(self.rounds),
+            "mean_seconds": self.seconds_sum / n,
+            "seconds_histogram": {f"{b * SECONDS_BIN}-{(b + 1) * SECONDS_BIN}": c
+                                  for b, c in sorted(self.seconds.items())},
+            "ended_by": dict(self.ended_by),
+            "exhaustion_rate": self.used_letters[len(ALPHABET)] / n,
+            "used_letters_histogram": {i: c for i, c in enumerate(self.used_letters) if c},
+            "outcomes": dict(self.outcomes),
+            "letters": letters,
+        }
+
+
+def histogram_summary(histogram):
+    total = sum(histogram.values())
+    if not total:
+        return {"mean": 0, "p50": 0, "p95": 0, "max": 0}
+    mean = sum(k * c for k, c in histogram.items()) / total
+    result = {"mean": mean, "max": max(histogram)}
+    for name, p in (("p50", 0.5), ("p95", 0.95)):
+        seen = 0
+        for value in sorted(histogram):
+            seen += histogram[value]
+            if seen >= total * p:
+                result[name] = value
+                break
+    return result
+
+
+def play_match(rng, settings, stats):
+    now = [0.0]
+    core = GameCore(
+        clock=lambda: now[0],
+        turn_seconds=settings["turn_seconds"],
+        points=settings["points"],
+        approval_ratio=settings["approval_ratio"],
+    )
+    bots = [Bot(rng, *spec, settings["strategy"]) for spec in settings["bots"]]
+
+    core.set_player_count(len(bots))
+    for seat in range(len(bots)):
+        core.add_player(f"Robo {ALPHABET[seat]}")
+    for seat in range(len(bots)):
+        core.choose_character(seat % CHARACTER_COUNT)
+    core.choose_theme("Objeto")
+
+    rounds = 0
+    ended_by = "max_rounds"
+    while rounds < settings["max_rounds"]:
+        if settings["target_score"] and max(core.scores) >= settings["target_score"]:
+            ended_by = "target"
+            break
+        free_letters = [letter for letter in ALPHABET if not core.is_used(letter)]
+        if not free_letters:
+            ended_by = "exhausted"
+            break
+
+        bot = bots[core.current_player_turn]
+        letter = bot.choose_letter(free_letters)
+        core.select_letter(letter)
+        rounds += 1
+        stats.letter_picks[letter] += 1
+        stats.letter_position_sum[letter] += core.used_count
+
+        now[0] += core.reveal_seconds + EPSILON
+        core.tick()
+
+        deadline = core.timer_start + core.turn_seconds
+        while core.state == "answer_input":
+            delay = bot.answer_delay()
+            if now[0] + delay >= deadline:
+                now[0] = deadline + EPSILON
+                core.tick()  # tempo esgotado: passa a vez
+                stats.outcomes["timeout"] += 1
+                break
+            now[0] += delay
+            core.tick()
+
+            word = bot.answer(letter)
+            core.submit_answer(word)
+            if settings["unknown_rate"] and rng.random() < settings["unknown_rate"]:
+                core.validation_result(None)  # simulando falha de rede: vai direto para a votação
+            else:
+                is_valid = word in lexicon
+                if not is_valid:
+                    stats.outcomes["invalid_attempts"] += 1
+                core.validation_result(is_valid)
+
+        voted = core.state == "voting"
+        while core.state == "voting":
+            core.vote(bots[core.current_voter_index()].vote())
+
+        effects = {kind for kind, _ in core.drain_effects()}
+        if "word_approved" in effects:
+            # Aprovada: o mesmo jogador continua na roleta
+            stats.outcomes["approved"] += 1
+            stats.letter_approved[letter] += 1
+        elif voted:
+            stats.outcomes["rejected"] += 1
+
+    if ended_by == "max_rounds" and core.used_count == len(ALPHABET):
+        ended_by = "exhausted"
+    stats.add_match(core, rounds, now[0], ended_by)
+
+
+def play_batch(seed, count, settings):
+    rng = random.Random(seed)
+    stats = Stats(len(settings["bots"]))
+    for _ in range(count):
+        play_match(rng, settings, stats)
+    return stats
+
+
+def parse_bot(text):
+    latency, accuracy, vote_bias = (float(part) for part in text.split(","))
+    return latency, accuracy, vote_bias
+
+
+def print_report(report, elapsed):
+    n = report["matches"]
+    print(f"{n} partidas em {elapsed:.1f}s ({n / elapsed:.0f} partidas/s)")
+    print("Vitórias por assento: " + "  ".join(
+        f"{seat + 1}: {rate:.1%}" for seat, rate in enumerate(report["win_rate_by_seat"])))
+    print("Pontuação média:      " + "  ".join(
+        f"{seat + 1}: {score:+.1f}" for seat, score in enumerate(report["mean_score_by_seat"])))
+    rounds = report["rounds"]
+    print(f"Rodadas por partida: média {rounds['mean']:.1f}  p50 {rounds['p50']}  p95 {rounds['p95']}  "
+          f"máx {rounds['max']}")
+    print(f"Duração média: {report['mean_seconds'] / 60:.1f} min")
+    print(f"Fim da partida: {report['ended_by']}  (letras esgotadas em {report['exhaustion_rate']:.1%})")
+    print(f"Respostas: {report['outcomes']}")
+    hardest = sorted(
+        (letter for letter, s in report["letters"].items() if s["picks"]),
+        key=lambda letter: report["letters"][letter]["approval_rate"],
+    )[:5]
+    print("Letras mais difíceis: " + "  ".join(
+        f"{letter} {report['letters'][letter]['approval_rate']:.0%}" for letter in hardest))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simula partidas com jogadores-robô")
+    parser.add_argument("--matches", type=int, default=10000)
+    parser.add_argument("--players", type=int, default=4, help="ignorado se --bot for usado")
+    parser.add_argument("--bot", action="append", type=parse_bot, metavar="LAT,ACERTO,VIES",
+                        help="um por assento, ex.: 8,0.8,0.7")
+    parser.add_argument("--strategy", choices=("random", "easy"), default="random",
+                        help="como os robôs escolhem a letra")
+    parser.add_argument("--turn-seconds", type=float, default=config.TIMER_SECONDS)
+    parser.add_argument("--points", type=int, default=10)
+    parser.add_argument("--approval", type=float, default=0.5, help="fração de votos sim a superar")
+    parser.add_argument("--target-score", type=int, default=0, help="encerra quem chegar a essa pontuação (0 = não)")
+    parser.add_argument("--max-rounds", type=int, default=len(ALPHABET))
+    parser.add_argument("--unknown-rate", type=float, default=0.0, help="chance de a validação falhar (None)")
+    parser.add_argument("--lexicon", default=config.LEXICON_PATH)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--batch", type=int, default=1000, help="partidas por tarefa")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", help="grava o relatório completo nesse arquivo")
+    args = parser.parse_args(argv)
+
+    bots = args.bot or [DEFAULT_BOT] * args.players
+    if not MIN_PLAYERS <= len(bots) <= MAX_PLAYERS:
+        # O GameCore recusaria a partida e os workers cairiam no primeiro prazo
+        parser.error(f"a partida tem de {MIN_PLAYERS} a {MAX_PLAYERS} jogadores (pedidos: {len(bots)})")
+
+    if not os.path.exists(args.lexicon):
+        print(f"Léxico não encontrado em {args.lexicon}; gere com: python -m api.lexicon palavras.txt {args.lexicon}")
+        return 1
+
+    settings = {
+        "bots": bots,
+        "strategy": args.strategy,
+        "turn_seconds": args.turn_seconds,
+        "points": args.points,
+        "approval_ratio": args.approval,
+        "target_score": args.target_score,
+        "max_rounds": args.max_rounds,
+        "unknown_rate": args.unknown_rate,
+    }
+
+    batches = [(args.seed + i, min(args.batch, args.matches - start))
+               for i, start in enumerate(range(0, args.matches, args.batch))]
+    total = Stats(len(bots))
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=init_worker,
+                             initargs=(args.lexicon,)) as executor:
+        futures = [executor.submit(play_batch, seed, count, settings) for seed, count in batches]
+        for future in as_completed(futures):
+            total.merge(future.result())
+    elapsed = time.perf_counter() - start
+
+    report = total.to_dict()
+    report["settings"] = settings
+    print_report(report, elapsed)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
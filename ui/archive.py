@@ -0,0 +1,198 @@
+"""Arquivo único com os assets do jogo, aberto com mmap.
+
+No executável "onefile" do PyInstaller, tudo o que vai dentro do pacote é
+extraído para uma pasta temporária a cada execução. Com os assets num
+arquivo só, ao lado do executável, nada é extraído: o índice é lido uma
+vez e cada asset é lido direto dos bytes mapeados.
+
+    cabeçalho  "RDPK" | versão (u16) | reservado (u16) | quantidade N (u32)
+    índice     N entradas: tamanho do nome (u16), nome UTF-8, offset (u64), tamanho (u64)
+    dados      conteúdo de cada arquivo, alinhado em 16 bytes
+
+Os nomes são caminhos relativos com "/" (ex.: "assets/bg.png"). Para gerar:
+
+    python -m ui.archive assets assets.pak
+    python -m ui.archive --list assets.pak
+"""
+import argparse
+import io
+import mmap
+import os
+import struct
+import sys
+
+import config
+
+MAGIC = b"RDPK"
+VERSION = 1
+HEADER = struct.Struct("<4sHHI")
+NAME_SIZE = struct.Struct("<H")
+ENTRY = struct.Struct("<QQ")
+ALIGN = 16
+
+
+def normalize_name(path):
+    name = path.replace(os.sep, "/")
+    while name.startswith("./"):
+        name = name[2:]
+    return name
+
+
+class ArchiveReader(io.RawIOBase):
+    """Arquivo somente leitura sobre um trecho do mmap (sem copiar o asset inteiro)."""
+
+    def __init__(self, view):
+        self.view = view
+        self.position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        chunk = self.view[self.position:self.position + len(buffer)]
+        buffer[:len(chunk)] = chunk
+        self.position += len(chunk)
+        return len(chunk)
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += len(self.view)
+        self.position = max(0, offset)
+        return self.position
+
+    def tell(self):
+        return self.position
+
+
+class AssetArchive:
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, count = HEADER.unpack_from(self.mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self.mm.close()
+            raise ValueError(f"Arquivo de assets inválido: {path}")
+
+        self.view = memoryview(self.mm)
+        self.index = {}  # nome -> (offset, tamanho)
+        position = HEADER.size
+        for _ in range(count):
+            (name_size,) = NAME_SIZE.unpack_from(self.mm, position)
+            position += NAME_SIZE.size
+            name = bytes(self.mm[position:position + name_size]).decode("utf-8")
+            position += name_size
+            self.index[name] = ENTRY.unpack_from(self.mm, position)
+            position += ENTRY.size
+
+    @classmethod
+    def open(cls, path):
+        """Abre o arquivo se ele existir; senão retorna None."""
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            return cls(path)
+        except (OSError, ValueError, struct.error) as e:
+            print(f"Arquivo de assets indisponível: {e}")
+            return None
+
+    def __contains__(self, name):
+        return normalize_name(name) in self.index
+
+    def names(self):
+        return sorted(self.index)
+
+    def locate(self, name):
+        """(offset, tamanho) do asset dentro de self.mm."""
+        return self.index[normalize_name(name)]
+
+    def buffer(self, name):
+        """memoryview dos bytes do asset, direto do mmap."""
+        offset, size = self.locate(name)
+        return self.view[offset:offset + size]
+
+    def open_file(self, name):
+        return io.BufferedReader(ArchiveReader(self.buffer(name)))
+
+
+_archive = None
+_archive_loaded = False
+
+
+def asset_archive():
+    """O arquivo de config.ASSET_ARCHIVE_PATH, aberto uma vez (None se não existir)."""
+    global _archive, _archive_loaded
+    if not _archive_loaded:
+        _archive = AssetArchive.open(config.ASSET_ARCHIVE_PATH)
+        _archive_loaded = True
+    return _archive
+
+
+def open_resource(relative_path):
+    """Abre um recurso para leitura binária: do arquivo de assets, se estiver lá, ou do disco."""
+    archive = asset_archive()
+    if archive is not None and relative_path in archive:
+        return archive.open_file(relative_path)
+    return open(config.resource_path(relative_path), "rb")
+
+
+def pack(source_dir, output_path, prefix=None):
+    """Empacota todos os arquivos de source_dir. Retorna a quantidade."""
+    prefix = normalize_name(prefix if prefix is not None else os.path.basename(os.path.normpath(source_dir)))
+    files = []
+    for root, _, names in os.walk(source_dir):
+        for filename in names:
+            path = os.path.join(root, filename)
+            relative = normalize_name(os.path.relpath(path, source_dir))
+            files.append((f"{prefix}/{relative}" if prefix else relative, path))
+    files.sort()
+
+    encoded = [(name.encode("utf-8"), path) for name, path in files]
+    index_size = sum(NAME_SIZE.size + len(name) + ENTRY.size for name, _ in encoded)
+    offset = HEADER.size + index_size
+    entries = []
+    for name, path in encoded:
+        offset += -offset % ALIGN
+        size = os.path.getsize(path)
+        entries.append((name, path, offset, size))
+        offset += size
+
+    with open(output_path, "wb") as out:
+        out.write(HEADER.pack(MAGIC, VERSION, 0, len(entries)))
+        for name, _, offset, size in entries:
+            out.write(NAME_SIZE.pack(len(name)))
+            out.write(name)
+            out.write(ENTRY.pack(offset, size))
+        for _, path, offset, _ in entries:
+            out.write(b"\0" * (offset - out.tell()))
+            with open(path, "rb") as f:
+                out.write(f.read())
+    return len(entries)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Empacota os assets num arquivo único")
+    parser.add_argument("source", help="pasta de assets (ou o arquivo, com --list)")
+    parser.add_argument("output", nargs="?", default="assets.pak")
+    parser.add_argument("--list", action="store_true", help="lista o conteúdo de um arquivo")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        archive = AssetArchive(args.source)
+        for name in archive.names():
+            print(f"{archive.index[name][1]:>10}  {name}")
+        return 0
+
+    count = pack(args.source, args.output)
+    print(f"{count} arquivos em {args.output} ({os.path.getsize(args.output)} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
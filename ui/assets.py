@@ -0,0 +1,106 @@
+import json
+import os
+import threading
+import time
+
+import pygame
+
+from ui.archive import open_resource
+
+SOUND_EXTENSIONS = (".wav", ".ogg", ".mp3")
+
+
+class AssetManager:
+    """Carrega imagens e sons numa thread, enquanto a janela mostra o progresso.
+
+    A thread só lê e decodifica os arquivos (e redimensiona as imagens). A
+    conversão para o formato da tela (convert, ou convert_alpha quando a
+    imagem tem transparência) acontece uma vez, na thread principal, em
+    finish(). Cada asset guarda quanto levou para carregar e converter.
+
+    specs: lista de (nome, caminho relativo, tamanho ou None), lidos por
+    open_resource (arquivo empacotado ou disco). Arquivos de som viram
+    pygame.mixer.Sound; o resto, Surface.
+    """
+
+    def __init__(self):
+        self.images = {}
+        self.sounds = {}
+        self.timings = {}  # nome -> {"load_ms": ..., "convert_ms": ...}
+        self.total = 0
+        self.loaded = 0
+        self.error = None
+        self.thread = None
+        self.start_time = None
+        self.elapsed_ms = None
+
+    def load(self, specs):
+        self.total = len(specs)
+        self.start_time = time.perf_counter()
+        self.thread = threading.Thread(target=self.load_all, args=(specs,), name="assets", daemon=True)
+        self.thread.start()
+
+    def load_all(self, specs):
+        try:
+            for name, path, size in specs:
+                start = time.perf_counter()
+                with open_resource(path) as f:
+                    # Sound(file=...): o parâmetro buffer= espera amostras cruas, não um .wav
+                    if path.lower().endswith(SOUND_EXTENSIONS):
+                        self.sounds[name] = pygame.mixer.Sound(file=f)
+                        image = None
+                    else:
+                        image = pygame.image.load(f, path)
+                if image is not None:
+                    if size is not None:
+                        image = pygame.transform.scale(image, size)
+                    self.images[name] = image
+                self.timings[name] = {"load_ms": (time.perf_counter() - start) * 1000}
+                self.loaded += 1
+        except Exception as e:
+            self.error = e  # repassado em finish(), na thread principal
+
+    def ready(self):
+        return self.thread is not None and not self.thread.is_alive()
+
+    def progress(self):
+        return self.loaded / self.total if self.total else 1.0
+
+    def finish(self):
+        """Espera a thread e converte as imagens para o formato da tela."""
+        self.thread.join()
+        if self.error is not None:
+            raise self.error
+        for name, image in self.images.items():
+            start = time.perf_counter()
+            if image.get_flags() & pygame.SRCALPHA:
+                self.images[name] = image.convert_alpha()
+            else:
+                self.images[name] = image.convert()
+            self.timings[name]["convert_ms"] = (time.perf_counter() - start) * 1000
+        self.elapsed_ms = (time.perf_counter() - self.start_time) * 1000
+
+    def image(self, name):
+        return self.images[name]
+
+    def sound(self, name):
+        return self.sounds[name]
+
+    def summary(self, slowest=3):
+        """Linha para o console: total e os assets mais lentos."""
+        def cost(name):
+            timing = self.timings[name]
+            return timing["load_ms"] + timing.get("convert_ms", 0.0)
+
+        names = sorted(self.timings, key=cost, reverse=True)[:slowest]
+        details = ", ".join(f"{name} {cost(name):.1f} ms" for name in names)
+        return f"Assets: {len(self.timings)} em {self.elapsed_ms:.0f} ms (mais lentos: {details})"
+
+    def append_timings(self, path):
+        """Acrescenta os tempos desta partida a um arquivo JSON Lines, para acompanhar o cold start."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        record = {"time": time.time(), "total_ms": self.elapsed_ms, "assets": self.timings}
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
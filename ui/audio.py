@@ -0,0 +1,135 @@
+import os
+import time
+import wave
+from collections import defaultdict, deque
+
+import pygame
+
+import config
+from ui.archive import open_resource
+from util import percentile
+
+
+def configure_mixer():
+    """Buffer pequeno no mixer (menos atraso entre play() e o som). Chamar antes de pygame.init()."""
+    pygame.mixer.pre_init(config.AUDIO_FREQUENCY, -16, 2, config.AUDIO_BUFFER)
+
+
+class AudioManager:
+    """Toca os sons do jogo sem que um corte o outro.
+
+    Sons curtos ficam decodificados num banco (add_cue) e tocam num conjunto
+    de canais: um som novo pega um canal livre, ou o que começou há mais
+    tempo. Sons longos (add_stream) não são decodificados inteiros: tocam
+    por pygame.mixer.music, lidos aos poucos de open_resource.
+
+    play(nome, then=outro) encadeia o próximo som sem esperar evento do
+    pygame: Channel.queue entre sons do banco, music.queue entre streams e,
+    entre um e outro, um timer no fim do primeiro.
+
+    A latência de cada som é o tempo da chamada mais o buffer do mixer
+    (o que ainda falta tocar antes da primeira amostra nova).
+    """
+
+    def __init__(self, timers, channels=8):
+        self.timers = timers
+        self.bank = {}  # nome -> Sound
+        self.streams = {}  # nome -> caminho
+        self.stream_lengths = {}  # nome -> segundos (se conhecido)
+        self.stream_files = []  # arquivos abertos pelo mixer.music (tocando e na fila)
+        self.chain_timers = {}  # nome -> timer que toca o som encadeado depois dele
+
+        pygame.mixer.set_num_channels(channels)
+        self.channels = [pygame.mixer.Channel(i) for i in range(channels)]
+        self.started = {}  # canal -> instante em que começou o som atual
+
+        frequency, _, _ = pygame.mixer.get_init()
+        self.buffer_ms = config.AUDIO_BUFFER / frequency * 1000
+        self.latencies = defaultdict(lambda: deque(maxlen=200))  # nome -> ms
+
+    def add_cue(self, name, sound):
+        self.bank[name] = sound
+
+    def add_stream(self, name, path, length=None):
+        self.streams[name] = path
+        if length is None and path.lower().endswith(".wav"):
+            length = self.wav_length(path)
+        self.stream_lengths[name] = length
+
+    @staticmethod
+    def wav_length(path):
+        try:
+            with open_resource(path) as f, wave.open(f) as w:
+                return w.getnframes() / w.getframerate()
+        except (OSError, EOFError, wave.Error):
+            return None
+
+    def free_channel(self):
+        for channel in self.channels:
+            if not channel.get_busy():
+                return channel
+        # Todos ocupados: interrompe o que está tocando há mais tempo
+        return min(self.channels, key=lambda channel: self.started.get(channel, 0.0))
+
+    def play(self, name, then=None):
+        """Toca o som `name` e, se houver, `then` logo depois dele."""
+        start = time.perf_counter()
+        # Tocar o mesmo som de novo recomeça a sequência dele
+        self.timers.cancel(self.chain_timers.pop(name, None))
+
+        if name in self.bank:
+            sound = self.bank[name]
+            channel = self.free_channel()
+            channel.play(sound)
+            self.started[channel] = start
+            length = sound.get_length()
+            if then in self.bank:
+                channel.queue(self.bank[then])
+                then = None
+        else:
+            self.play_stream(name)
+            length = self.stream_lengths.get(name)
+            if then in self.streams:
+                self.queue_stream(then)
+                then = None
+
+        if then is not None and length is not None:
+            self.chain_timers[name] = self.timers.call_later(length, self.play, then)
+
+        self.latencies[name].append((time.perf_counter() - start) * 1000 + self.buffer_ms)
+
+    def play_stream(self, name):
+        self.close_streams()
+        f = open_resource(self.streams[name])
+        pygame.mixer.music.load(f, os.path.basename(self.streams[name]))
+        pygame.mixer.music.play()
+        self.stream_files.append(f)
+
+    def queue_stream(self, name):
+        f = open_resource(self.streams[name])
+        pygame.mixer.music.queue(f, os.path.basename(self.streams[name]))
+        self.stream_files.append(f)
+
+    def close_streams(self):
+        pygame.mixer.music.unload()
+        for f in self.stream_files:
+            f.close()
+        self.stream_files = []
+
+    def stats(self):
+        result = {"buffer_ms": round(self.buffer_ms, 1)}
+        for name, values in self.latencies.items():
+            values = sorted(values)
+            result[name] = {
+                "plays": len(values),
+                "p50_ms": round(percentile(values, 50), 2),
+                "max_ms": round(values[-1], 2),
+            }
+        return result
+
+    def shutdown(self):
+        for timer in self.chain_timers.values():
+            self.timers.cancel(timer)
+        self.chain_timers = {}
+        pygame.mixer.stop()
+        self.close_streams()
@@ -0,0 +1,25 @@
+import pygame
+
+
+class FontRegistry:
+    """Carrega cada fonte uma única vez, por (família, tamanho, negrito).
+
+    pygame.font.SysFont procura a fonte no sistema e abre o arquivo a cada
+    chamada; aqui a busca acontece só no primeiro uso (ou no warm()).
+    """
+
+    def __init__(self):
+        self.fonts = {}
+
+    def get(self, family, size, bold=False):
+        key = (family, size, bold)
+        font = self.fonts.get(key)
+        if font is None:
+            font = pygame.font.SysFont(family, size, bold=bold)
+            self.fonts[key] = font
+        return font
+
+    def warm(self, specs):
+        """Pré-carrega uma lista de (família, tamanho, negrito)."""
+        for family, size, bold in specs:
+            self.get(family, size, bold)
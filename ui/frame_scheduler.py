@@ -0,0 +1,31 @@
+import pygame
+
+
+class FrameScheduler:
+    """Decide quanto tempo esperar entre um frame e outro.
+
+    Com animação (timer, cursor piscando, fade) roda no limite de FPS.
+    Sem nada animando, dorme em pygame.event.wait até chegar um evento,
+    vencer o próximo timer ou estourar o idle_timeout, em vez de redesenhar
+    a tela 60 vezes por segundo.
+    """
+
+    def __init__(self, fps, idle_timeout_ms=500):
+        self.fps = fps  # 0 = sem limite
+        self.idle_timeout_ms = idle_timeout_ms
+        self.clock = pygame.time.Clock()
+
+    def next_events(self, animating, until_next_timer=None):
+        """until_next_timer: segundos até o próximo timer (None = nenhum)."""
+        if animating:
+            self.clock.tick(self.fps)
+            return pygame.event.get()
+
+        self.clock.tick()  # só para manter get_fps/get_time coerentes
+        timeout = self.idle_timeout_ms
+        if until_next_timer is not None:
+            timeout = min(timeout, int(until_next_timer * 1000) + 1)
+        event = pygame.event.wait(timeout)
+        events = [] if event.type == pygame.NOEVENT else [event]
+        events.extend(pygame.event.get())
+        return events
@@ -0,0 +1,85 @@
+import pygame
+
+# Letras maiúsculas que aparecem na roleta e nas respostas
+DEFAULT_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZÁÀÂÃÉÊÍÓÔÕÚÜÇ"
+
+
+class GlyphAtlas:
+    """Todos os glifos de uma (fonte, cor) rasterizados numa única superfície.
+
+    Um texto é desenhado blitando os sub-retângulos de cada letra, sem
+    chamar font.render. Letras fora do conjunto inicial são adicionadas ao
+    atlas na primeira vez que aparecem.
+    """
+
+    def __init__(self, font, color, chars=DEFAULT_CHARS):
+        self.font = font
+        self.color = color
+        self.glyphs = {}  # letra -> Rect dentro do atlas
+        self.surface = None
+        self._build(chars)
+
+    def _build(self, chars):
+        chars = "".join(dict.fromkeys("".join(self.glyphs) + chars))
+        ascent = self.font.get_ascent()
+
+        rendered = []
+        for ch in chars:
+            glyph = self.font.render(ch, True, self.color)
+            # Acentos (Ã, À...) passam do ascent e o render cresce para cima;
+            # guarda quanto cresceu para alinhar todas as letras na mesma linha de base
+            metrics = self.font.metrics(ch)[0]
+            overflow = max(0, metrics[3] - ascent) if metrics else 0
+            rendered.append((ch, glyph, overflow))
+
+        top = max(overflow for _, _, overflow in rendered)
+        width = sum(glyph.get_width() for _, glyph, _ in rendered)
+        self.height = max(top + self.font.get_height(),
+                          max(top - overflow + glyph.get_height() for _, glyph, overflow in rendered))
+        self.baseline_offset = top
+        self.surface = pygame.Surface((max(1, width), self.height), pygame.SRCALPHA)
+        self.glyphs = {}
+
+        x = 0
+        for ch, glyph, overflow in rendered:
+            # ADD sobre o atlas zerado copia os pixels (e o alpha) sem misturar
+            self.surface.blit(glyph, (x, top - overflow), special_flags=pygame.BLEND_RGBA_ADD)
+            self.glyphs[ch] = pygame.Rect(x, 0, glyph.get_width(), self.height)
+            x += glyph.get_width()
+
+    def _ensure(self, text):
+        missing = [ch for ch in text if ch not in self.glyphs]
+        if missing:
+            self._build("".join(missing))
+
+    def size(self, text):
+        """Tamanho do texto como font.render o daria (sem a folga dos acentos)."""
+        self._ensure(text)
+        return sum(self.glyphs[ch].width for ch in text), self.font.get_height()
+
+    def draw(self, surface, text, pos):
+        """Desenha o texto na mesma posição que font.render em pos; retorna o Rect ocupado.
+
+        Acentos que passam do ascent ficam acima de pos, como no render.
+        """
+        self._ensure(text)
+        x, y = pos[0], pos[1] - self.baseline_offset
+        start_x = x
+        for ch in text:
+            area = self.glyphs[ch]
+            surface.blit(self.surface, (x, y), area)
+            x += area.width
+        return pygame.Rect(start_x, y, x - start_x, self.height)
+
+
+class GlyphAtlasCache:
+    def __init__(self):
+        self.atlases = {}
+
+    def get(self, font, color):
+        key = (font, tuple(color))
+        atlas = self.atlases.get(key)
+        if atlas is None:
+            atlas = GlyphAtlas(font, color)
+            self.atlases[key] = atlas
+        return atlas
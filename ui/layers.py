@@ -0,0 +1,73 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class LayerCache:
+    """Camadas estáticas pré-compostas, uma por (estado, conteúdo).
+
+    Cada camada é uma superfície do tamanho da tela com o fundo e tudo o
+    que não muda enquanto a chave for a mesma (títulos, painéis, lista de
+    temas, grade de letras...). Só é recomposta quando a chave muda.
+    """
+
+    def __init__(self, size, max_layers=6):
+        self.size = size
+        self.max_layers = max_layers
+        self.layers = OrderedDict()
+
+    def get(self, key, compose):
+        layer = self.layers.get(key)
+        if layer is not None:
+            self.layers.move_to_end(key)
+            return layer
+
+        layer = pygame.Surface(self.size).convert()
+        compose(layer)
+        self.layers[key] = layer
+        if len(self.layers) > self.max_layers:
+            self.layers.popitem(last=False)
+        return layer
+
+    def clear(self):
+        self.layers.clear()
+
+
+class DirtyRects:
+    """Guarda as regiões desenhadas por cima da camada estática.
+
+    A cada frame as regiões do frame anterior são restauradas a partir da
+    camada e só a união (anterior + atual) é enviada para a tela.
+    """
+
+    def __init__(self):
+        self.current = []
+        self.previous = []
+        self.layer = None
+        self.full = True
+
+    def add(self, rect):
+        if rect:
+            self.current.append(pygame.Rect(rect))
+        return rect
+
+    def begin(self, screen, layer):
+        if layer is not self.layer:
+            # Camada nova (mudou o estado ou o conteúdo): redesenha tudo
+            screen.blit(layer, (0, 0))
+            self.layer = layer
+            self.full = True
+        else:
+            for rect in self.previous:
+                screen.blit(layer, rect, rect)
+
+    def present(self, viewport, canvas):
+        """Manda para a janela (via Viewport) a tela inteira ou só as regiões sujas."""
+        viewport.present(canvas, self.layer, self.full, self.previous, self.current)
+
+        self.previous = self.current
+        self.current = []
+        self.full = False
+
+    def invalidate(self):
+        self.layer = None
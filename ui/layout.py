@@ -0,0 +1,109 @@
+from collections import OrderedDict
+
+import pygame
+
+BUCKET_SIZE = 64  # lado (px) das regiões do mapa de cliques
+
+
+class Grid:
+    """Itens numa grade regular (ex.: as letras da roleta).
+
+    index_at descobre a célula com duas divisões, sem percorrer os itens,
+    e confirma que o ponto cai no retângulo do item (não no espaço entre eles).
+    """
+
+    def __init__(self, origin, pitch, columns, item_rects):
+        self.origin = origin
+        self.pitch = pitch
+        self.columns = columns
+        self.item_rects = item_rects  # um Rect por item, na ordem da grade
+
+    def index_at(self, pos):
+        col = (pos[0] - self.origin[0]) // self.pitch[0]
+        row = (pos[1] - self.origin[1]) // self.pitch[1]
+        if col < 0 or row < 0 or col >= self.columns:
+            return None
+        index = row * self.columns + col
+        if index >= len(self.item_rects) or not self.item_rects[index].collidepoint(pos):
+            return None
+        return index
+
+
+class HitMap:
+    """Widgets clicáveis indexados por região da tela.
+
+    Cada retângulo é registrado nas regiões de BUCKET_SIZE px que ele
+    cobre; um clique só testa os widgets da região dele.
+    """
+
+    def __init__(self):
+        self.buckets = {}
+
+    def add(self, rect, widget):
+        left, top = rect.left // BUCKET_SIZE, rect.top // BUCKET_SIZE
+        right, bottom = (rect.right - 1) // BUCKET_SIZE, (rect.bottom - 1) // BUCKET_SIZE
+        for bx in range(left, right + 1):
+            for by in range(top, bottom + 1):
+                self.buckets.setdefault((bx, by), []).append((rect, widget))
+
+    def at(self, pos):
+        for rect, widget in self.buckets.get((pos[0] // BUCKET_SIZE, pos[1] // BUCKET_SIZE), ()):
+            if rect.collidepoint(pos):
+                return widget
+        return None
+
+
+class Layout:
+    """Geometria dos widgets de uma tela: usada para desenhar e para os cliques."""
+
+    def __init__(self):
+        self.rects = {}  # widget -> Rect
+        self.grids = {}  # nome -> Grid; widgets (nome, índice)
+        self.hit_map = HitMap()
+
+    def add(self, widget, rect):
+        rect = pygame.Rect(rect)
+        self.rects[widget] = rect
+        self.hit_map.add(rect, widget)
+        return rect
+
+    def add_grid(self, name, grid):
+        self.grids[name] = grid
+        return grid
+
+    def rect(self, widget):
+        return self.rects[widget]
+
+    def hit(self, pos):
+        """Widget no ponto: (nome, índice) de uma grade, o id passado em add, ou None."""
+        for name, grid in self.grids.items():
+            index = grid.index_at(pos)
+            if index is not None:
+                return name, index
+        return self.hit_map.at(pos)
+
+
+class LayoutCache:
+    """Layouts calculados uma vez por chave (estado, tamanho da tela, conteúdo)."""
+
+    def __init__(self, max_layouts=8):
+        self.max_layouts = max_layouts
+        self.layouts = OrderedDict()
+        self.builds = 0
+
+    def get(self, key, build):
+        layout = self.layouts.get(key)
+        if layout is not None:
+            self.layouts.move_to_end(key)
+            return layout
+
+        layout = Layout()
+        build(layout)
+        self.builds += 1
+        self.layouts[key] = layout
+        if len(self.layouts) > self.max_layouts:
+            self.layouts.popitem(last=False)
+        return layout
+
+    def clear(self):
+        self.layouts.clear()
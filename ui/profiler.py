@@ -0,0 +1,166 @@
+import csv
+import json
+import time
+from collections import defaultdict, deque
+
+import pygame
+
+from util import percentile
+
+PHASES = ("wait", "events", "update", "draw", "present")
+
+
+class FrameProfiler:
+    """Mede quanto cada fase de Game.run leva, por estado.
+
+    Fases: wait (dormindo no FrameScheduler), events (handle_events),
+    update (timers/validação), draw (compose/draw_*) e present
+    (display.update/flip). O tempo de "wait" não conta como trabalho.
+    """
+
+    def __init__(self, window=300, long_frame_ms=25, trace_path=None):
+        self.window = window
+        self.long_frame_ms = long_frame_ms
+
+        # estado -> deque com o tempo total de trabalho dos últimos frames (ms)
+        self.frames = defaultdict(lambda: deque(maxlen=self.window))
+        # (estado, fase) -> deque de tempos (ms)
+        self.phases = defaultdict(lambda: deque(maxlen=self.window))
+
+        self.current = {}
+        self.last_mark = 0.0
+        self.frame_start = 0.0
+        self.frame_count = 0
+        self.long_frames = 0
+        self.last_long_frame = None
+
+        self.trace_file = None
+        self.trace_writer = None
+        if trace_path:
+            self.open_trace(trace_path)
+
+    def open_trace(self, path):
+        self.trace_file = open(path, "w", newline="", encoding="utf-8")
+        if path.endswith(".csv"):
+            self.trace_writer = csv.writer(self.trace_file)
+            self.trace_writer.writerow(["frame", "time", "state", *PHASES, "total_ms", "long", "slowest_phase"])
+
+    def begin_frame(self):
+        self.frame_start = self.last_mark = time.perf_counter()
+        self.current = dict.fromkeys(PHASES, 0.0)
+
+    def mark(self, phase):
+        """Fecha a fase atual: soma o tempo desde a última marcação."""
+        now = time.perf_counter()
+        self.current[phase] += (now - self.last_mark) * 1000
+        self.last_mark = now
+
+    def end_frame(self, state):
+        self.frame_count += 1
+        work = sum(ms for phase, ms in self.current.items() if phase != "wait")
+        self.frames[state].append(work)
+        for phase, ms in self.current.items():
+            self.phases[(state, phase)].append(ms)
+
+        slowest = max((p for p in PHASES if p != "wait"), key=self.current.get)
+        is_long = work > self.long_frame_ms
+        if is_long:
+            self.long_frames += 1
+            self.last_long_frame = (state, slowest, work)
+            print(f"Frame longo: {work:.1f}ms em '{state}' (fase mais lenta: {slowest}, "
+                  f"{self.current[slowest]:.1f}ms)")
+
+        if self.trace_file is not None:
+            self.write_trace(state, work, is_long, slowest)
+
+    def write_trace(self, state, work, is_long, slowest):
+        if self.trace_writer is not None:
+            self.trace_writer.writerow([
+                self.frame_count, f"{self.frame_start:.6f}", state,
+                *(f"{self.current[p]:.3f}" for p in PHASES), f"{work:.3f}", int(is_long), slowest,
+            ])
+        else:
+            record = {
+                "frame": self.frame_count,
+                "time": self.frame_start,
+                "state": state,
+                "phases": {p: round(self.current[p], 3) for p in PHASES},
+                "total_ms": round(work, 3),
+                "long": is_long,
+            }
+            if is_long:
+                record["slowest_phase"] = slowest
+            self.trace_file.write(json.dumps(record) + "\n")
+
+    def summary(self, state):
+        """p50/p95/p99 do frame e p95 de cada fase para um estado."""
+        frames = sorted(self.frames[state])
+        result = {
+            "frames": len(frames),
+            "p50": percentile(frames, 50),
+            "p95": percentile(frames, 95),
+            "p99": percentile(frames, 99),
+        }
+        for phase in PHASES:
+            result[f"{phase}_p95"] = percentile(sorted(self.phases[(state, phase)]), 95)
+        return result
+
+    def report(self):
+        return {state: self.summary(state) for state in self.frames}
+
+    def close(self):
+        if self.trace_file is not None:
+            self.trace_file.close()
+            self.trace_file = None
+
+
+class ProfilerOverlay:
+    """Painel com as estatísticas do estado atual (liga/desliga com F3)."""
+
+    def __init__(self, profiler, font, refresh_ms=500):
+        self.profiler = profiler
+        self.font = font
+        self.refresh_ms = refresh_ms
+        self.visible = False
+        self.surface = None
+        self.last_refresh = 0
+        self.last_state = None
+
+    def toggle(self):
+        self.visible = not self.visible
+        self.surface = None
+
+    def draw(self, screen, state, fps):
+        if not self.visible:
+            return None
+
+        now = pygame.time.get_ticks()
+        if self.surface is None or state != self.last_state or now - self.last_refresh >= self.refresh_ms:
+            self.surface = self.build(state, fps)
+            self.last_refresh = now
+            self.last_state = state
+        return screen.blit(self.surface, (10, 10))
+
+    def build(self, state, fps):
+        s = self.profiler.summary(state)
+        lines = [
+            f"{state}  {fps:.0f} fps",
+            f"frame p50 {s['p50']:.1f}  p95 {s['p95']:.1f}  p99 {s['p99']:.1f} ms",
+            "p95 " + "  ".join(f"{p} {s[p + '_p95']:.1f}" for p in PHASES if p != "wait"),
+            f"frames longos: {self.profiler.long_frames}",
+        ]
+        if self.profiler.last_long_frame:
+            long_state, phase, ms = self.profiler.last_long_frame
+            lines.append(f"último: {ms:.1f}ms em {long_state} ({phase})")
+
+        rendered = [self.font.render(line, True, (255, 255, 255)) for line in lines]
+        width = max(r.get_width() for r in rendered) + 16
+        height = sum(r.get_height() for r in rendered) + 12
+
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+        y = 6
+        for r in rendered:
+            panel.blit(r, (8, y))
+            y += r.get_height()
+        return panel
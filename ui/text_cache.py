@@ -0,0 +1,44 @@
+from collections import OrderedDict
+
+
+class TextCache:
+    """Cache LRU de superfícies de texto já renderizadas.
+
+    A chave é (fonte, texto, antialias, cor): quando o placar ou a letra
+    destacada mudam, a chave muda junto e o texto novo é renderizado; as
+    entradas antigas saem por LRU.
+    """
+
+    def __init__(self, max_size=512):
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color):
+        """Mesma assinatura de font.render, com o font na frente.
+
+        A superfície devolvida é compartilhada: não altere (set_alpha etc.).
+        """
+        key = (font, text, antialias, tuple(color))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self.surfaces),
+            "hit_rate": self.hits / total if total else 0.0,
+        }
@@ -0,0 +1,104 @@
+import math
+
+EASING_STEPS = 256  # pontos por tabela; mais que o suficiente para 1s a 144 FPS
+
+
+def _out_back(t):
+    c = 1.70158
+    return 1 + (c + 1) * (t - 1) ** 3 + c * (t - 1) ** 2
+
+
+EASING_FUNCTIONS = {
+    "linear": lambda t: t,
+    "in_quad": lambda t: t * t,
+    "out_quad": lambda t: 1 - (1 - t) ** 2,
+    "in_out_quad": lambda t: 2 * t * t if t < 0.5 else 1 - (-2 * t + 2) ** 2 / 2,
+    "out_cubic": lambda t: 1 - (1 - t) ** 3,
+    "in_out_sine": lambda t: -(math.cos(math.pi * t) - 1) / 2,
+    "out_back": _out_back,
+}
+
+# Curvas pré-calculadas: durante a animação cada valor é só uma consulta na tabela
+EASING_TABLES = {
+    name: tuple(fn(i / (EASING_STEPS - 1)) for i in range(EASING_STEPS))
+    for name, fn in EASING_FUNCTIONS.items()
+}
+
+
+def ease(name, t):
+    """Valor da curva `name` em t (0..1), pela tabela."""
+    if t <= 0:
+        return EASING_TABLES[name][0]
+    if t >= 1:
+        return EASING_TABLES[name][-1]
+    return EASING_TABLES[name][int(t * (EASING_STEPS - 1) + 0.5)]
+
+
+class Tween:
+    """Vai de start a end em `duration` segundos, pelo relógio (não por frame).
+
+    repeat: quantas vezes repete depois da primeira (-1 = para sempre).
+    yoyo: nas repetições, alterna ida e volta.
+    """
+
+    def __init__(self, start, end, duration, started_at, easing="linear", delay=0.0, repeat=0, yoyo=False):
+        self.start = start
+        self.end = end
+        self.duration = duration
+        self.started_at = started_at + delay
+        self.easing = easing
+        self.repeat = repeat
+        self.yoyo = yoyo
+
+    def finished(self, now):
+        return self.repeat >= 0 and now - self.started_at >= self.duration * (self.repeat + 1)
+
+    def value(self, now):
+        elapsed = now - self.started_at
+        if elapsed <= 0:
+            return self.start
+        cycle, progress = divmod(elapsed / self.duration, 1.0)
+        if self.repeat >= 0 and cycle > self.repeat:
+            cycle, progress = self.repeat, 1.0
+        if self.yoyo and int(cycle) % 2 == 1:
+            progress = 1.0 - progress
+        return self.start + (self.end - self.start) * ease(self.easing, progress)
+
+
+class Tweens:
+    """Animações em andamento, por nome.
+
+    O jogo só precisa redesenhar enquanto active() for verdadeiro; depois
+    disso a tela volta a esperar eventos.
+    """
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.running = {}
+
+    def start(self, name, start, end, duration, **options):
+        """Começa (ou reinicia) a animação `name`."""
+        tween = Tween(start, end, duration, self.clock(), **options)
+        self.running[name] = tween
+        return tween
+
+    def stop(self, name):
+        self.running.pop(name, None)
+
+    def value(self, name, default=None):
+        tween = self.running.get(name)
+        if tween is None:
+            return default
+        return tween.value(self.clock())
+
+    def is_running(self, name):
+        tween = self.running.get(name)
+        return tween is not None and not tween.finished(self.clock())
+
+    def active(self):
+        if not self.running:
+            return False
+        now = self.clock()
+        for name in [name for name, tween in self.running.items() if tween.finished(now)]:
+            del self.running[name]
+        return bool(self.running)
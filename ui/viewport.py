@@ -0,0 +1,112 @@
+import math
+from collections import OrderedDict
+
+import pygame
+
+
+class Viewport:
+    """Leva o canvas lógico para uma janela de qualquer tamanho.
+
+    O jogo desenha sempre no canvas (config.SCREEN_WIDTH x SCREEN_HEIGHT),
+    em coordenadas lógicas. Na janela o canvas aparece escalado pelo maior
+    fator que cabe, centralizado, com faixas pretas nas sobras.
+
+    A camada estática de cada estado (fundo, retratos, textos fixos) é
+    escalada uma vez por tamanho de saída e guardada; por frame só as
+    regiões sujas do canvas são escaladas. Um resize descarta o cache.
+    Com a janela no tamanho lógico nada é escalado, só copiado.
+    """
+
+    def __init__(self, logical_size, window, max_layers=6):
+        self.logical_size = logical_size
+        self.max_layers = max_layers
+        self.scaled_layers = OrderedDict()  # id(camada) -> (camada, camada escalada)
+        self.rescales = 0
+        self.resize(window)
+
+    def resize(self, window):
+        self.window = window
+        width, height = window.get_size()
+        self.scale = min(width / self.logical_size[0], height / self.logical_size[1])
+        size = (round(self.logical_size[0] * self.scale), round(self.logical_size[1] * self.scale))
+        self.rect = pygame.Rect((0, 0), size)
+        self.rect.center = (width // 2, height // 2)
+        self.identity = size == tuple(self.logical_size)
+        self.scaled_layers.clear()
+
+    def to_logical(self, pos):
+        """Posição na janela (mouse) -> posição no canvas."""
+        return (
+            math.floor((pos[0] - self.rect.x) / self.scale),
+            math.floor((pos[1] - self.rect.y) / self.scale),
+        )
+
+    def to_window(self, rect):
+        """Retângulo do canvas -> retângulo que ele cobre na janela (arredondado para fora)."""
+        left = math.floor(rect.left * self.scale)
+        top = math.floor(rect.top * self.scale)
+        right = math.ceil(rect.right * self.scale)
+        bottom = math.ceil(rect.bottom * self.scale)
+        return pygame.Rect(self.rect.x + left, self.rect.y + top, right - left, bottom - top)
+
+    def scaled_layer(self, layer):
+        entry = self.scaled_layers.get(id(layer))
+        if entry is not None and entry[0] is layer:
+            self.scaled_layers.move_to_end(id(layer))
+            return entry[1]
+
+        scaled = pygame.transform.smoothscale(layer, self.rect.size)
+        self.rescales += 1
+        # Guarda a camada junto, para o id não ser reaproveitado por outra
+        self.scaled_layers[id(layer)] = (layer, scaled)
+        if len(self.scaled_layers) > self.max_layers:
+            self.scaled_layers.popitem(last=False)
+        return scaled
+
+    def present_all(self, canvas):
+        """Manda o canvas inteiro, sem camada guardada (ex.: tela de carregamento)."""
+        self.window.fill((0, 0, 0))
+        if self.identity:
+            self.window.blit(canvas, self.rect)
+        else:
+            self.window.blit(pygame.transform.smoothscale(canvas, self.rect.size), self.rect)
+        pygame.display.flip()
+
+    def present(self, canvas, layer, full, restored, drawn):
+        """Copia o frame do canvas para a janela e atualiza a tela.
+
+        full: a camada mudou (manda a janela inteira).
+        restored: regiões do frame anterior, que voltaram a ser só camada.
+        drawn: regiões desenhadas neste frame.
+        """
+        if self.identity:
+            if full:
+                self.window.fill((0, 0, 0))
+                self.window.blit(canvas, self.rect)
+                pygame.display.flip()
+            elif restored or drawn:
+                rects = [self.window.blit(canvas, rect.move(self.rect.topleft), rect) for rect in restored + drawn]
+                pygame.display.update(rects)
+            return
+
+        canvas_rect = canvas.get_rect()
+        scaled = self.scaled_layer(layer)
+        if full:
+            self.window.fill((0, 0, 0))
+            self.window.blit(scaled, self.rect)
+        for rect in restored:
+            target = self.to_window(rect)
+            self.window.blit(scaled, target, target.move(-self.rect.x, -self.rect.y))
+        updates = [self.to_window(rect) for rect in restored]
+        for rect in drawn:
+            rect = rect.clip(canvas_rect)
+            if not rect:
+                continue
+            target = self.to_window(rect)
+            self.window.blit(pygame.transform.smoothscale(canvas.subsurface(rect), target.size), target)
+            updates.append(target)
+
+        if full:
+            pygame.display.flip()
+        elif updates:
+            pygame.display.update(updates)
@@ -0,0 +1,146 @@
+import html
+import secrets
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pygame
+
+# Evento postado na fila do pygame a cada voto recebido (atributos: seat, approve)
+VOTE_EVENT = pygame.USEREVENT + 2
+
+PAGE = """<!doctype html>
+<html lang="pt-br"><head><meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Votação</title>
+<style>
+body {{ font-family: sans-serif; background: #111; color: #fff; text-align: center; }}
+form {{ display: inline; }}
+button {{ width: 40%; padding: 1em 0; margin: .3em; font-size: 1.5em;
+          color: #fff; border: 0; border-radius: 8px; }}
+.sim {{ background: #0a0; }} .nao {{ background: #c00; }}
+</style></head><body>
+<h1>{status}</h1>
+{content}
+</body></html>
+"""
+
+VOTE_FORM = """<form method="post" action="/votar">
+<input type="hidden" name="codigo" value="{token}"><input type="hidden" name="voto" value="{value}">
+<button class="{css}">{label}</button></form>"""
+
+
+class VoteBridge:
+    """Recebe votos pelo celular, numa página servida na rede local.
+
+    Cada jogador tem um código sorteado a cada partida, mostrado na tela
+    ao lado do nome dele, e abre http://<ip-do-computador>:<porta>/j/<código>.
+    Só essa página tem os botões de voto daquele jogador; o voto vai por
+    POST com o código, então quem não viu a tela (ou um prefetch de link)
+    não vota por ninguém. O voto vira um VOTE_EVENT na fila do pygame
+    (event.post pode ser chamado de outra thread), e o jogo trata igual a
+    um voto pelo teclado ou controle.
+    """
+
+    MAX_BODY = 1024
+
+    def __init__(self, host, port):
+        self.players = []  # nomes, atualizados pelo jogo (set_players)
+        self.tokens = {}  # código -> assento
+        self.voting_word = None
+        bridge = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = urlparse(self.path).path
+                if path == "/":
+                    self.send_page(bridge.page())
+                elif path.startswith("/j/") and path[3:] in bridge.tokens:
+                    self.send_page(bridge.page(path[3:]))
+                else:
+                    self.send_error(404)
+
+            def do_POST(self):
+                if urlparse(self.path).path != "/votar":
+                    self.send_error(404)
+                    return
+                try:
+                    size = int(self.headers.get("Content-Length", 0))
+                except ValueError:
+                    size = 0
+                if not 0 < size <= bridge.MAX_BODY:
+                    self.send_error(400)
+                    return
+                query = parse_qs(self.rfile.read(size).decode("utf-8", "replace"))
+                token = bridge.receive(query)
+                if token is None:
+                    self.send_error(403)
+                    return
+                self.send_response(303)
+                self.send_header("Location", f"/j/{token}")
+                self.end_headers()
+
+            def send_page(self, page):
+                body = page.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # sem log por requisição no console do jogo
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, name="votacao", daemon=True)
+
+    def start(self):
+        self.thread.start()
+        host, port = self.server.server_address[:2]
+        print(f"Votação pelo celular em http://{host}:{port}/j/<código do jogador>")
+
+    def set_players(self, names):
+        """Nomes dos jogadores; um código novo por assento quando a partida muda."""
+        if names == self.players:
+            return
+        self.players = list(names)
+        self.tokens = {secrets.token_hex(3): seat for seat in range(len(names))}
+
+    def token(self, seat):
+        for token, token_seat in self.tokens.items():
+            if token_seat == seat:
+                return token
+        return None
+
+    def receive(self, query):
+        """Posta o voto do dono do código. Retorna o código, ou None se não valer."""
+        try:
+            token = query["codigo"][0]
+            approve = query["voto"][0] == "1"
+        except (KeyError, IndexError):
+            return None
+        seat = self.tokens.get(token)
+        if seat is None:
+            return None
+        pygame.event.post(pygame.event.Event(VOTE_EVENT, seat=seat, approve=approve))
+        return token
+
+    def page(self, token=None):
+        if self.voting_word:
+            status = f"A palavra foi: {html.escape(self.voting_word)}"
+        else:
+            status = "Nenhuma votação no momento"
+        seat = self.tokens.get(token)
+        if seat is None:
+            content = "<p>Abra o endereço /j/&lt;código&gt; com o código que aparece ao lado do seu nome.</p>"
+        else:
+            content = (
+                f"<h2>{html.escape(self.players[seat])}</h2>"
+                + VOTE_FORM.format(token=token, value=1, css="sim", label="SIM")
+                + VOTE_FORM.format(token=token, value=0, css="nao", label="NÃO")
+            )
+        return PAGE.format(status=status, content=content)
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
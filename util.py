@@ -0,0 +1,8 @@
+"""Funções pequenas usadas pelo jogo, pelo servidor e pelas ferramentas (sem pygame)."""
+
+
+def percentile(sorted_values, p):
+    """Percentil p (0-100) pelo posto mais próximo; a lista já vem ordenada. Vazia: 0.0."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * p / 100))]